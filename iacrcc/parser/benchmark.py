@@ -0,0 +1,347 @@
+"""
+Benchmarks for the .meta parser. These are not run as part of the tests. Run them
+from the iacrcc directory with
+
+  python -m parser.benchmark [--repeat N] [name ...]
+
+Each benchmark reports a measurement, usually the average wall clock time per
+iteration, for one or more variants so that the effect of a change can be compared
+on the same machine.
+
+The throughput suite measures files/sec, microseconds per field and peak memory for
+a fixed set of inputs. Its results can be saved as JSON and compared with the results
+from another commit:
+
+  python -m parser.benchmark --suite --json before.json
+  python -m parser.benchmark --suite --compare before.json
+"""
+
+import argparse
+import copy
+import datetime
+import json
+from pathlib import Path
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from nameparser import HumanName
+from pylatexenc.latex2text import LatexNodes2Text
+from .meta_parse import _iter_blocks, _scan_blocks
+from .meta_parse import get_decoder, get_shared_decoder, parse_meta, CachedDecoder, LatexToText, split_name, reparse_meta
+from .meta_model import Meta
+from .name_index import build_name_index, Organization
+from .funder_index import FunderIndex
+from .testdata.eprint_titles import EPRINT_TITLES
+
+TESTDATA = Path(__file__).parent / 'testdata'
+
+_COUNTRIES = ['Belgium', 'United States', 'Germany', 'Japan', 'Switzerland', 'Brazil', 'India']
+
+def synthetic_meta(seed, num_authors=4, num_affiliations=3):
+    """Return the text of a plausible .meta file. The seed varies names and titles, while
+       affiliation and country names repeat across papers as they do in practice."""
+    lines = ['schema: 0.9',
+             r'title: On the security of $\protect \mathbb  {F}_{2^n}$ variant ' + str(seed),
+             'subtitle: Part {}'.format(seed % 5)]
+    for i in range(num_authors):
+        lines.extend(['author:',
+                      r'  name: Tancr{\`e}de Lepoint' + str(seed * num_authors + i),
+                      '  orcid: 0000-0003-1010-8157',
+                      '  inst: {}'.format(1 + i % num_affiliations),
+                      '  email: author{}@example.com'.format(i)])
+    for i in range(num_affiliations):
+        j = (seed + i) % 20
+        lines.extend(['affiliation:',
+                      '  name: University number {}'.format(j),
+                      '  city: City {}'.format(j),
+                      '  country: ' + _COUNTRIES[j % len(_COUNTRIES)]])
+    lines.extend(['funding:',
+                  '  name: Horizon 2020 Framework Programme',
+                  '  country: Belgium',
+                  'keywords: Metadata, publishing, LaTeX',
+                  'license: CC-BY-4.0'])
+    return '\n'.join(lines) + '\n'
+
+def _time_per_call(func, repeat):
+    """Return the average number of seconds for func() over repeat calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def _timed(variant, func, repeat):
+    """Return a result row with the time per call in microseconds."""
+    return (variant, _time_per_call(func, repeat) * 1e6, 'us')
+
+def bench_decoder_reuse(repeat):
+    """Per-file cost of parse_meta with a decoder built for every file vs. a shared one."""
+    metastr = (TESTDATA / 'metadoc.meta').read_text(encoding='UTF-8')
+    get_shared_decoder() # build it outside the timing loop.
+    return [_timed('decoder rebuilt per file', lambda: parse_meta(metastr, decoder=get_decoder()), repeat),
+            _timed('shared decoder', lambda: parse_meta(metastr), repeat)]
+
+def bench_decoder_cache(repeat):
+    """Re-parsing the same file with and without the latex_to_text cache."""
+    metastr = (TESTDATA / 'metadoc.meta').read_text(encoding='UTF-8')
+    uncached = get_shared_decoder(cached=False)
+    cached = CachedDecoder(uncached)
+    return [_timed('uncached', lambda: parse_meta(metastr, decoder=uncached), repeat),
+            _timed('cached', lambda: parse_meta(metastr, decoder=cached), repeat)]
+
+class _FullWalkDecoder(LatexToText):
+    """LatexToText without the shortcut for plain text."""
+    def latex_to_text(self, v):
+        return LatexNodes2Text.latex_to_text(self, self._preclean(v))
+
+def bench_plain_text(repeat):
+    """parse_meta with and without the shortcut that skips pylatexenc for plain text."""
+    metastr = (TESTDATA / 'metadoc.meta').read_text(encoding='UTF-8')
+    fast = get_shared_decoder(cached=False)
+    full = _FullWalkDecoder(math_mode='with-delimiters',
+                            strict_latex_spaces=True,
+                            keep_braced_groups=True,
+                            keep_comments=False,
+                            latex_context=fast.latex_context)
+    return [_timed('full node walk', lambda: parse_meta(metastr, decoder=full), repeat),
+            _timed('plain text shortcut', lambda: parse_meta(metastr, decoder=fast), repeat)]
+
+def _retained_bytes(func):
+    """Return the bytes that are still allocated by the value that func() returns."""
+    tracemalloc.start()
+    try:
+        result = func()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+def bench_model_memory(repeat):
+    """Memory held by 10,000 parsed papers as dicts vs. slotted dataclasses. The corpus
+       is parsed once, and both representations share the same strings."""
+    corpus = [parse_meta(synthetic_meta(seed)) for seed in range(10000)]
+    as_dicts = _retained_bytes(lambda: copy.deepcopy(corpus))
+    as_models = _retained_bytes(lambda: [Meta.from_dict(data) for data in corpus])
+    return [('dicts from parse_meta', as_dicts / 2**20, 'MiB'),
+            ('Meta from parse_meta_model', as_models / 2**20, 'MiB')]
+
+def bench_name_split(repeat):
+    """Splitting the 30 author names of a paper with HumanName vs. split_name."""
+    names = ['Tancrède Lepoint{}'.format(i) for i in range(30)]
+    surnames = ['Lepoint{}'.format(i) for i in range(30)]
+    def uncached():
+        for name in names:
+            parsed = HumanName(name)
+            str(parsed), parsed.first, parsed.last
+    def heuristic():
+        split_name.cache_clear()
+        for name in names:
+            split_name(name)
+    def with_surname():
+        split_name.cache_clear()
+        for name, surname in zip(names, surnames):
+            split_name(name, surname)
+    def cached():
+        for name in names:
+            split_name(name)
+    results = [_timed('HumanName', uncached, repeat),
+               _timed('split_name, cold cache', heuristic, repeat),
+               _timed('split_name with surname, cold cache', with_surname, repeat)]
+    cached()
+    return results + [_timed('split_name, warm cache', cached, repeat)]
+
+def bench_scanner(repeat):
+    """Grouping lines into blocks with splitlines() vs. the single-pass scanner, on the
+       eprint titles that test23 writes and on a paper with 300 authors."""
+    titles = ''.join('title: {}\n'.format(title) for title in EPRINT_TITLES)
+    authors = synthetic_meta(0, num_authors=300)
+    results = []
+    for name, text in [('test23 titles', titles), ('300 authors', authors)]:
+        results.append(_timed(name + ', splitlines', lambda: list(_iter_blocks(text.splitlines())), repeat))
+        results.append(_timed(name + ', scanner', lambda: list(_scan_blocks(text)), repeat))
+    parse_meta(titles)
+    results.append(_timed('test23 titles, parse_meta with warm cache', lambda: parse_meta(titles), repeat))
+    return results
+
+def bench_reparse(repeat):
+    """Revalidating a paper with 30 authors and 30 affiliations after one author line
+       changed, with parse_meta vs. reparse_meta."""
+    old_text = synthetic_meta(0, num_authors=30, num_affiliations=30)
+    new_text = old_text.replace('  email: author7@', '  email: author.seven@')
+    old_data = parse_meta(old_text)
+    uncached = get_shared_decoder(cached=False)
+    parse_meta(new_text)
+    return [_timed('parse_meta, uncached decoder', lambda: parse_meta(new_text, decoder=uncached), repeat),
+            _timed('parse_meta, warm cache', lambda: parse_meta(new_text), repeat),
+            _timed('reparse_meta, uncached decoder',
+                   lambda: reparse_meta(old_data, old_text, new_text, decoder=uncached), repeat),
+            _timed('reparse_meta, warm cache', lambda: reparse_meta(old_data, old_text, new_text), repeat)]
+
+def _git_rev():
+    """Return the abbreviated commit of the working tree, or None outside of git."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              cwd=Path(__file__).parent,
+                              capture_output=True,
+                              text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _peak_bytes(func):
+    """Return the peak number of bytes allocated during func()."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _num_fields(metastr):
+    """The number of non-blank lines in a .meta file."""
+    return sum(1 for line in metastr.splitlines() if line.strip())
+
+def suite_cases():
+    """Return a dict from name to (func, files, fields), where func() processes the
+       given number of files containing that many fields in total. parse_meta uses a
+       decoder without the cache, so that every call decodes the whole file."""
+    decoder = get_shared_decoder(cached=False)
+    cases = {}
+    for name, metastr in [('metadoc', (TESTDATA / 'metadoc.meta').read_text(encoding='UTF-8')),
+                          ('30 authors', synthetic_meta(0, num_authors=30, num_affiliations=30)),
+                          ('300 authors', synthetic_meta(0, num_authors=300, num_affiliations=30))]:
+        cases[name] = (lambda metastr=metastr: parse_meta(metastr, decoder=decoder),
+                       1,
+                       _num_fields(metastr))
+    titles = sorted(EPRINT_TITLES)
+    title_decoder = get_decoder()
+    def decode_titles():
+        for title in titles:
+            title_decoder.latex_to_text(title)
+    cases['eprint titles'] = (decode_titles, 1, len(titles))
+    return cases
+
+def run_suite(repeat):
+    """Run every case of suite_cases() and return the results as a dict that can be
+       saved as JSON."""
+    results = {}
+    for name, (func, files, fields) in suite_cases().items():
+        func() # warm up.
+        seconds = _time_per_call(func, repeat)
+        results[name] = {'files_per_sec': files / seconds,
+                         'us_per_field': seconds * 1e6 / fields,
+                         'peak_kib': _peak_bytes(func) / 1024,
+                         'fields': fields}
+    return {'git_rev': _git_rev(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'repeat': repeat,
+            'results': results}
+
+# The measurements of the suite and the direction in which they improve.
+SUITE_METRICS = [('files_per_sec', 'files/sec', 1),
+                 ('us_per_field', 'us/field', -1),
+                 ('peak_kib', 'peak KiB', -1)]
+
+def print_suite(report, baseline=None):
+    """Print the results of run_suite. If baseline is another report, the relative
+       change is shown, with a positive percentage meaning better."""
+    title = 'suite at {}'.format(report['git_rev'] or 'unknown commit')
+    if baseline is not None:
+        title += ' vs. {}'.format(baseline['git_rev'] or 'unknown commit')
+    print(title)
+    for name, result in report['results'].items():
+        old = None
+        if baseline is not None:
+            old = baseline['results'].get(name)
+        for metric, unit, direction in SUITE_METRICS:
+            line = '  {:<40} {:10.1f}'.format(name + ', ' + unit, result[metric])
+            if old is not None and old.get(metric):
+                change = direction * (result[metric] - old[metric]) / old[metric] * 100
+                line += ' {:+7.1f}%'.format(round(change, 1) + 0.0)
+            print(line)
+
+_FUNDER_WORDS = ['National', 'Science', 'Foundation', 'Research', 'Council', 'Agency', 'Institute', 'Health',
+                 'Energy', 'Ministry', 'Education', 'Technology', 'Fund', 'Trust', 'Programme', 'Society']
+
+def _synthetic_funders(count, rng):
+    """Yield count funders with names like those in the funder registry."""
+    for i in range(count):
+        place = ''.join(rng.choice('abcdefghiklmnoprstuvz') for _ in range(rng.randint(5, 10))).title()
+        name = '{} {} of {}'.format(*rng.sample(_FUNDER_WORDS, 2), place)
+        yield Organization(str(100000000 + i), name, None, True, [''.join(w[0] for w in name.split())])
+
+def bench_funder_lookup(repeat):
+    """Checking the funders of an issue of 25 papers, with three funders each, against a
+       synthetic registry of 30,000 funders. A third have a fundref, a third have the
+       registered name and the rest have a misspelled name."""
+    rng = random.Random(0)
+    funders = list(_synthetic_funders(30000, rng))
+    issue = []
+    for funder in rng.sample(funders, 75):
+        if len(issue) % 3 == 0:
+            issue.append({'name': funder.name, 'fundref': funder.id})
+        elif len(issue) % 3 == 1:
+            issue.append({'name': funder.name})
+        else:
+            issue.append({'name': funder.name.replace('of', 'for').lower()})
+    fundrefs = [funder['fundref'] for funder in issue if 'fundref' in funder]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        index_path = Path(tmpdir) / 'funders.db'
+        start = time.perf_counter()
+        build_name_index(index_path, funders, FunderIndex.kind)
+        results = [('build index', time.perf_counter() - start, 's')]
+        with FunderIndex(index_path) as index:
+            index.check_funders(issue) # warm the page cache.
+            results.append(_timed('check_funders for the issue', lambda: index.check_funders(issue), repeat))
+            results.append(_timed('exists for the 25 fundrefs', lambda: [index.exists(f) for f in fundrefs], repeat))
+    return results
+
+BENCHMARKS = {'decoder_reuse': bench_decoder_reuse,
+              'decoder_cache': bench_decoder_cache,
+              'plain_text': bench_plain_text,
+              'model_memory': bench_model_memory,
+              'name_split': bench_name_split,
+              'scanner': bench_scanner,
+              'reparse': bench_reparse,
+              'funder_lookup': bench_funder_lookup}
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Benchmarks for meta_parse')
+    argparser.add_argument('--repeat',
+                           type=int,
+                           default=200,
+                           help='number of iterations for each variant')
+    argparser.add_argument('--suite',
+                           action='store_true',
+                           help='run the throughput suite instead of the benchmarks')
+    argparser.add_argument('--json',
+                           help='with --suite, save the results to this file')
+    argparser.add_argument('--compare',
+                           help='with --suite, compare with results saved by --json')
+    argparser.add_argument('names',
+                           nargs='*',
+                           help='benchmarks to run from {} (default: all)'.format(', '.join(sorted(BENCHMARKS))))
+    args = argparser.parse_args()
+    if args.suite:
+        if args.names:
+            argparser.error('benchmark names cannot be used with --suite')
+        baseline = None
+        if args.compare:
+            baseline = json.loads(Path(args.compare).read_text(encoding='UTF-8'))
+        report = run_suite(args.repeat)
+        print_suite(report, baseline)
+        if args.json:
+            Path(args.json).write_text(json.dumps(report, indent=2) + '\n', encoding='UTF-8')
+        sys.exit(0)
+    if args.json or args.compare:
+        argparser.error('--json and --compare require --suite')
+    for name in args.names:
+        if name not in BENCHMARKS:
+            argparser.error('unknown benchmark ' + name)
+    for name in args.names or sorted(BENCHMARKS):
+        print(name)
+        for variant, value, unit in BENCHMARKS[name](args.repeat):
+            print('  {:<40} {:10.1f} {}'.format(variant, value, unit))
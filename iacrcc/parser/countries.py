@@ -0,0 +1,363 @@
+"""
+Normalization of country names to ISO 3166-1 alpha-2 codes. metacapture writes
+country: and sometimes countrycode:, while older papers only have free text such as
+"Turkey", "USA" or "Deutschland". country_code looks the name up in a table of the
+ISO names and common aliases, keyed by fold_country, so every lookup is a single
+dict access and there is no fuzzy matching.
+"""
+
+import functools
+import re
+import unicodedata
+
+# ISO 3166-1 alpha-2 codes with a short English name for each country.
+COUNTRIES = {
+    'AD': 'Andorra',
+    'AE': 'United Arab Emirates',
+    'AF': 'Afghanistan',
+    'AG': 'Antigua and Barbuda',
+    'AI': 'Anguilla',
+    'AL': 'Albania',
+    'AM': 'Armenia',
+    'AO': 'Angola',
+    'AQ': 'Antarctica',
+    'AR': 'Argentina',
+    'AS': 'American Samoa',
+    'AT': 'Austria',
+    'AU': 'Australia',
+    'AW': 'Aruba',
+    'AX': 'Åland Islands',
+    'AZ': 'Azerbaijan',
+    'BA': 'Bosnia and Herzegovina',
+    'BB': 'Barbados',
+    'BD': 'Bangladesh',
+    'BE': 'Belgium',
+    'BF': 'Burkina Faso',
+    'BG': 'Bulgaria',
+    'BH': 'Bahrain',
+    'BI': 'Burundi',
+    'BJ': 'Benin',
+    'BL': 'Saint Barthélemy',
+    'BM': 'Bermuda',
+    'BN': 'Brunei',
+    'BO': 'Bolivia',
+    'BQ': 'Caribbean Netherlands',
+    'BR': 'Brazil',
+    'BS': 'Bahamas',
+    'BT': 'Bhutan',
+    'BV': 'Bouvet Island',
+    'BW': 'Botswana',
+    'BY': 'Belarus',
+    'BZ': 'Belize',
+    'CA': 'Canada',
+    'CC': 'Cocos (Keeling) Islands',
+    'CD': 'Democratic Republic of the Congo',
+    'CF': 'Central African Republic',
+    'CG': 'Republic of the Congo',
+    'CH': 'Switzerland',
+    'CI': "Côte d'Ivoire",
+    'CK': 'Cook Islands',
+    'CL': 'Chile',
+    'CM': 'Cameroon',
+    'CN': 'China',
+    'CO': 'Colombia',
+    'CR': 'Costa Rica',
+    'CU': 'Cuba',
+    'CV': 'Cabo Verde',
+    'CW': 'Curaçao',
+    'CX': 'Christmas Island',
+    'CY': 'Cyprus',
+    'CZ': 'Czechia',
+    'DE': 'Germany',
+    'DJ': 'Djibouti',
+    'DK': 'Denmark',
+    'DM': 'Dominica',
+    'DO': 'Dominican Republic',
+    'DZ': 'Algeria',
+    'EC': 'Ecuador',
+    'EE': 'Estonia',
+    'EG': 'Egypt',
+    'EH': 'Western Sahara',
+    'ER': 'Eritrea',
+    'ES': 'Spain',
+    'ET': 'Ethiopia',
+    'FI': 'Finland',
+    'FJ': 'Fiji',
+    'FK': 'Falkland Islands',
+    'FM': 'Micronesia',
+    'FO': 'Faroe Islands',
+    'FR': 'France',
+    'GA': 'Gabon',
+    'GB': 'United Kingdom',
+    'GD': 'Grenada',
+    'GE': 'Georgia',
+    'GF': 'French Guiana',
+    'GG': 'Guernsey',
+    'GH': 'Ghana',
+    'GI': 'Gibraltar',
+    'GL': 'Greenland',
+    'GM': 'Gambia',
+    'GN': 'Guinea',
+    'GP': 'Guadeloupe',
+    'GQ': 'Equatorial Guinea',
+    'GR': 'Greece',
+    'GS': 'South Georgia and the South Sandwich Islands',
+    'GT': 'Guatemala',
+    'GU': 'Guam',
+    'GW': 'Guinea-Bissau',
+    'GY': 'Guyana',
+    'HK': 'Hong Kong',
+    'HM': 'Heard Island and McDonald Islands',
+    'HN': 'Honduras',
+    'HR': 'Croatia',
+    'HT': 'Haiti',
+    'HU': 'Hungary',
+    'ID': 'Indonesia',
+    'IE': 'Ireland',
+    'IL': 'Israel',
+    'IM': 'Isle of Man',
+    'IN': 'India',
+    'IO': 'British Indian Ocean Territory',
+    'IQ': 'Iraq',
+    'IR': 'Iran',
+    'IS': 'Iceland',
+    'IT': 'Italy',
+    'JE': 'Jersey',
+    'JM': 'Jamaica',
+    'JO': 'Jordan',
+    'JP': 'Japan',
+    'KE': 'Kenya',
+    'KG': 'Kyrgyzstan',
+    'KH': 'Cambodia',
+    'KI': 'Kiribati',
+    'KM': 'Comoros',
+    'KN': 'Saint Kitts and Nevis',
+    'KP': 'North Korea',
+    'KR': 'South Korea',
+    'KW': 'Kuwait',
+    'KY': 'Cayman Islands',
+    'KZ': 'Kazakhstan',
+    'LA': 'Laos',
+    'LB': 'Lebanon',
+    'LC': 'Saint Lucia',
+    'LI': 'Liechtenstein',
+    'LK': 'Sri Lanka',
+    'LR': 'Liberia',
+    'LS': 'Lesotho',
+    'LT': 'Lithuania',
+    'LU': 'Luxembourg',
+    'LV': 'Latvia',
+    'LY': 'Libya',
+    'MA': 'Morocco',
+    'MC': 'Monaco',
+    'MD': 'Moldova',
+    'ME': 'Montenegro',
+    'MF': 'Saint Martin',
+    'MG': 'Madagascar',
+    'MH': 'Marshall Islands',
+    'MK': 'North Macedonia',
+    'ML': 'Mali',
+    'MM': 'Myanmar',
+    'MN': 'Mongolia',
+    'MO': 'Macao',
+    'MP': 'Northern Mariana Islands',
+    'MQ': 'Martinique',
+    'MR': 'Mauritania',
+    'MS': 'Montserrat',
+    'MT': 'Malta',
+    'MU': 'Mauritius',
+    'MV': 'Maldives',
+    'MW': 'Malawi',
+    'MX': 'Mexico',
+    'MY': 'Malaysia',
+    'MZ': 'Mozambique',
+    'NA': 'Namibia',
+    'NC': 'New Caledonia',
+    'NE': 'Niger',
+    'NF': 'Norfolk Island',
+    'NG': 'Nigeria',
+    'NI': 'Nicaragua',
+    'NL': 'Netherlands',
+    'NO': 'Norway',
+    'NP': 'Nepal',
+    'NR': 'Nauru',
+    'NU': 'Niue',
+    'NZ': 'New Zealand',
+    'OM': 'Oman',
+    'PA': 'Panama',
+    'PE': 'Peru',
+    'PF': 'French Polynesia',
+    'PG': 'Papua New Guinea',
+    'PH': 'Philippines',
+    'PK': 'Pakistan',
+    'PL': 'Poland',
+    'PM': 'Saint Pierre and Miquelon',
+    'PN': 'Pitcairn',
+    'PR': 'Puerto Rico',
+    'PS': 'Palestine',
+    'PT': 'Portugal',
+    'PW': 'Palau',
+    'PY': 'Paraguay',
+    'QA': 'Qatar',
+    'RE': 'Réunion',
+    'RO': 'Romania',
+    'RS': 'Serbia',
+    'RU': 'Russia',
+    'RW': 'Rwanda',
+    'SA': 'Saudi Arabia',
+    'SB': 'Solomon Islands',
+    'SC': 'Seychelles',
+    'SD': 'Sudan',
+    'SE': 'Sweden',
+    'SG': 'Singapore',
+    'SH': 'Saint Helena, Ascension and Tristan da Cunha',
+    'SI': 'Slovenia',
+    'SJ': 'Svalbard and Jan Mayen',
+    'SK': 'Slovakia',
+    'SL': 'Sierra Leone',
+    'SM': 'San Marino',
+    'SN': 'Senegal',
+    'SO': 'Somalia',
+    'SR': 'Suriname',
+    'SS': 'South Sudan',
+    'ST': 'Sao Tome and Principe',
+    'SV': 'El Salvador',
+    'SX': 'Sint Maarten',
+    'SY': 'Syria',
+    'SZ': 'Eswatini',
+    'TC': 'Turks and Caicos Islands',
+    'TD': 'Chad',
+    'TF': 'French Southern Territories',
+    'TG': 'Togo',
+    'TH': 'Thailand',
+    'TJ': 'Tajikistan',
+    'TK': 'Tokelau',
+    'TL': 'Timor-Leste',
+    'TM': 'Turkmenistan',
+    'TN': 'Tunisia',
+    'TO': 'Tonga',
+    'TR': 'Türkiye',
+    'TT': 'Trinidad and Tobago',
+    'TV': 'Tuvalu',
+    'TW': 'Taiwan',
+    'TZ': 'Tanzania',
+    'UA': 'Ukraine',
+    'UG': 'Uganda',
+    'UM': 'United States Minor Outlying Islands',
+    'US': 'United States',
+    'UY': 'Uruguay',
+    'UZ': 'Uzbekistan',
+    'VA': 'Holy See',
+    'VC': 'Saint Vincent and the Grenadines',
+    'VE': 'Venezuela',
+    'VG': 'British Virgin Islands',
+    'VI': 'U.S. Virgin Islands',
+    'VN': 'Vietnam',
+    'VU': 'Vanuatu',
+    'WF': 'Wallis and Futuna',
+    'WS': 'Samoa',
+    'YE': 'Yemen',
+    'YT': 'Mayotte',
+    'ZA': 'South Africa',
+    'ZM': 'Zambia',
+    'ZW': 'Zimbabwe',
+}
+
+# Other names that occur in papers, including the official ISO names, former names
+# and names in the language of the country.
+ALIASES = {
+    'AE': ['UAE', 'Emirates'],
+    'AT': ['Österreich'],
+    'BA': ['Bosnia'],
+    'BE': ['België', 'Belgique', 'Belgien'],
+    'BN': ['Brunei Darussalam'],
+    'BO': ['Bolivia, Plurinational State of'],
+    'BR': ['Brasil'],
+    'CD': ['Congo, The Democratic Republic of the', 'DR Congo', 'DRC', 'Congo-Kinshasa', 'Zaire'],
+    'CG': ['Congo', 'Congo-Brazzaville'],
+    'CH': ['Schweiz', 'Suisse', 'Svizzera'],
+    'CI': ['Ivory Coast'],
+    'CN': ["People's Republic of China", 'PRC', 'P.R. China', 'P. R. China', 'Mainland China'],
+    'CV': ['Cape Verde'],
+    'CZ': ['Czech Republic', 'Česko', 'Česká republika'],
+    'DE': ['Deutschland', 'Federal Republic of Germany'],
+    'DK': ['Danmark'],
+    'ES': ['España'],
+    'FI': ['Suomi'],
+    'FK': ['Falkland Islands (Malvinas)'],
+    'FM': ['Micronesia, Federated States of'],
+    'GB': ['UK', 'U.K.', 'Great Britain', 'Britain', 'England', 'Scotland', 'Wales', 'Northern Ireland',
+           'United Kingdom of Great Britain and Northern Ireland'],
+    'GR': ['Hellas', 'Ελλάδα'],
+    'HK': ['Hong Kong SAR', 'Hong Kong SAR China', 'Hong Kong, China'],
+    'HU': ['Magyarország'],
+    'IR': ['Iran, Islamic Republic of', 'Islamic Republic of Iran'],
+    'IT': ['Italia'],
+    'JP': ['Nippon', 'Nihon', '日本'],
+    'KP': ["Korea, Democratic People's Republic of", "Democratic People's Republic of Korea", 'DPRK'],
+    'KR': ['Korea', 'Republic of Korea', 'Korea, Republic of', 'Korea (South)', 'ROK', '대한민국', '한국'],
+    'LA': ["Lao People's Democratic Republic"],
+    'MD': ['Moldova, Republic of', 'Republic of Moldova'],
+    'MK': ['Macedonia', 'Republic of North Macedonia', 'FYROM'],
+    'MM': ['Burma'],
+    'MO': ['Macau', 'Macao SAR', 'Macau SAR'],
+    'NL': ['The Netherlands', 'Holland', 'Nederland', 'Netherlands, Kingdom of the'],
+    'NO': ['Norge'],
+    'PL': ['Polska'],
+    'PS': ['Palestine, State of', 'State of Palestine'],
+    'PT': ['Portuguesa'],
+    'RU': ['Russian Federation', 'Россия'],
+    'SA': ['KSA', 'Kingdom of Saudi Arabia'],
+    'SE': ['Sverige'],
+    'SY': ['Syrian Arab Republic'],
+    'SZ': ['Swaziland'],
+    'TL': ['East Timor'],
+    'TR': ['Turkey', 'Turkiye', 'Republic of Türkiye'],
+    'TW': ['Taiwan, Province of China', 'Republic of China', 'ROC', 'Taiwan ROC', 'Taiwan, ROC', 'Chinese Taipei'],
+    'TZ': ['Tanzania, United Republic of', 'United Republic of Tanzania'],
+    'US': ['USA', 'U.S.A.', 'U.S.', 'United States of America', 'America'],
+    'VA': ['Vatican', 'Vatican City', 'Holy See (Vatican City State)'],
+    'VE': ['Venezuela, Bolivarian Republic of'],
+    'VG': ['Virgin Islands, British'],
+    'VI': ['Virgin Islands, U.S.', 'US Virgin Islands'],
+    'VN': ['Viet Nam'],
+}
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+def fold_country(name):
+    """Return the key for name in the lookup table: case, accents, punctuation and a
+       leading "the" are ignored."""
+    name = unicodedata.normalize('NFKD', name.casefold())
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    name = _NON_WORD.sub(' ', name).strip()
+    if name.startswith('the '):
+        name = name[4:]
+    return name
+
+@functools.cache
+def _lookup_table():
+    """The table from folded name to code. It is built on first use so that importing
+       meta_parse stays fast."""
+    table = {}
+    for code, name in COUNTRIES.items():
+        table[fold_country(name)] = code
+    for code, names in ALIASES.items():
+        for name in names:
+            table[fold_country(name)] = code
+    return table
+
+# Exact spellings that are found without folding.
+_EXACT = dict({name: code for code, name in COUNTRIES.items()},
+              **{name: code for code, names in ALIASES.items() for name in names})
+
+def country_code(country):
+    """Return the ISO 3166-1 alpha-2 code for a country name, alias or code, or None
+       if it is not known."""
+    code = _EXACT.get(country)
+    if code is not None:
+        return code
+    stripped = country.strip()
+    if len(stripped) == 2 and stripped.upper() in COUNTRIES:
+        return stripped.upper()
+    return _lookup_table().get(fold_country(stripped))
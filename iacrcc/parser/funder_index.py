@@ -0,0 +1,192 @@
+"""
+Offline index of the Crossref Funder Registry. funding: blocks may carry a fundref
+id, which is not checked by parse_meta, and many only have a name. This checks the
+ids and suggests ids for funders by name, using the same kind of index as
+ror_index.py. The index is built from the registry in RDF (registry.rdf from
+https://gitlab.com/crossref/open_funder_registry) or from a CSV file with the
+columns id, name, alt_names (separated by |), country and replaced_by. Build it
+from the iacrcc directory with
+
+  python -m parser.funder_index build registry.rdf funders.db
+
+and check the funders of .meta files with
+
+  python -m parser.funder_index check funders.db main.meta ...
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+import re
+import sys
+from xml.etree import ElementTree as ET
+from .name_index import build_name_index, NameIndex, Organization
+from .meta_parse import parse_meta
+from .ror_index import normalize_ror_id, RorIndex
+
+FUNDREF_DOI_PREFIX = '10.13039/'
+
+_FUNDREF_ID = re.compile('[0-9]{5,}')
+
+def normalize_fundref_id(fundref):
+    """Return the numeric id from a fundref id, its DOI or a DOI URL, or raise
+       ValueError if it is malformed."""
+    fundref = fundref.strip().lower()
+    for prefix in ('https://doi.org/', 'http://dx.doi.org/', 'https://dx.doi.org/', 'doi:'):
+        if fundref.startswith(prefix):
+            fundref = fundref[len(prefix):]
+            break
+    if fundref.startswith(FUNDREF_DOI_PREFIX):
+        fundref = fundref[len(FUNDREF_DOI_PREFIX):]
+    if not _FUNDREF_ID.fullmatch(fundref):
+        raise ValueError('Invalid fundref id: ' + fundref)
+    return fundref
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def _resource(elem):
+    for key, value in elem.attrib.items():
+        if _local_name(key) == 'resource':
+            return value
+    return None
+
+def read_funder_rdf(f):
+    """Yield an Organization for each skos:Concept in the RDF of the registry. The
+       country is the geonames URL of the funder. Funders that were replaced by
+       another one are not active."""
+    for _, elem in ET.iterparse(f):
+        if _local_name(elem.tag) != 'Concept':
+            continue
+        about = next((v for k, v in elem.attrib.items() if _local_name(k) == 'about'), '')
+        name = None
+        names = []
+        country = None
+        active = True
+        for child in elem:
+            tag = _local_name(child.tag)
+            if tag in ('prefLabel', 'altLabel'):
+                for label in child.iter():
+                    if _local_name(label.tag) == 'literalForm' and label.text:
+                        names.append(label.text.strip())
+                        if tag == 'prefLabel' and name is None:
+                            name = names[-1]
+            elif tag == 'country':
+                country = _resource(child)
+            elif tag == 'isReplacedBy':
+                active = False
+        elem.clear()
+        if name is not None:
+            yield Organization(normalize_fundref_id(about), name, country, active, names)
+
+def read_funder_csv(f):
+    """Yield an Organization for each row of a CSV file with the columns described
+       above. Only id and name are required."""
+    for row in csv.DictReader(f):
+        names = [name.strip() for name in (row.get('alt_names') or '').split('|') if name.strip()]
+        yield Organization(normalize_fundref_id(row['id']),
+                           row['name'].strip(),
+                           row.get('country') or None,
+                           not row.get('replaced_by'),
+                           names)
+
+def build_funder_index(dump_path, index_path):
+    """Build an index for FunderIndex from the registry in RDF or CSV, which may be
+       compressed with gzip. Returns the number of funders."""
+    dump_path = Path(dump_path)
+    suffixes = dump_path.suffixes
+    opener = gzip.open if suffixes[-1:] == ['.gz'] else open
+    with opener(dump_path, 'rb') as f:
+        if '.csv' in suffixes:
+            funders = read_funder_csv(io.TextIOWrapper(f, encoding='UTF-8', newline=''))
+        else:
+            funders = read_funder_rdf(f)
+        return build_name_index(index_path, funders, FunderIndex.kind, source=dump_path.name)
+
+class FunderIndex(NameIndex):
+    """An index built by build_funder_index. Ids may be given as in .meta files, as a
+       number, a DOI or a DOI URL.
+    """
+    kind = 'funder'
+
+    def exists(self, fundref):
+        """Return True if fundref is a well-formed id in the registry."""
+        try:
+            return normalize_fundref_id(fundref) in self
+        except ValueError:
+            return False
+
+    def check_funders(self, funders, ror_index=None, limit=3, min_score=0.5):
+        """Check the funders from parse_meta in bulk. The funders of a whole issue can be
+           passed at once, and each distinct name is only looked up once.
+        args:
+           funders: the list of funder dicts.
+           ror_index: an optional RorIndex, used for funders that have a ror but no
+                      fundref.
+           limit, min_score: as for NameIndex.search.
+        Returns:
+           a list with a dict for each funder with its name, and status, which is 'ok'
+           if the fundref (or ror) is in the registry, 'invalid' if it is malformed,
+           'unknown' if it is not in the registry, 'unchecked' if there is only a ror
+           and no ror_index, and 'missing' if there is neither. Unless the status is
+           'ok' or 'unchecked', suggestions is a list of NameMatch for the name.
+        """
+        results = [{'name': funder.get('name', '')} for funder in funders]
+        unresolved = []
+        for result, funder in zip(results, funders):
+            if 'fundref' in funder:
+                index, normalize, key = self, normalize_fundref_id, 'fundref'
+            elif 'ror' in funder and ror_index is not None:
+                index, normalize, key = ror_index, normalize_ror_id, 'ror'
+            elif 'ror' in funder:
+                result['status'] = 'unchecked'
+                continue
+            else:
+                index = None
+            if index is None:
+                result['status'] = 'missing'
+            else:
+                try:
+                    result['status'] = 'ok' if normalize(funder[key]) in index else 'unknown'
+                except ValueError:
+                    result['status'] = 'invalid'
+            if result['status'] != 'ok':
+                unresolved.append(result)
+        suggestions = self.search_many([result['name'] for result in unresolved],
+                                       limit=limit, min_score=min_score)
+        for result, matches in zip(unresolved, suggestions):
+            result['suggestions'] = matches
+        return results
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Offline index of the Crossref Funder Registry')
+    commands = argparser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='build an index from the registry')
+    build.add_argument('dump', help='registry as .rdf or .csv, optionally .gz')
+    build.add_argument('index', help='file name for the index')
+    check = commands.add_parser('check', help='check the funders in .meta files')
+    check.add_argument('index', help='index from build')
+    check.add_argument('meta_files', nargs='+', help='.meta files')
+    check.add_argument('--ror_index', help='index from ror_index.py to check funders with a ror')
+    args = argparser.parse_args()
+    if args.command == 'build':
+        count = build_funder_index(args.dump, args.index)
+        print('{} funders'.format(count))
+        sys.exit(0)
+    ror_index = None
+    if args.ror_index:
+        ror_index = RorIndex(args.ror_index)
+    with FunderIndex(args.index) as index:
+        funders = []
+        paths = []
+        for meta_file in args.meta_files:
+            data = parse_meta(Path(meta_file).read_text(encoding='UTF-8'))
+            funders.extend(data['funders'])
+            paths.extend([meta_file] * len(data['funders']))
+        for path, result in zip(paths, index.check_funders(funders, ror_index)):
+            if 'suggestions' in result:
+                result['suggestions'] = [match._asdict() for match in result['suggestions']]
+            print(json.dumps(dict(result, path=path)))
@@ -0,0 +1,152 @@
+"""
+Compact classes for parsed metadata. parse_meta returns nested dicts, which is
+convenient for JSON but each dict carries a lot of overhead. When the metadata for
+a whole archive is kept in memory, parse_meta_model returns slotted dataclasses
+instead. Every class has a to_dict() that produces the same dict as parse_meta.
+"""
+
+from dataclasses import dataclass, field
+import sys
+from .meta_parse import iter_meta_records, check_affiliation_indices
+
+def _intern(value):
+    """Country names and codes repeat across papers, so share one copy of each."""
+    return None if value is None else sys.intern(value)
+
+def _to_dict(obj, names):
+    """Return a dict with the attributes in names that are not None."""
+    data = {}
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None:
+            data[name] = value
+    if getattr(obj, 'extra', None):
+        data.update(obj.extra)
+    return data
+
+@dataclass(slots=True)
+class Author:
+    name: str = None
+    familyName: str = None
+    given: str = None
+    email: str = None
+    orcid: str = None
+    affiliations: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('name'), d.get('familyName'), d.get('given'), d.get('email'), d.get('orcid'),
+                   d.get('affiliations', []))
+
+    def to_dict(self):
+        data = {'affiliations': list(self.affiliations)}
+        data.update(_to_dict(self, ('name', 'familyName', 'given', 'email', 'orcid')))
+        return data
+
+_AFFILIATION_FIELDS = ('name', 'ror', 'department', 'street', 'city', 'state', 'postcode', 'country',
+                       'countrycode')
+
+@dataclass(slots=True)
+class Affiliation:
+    name: str = None
+    ror: str = None
+    department: str = None
+    street: str = None
+    city: str = None
+    state: str = None
+    postcode: str = None
+    country: str = None
+    countrycode: str = None
+    extra: dict = None # any other keys from the affiliation: record.
+
+    @classmethod
+    def from_dict(cls, d):
+        obj = cls(**{k: v for k, v in d.items() if k in _AFFILIATION_FIELDS})
+        obj.country = _intern(obj.country)
+        obj.countrycode = _intern(obj.countrycode)
+        extra = {k: v for k, v in d.items() if k not in _AFFILIATION_FIELDS}
+        if extra:
+            obj.extra = extra
+        return obj
+
+    def to_dict(self):
+        return _to_dict(self, _AFFILIATION_FIELDS)
+
+_FUNDER_FIELDS = ('name', 'ror', 'fundref', 'grantid', 'country', 'countrycode')
+
+@dataclass(slots=True)
+class Funder:
+    name: str = None
+    ror: str = None
+    fundref: str = None
+    grantid: str = None
+    country: str = None
+    countrycode: str = None
+    extra: dict = None # any other keys from the funding: record.
+
+    @classmethod
+    def from_dict(cls, d):
+        obj = cls(**{k: v for k, v in d.items() if k in _FUNDER_FIELDS})
+        obj.country = _intern(obj.country)
+        obj.countrycode = _intern(obj.countrycode)
+        extra = {k: v for k, v in d.items() if k not in _FUNDER_FIELDS}
+        if extra:
+            obj.extra = extra
+        return obj
+
+    def to_dict(self):
+        return _to_dict(self, _FUNDER_FIELDS)
+
+_META_FIELDS = ('title', 'subtitle', 'keywords', 'license', 'schema', 'version')
+
+@dataclass(slots=True)
+class Meta:
+    title: str = None
+    subtitle: str = None
+    keywords: list = None
+    license: str = None
+    schema: str = None
+    version: str = None
+    authors: list = field(default_factory=list)
+    affiliations: list = field(default_factory=list)
+    funders: list = field(default_factory=list)
+    citations: list = None # the dicts from parse_meta, if there are citation: records.
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(authors=[Author.from_dict(a) for a in d['authors']],
+                   affiliations=[Affiliation.from_dict(a) for a in d['affiliations']],
+                   funders=[Funder.from_dict(f) for f in d['funders']],
+                   citations=d.get('citations'),
+                   **{k: d.get(k) for k in _META_FIELDS})
+
+    def to_dict(self):
+        """Return the same dict that parse_meta returns for this metadata."""
+        data = {'authors': [a.to_dict() for a in self.authors],
+                'affiliations': [a.to_dict() for a in self.affiliations],
+                'funders': [f.to_dict() for f in self.funders]}
+        data.update(_to_dict(self, _META_FIELDS))
+        if self.citations is not None:
+            data['citations'] = self.citations
+        return data
+
+def parse_meta_model(metastr, decoder=None):
+    """Like parse_meta, but returns a Meta object."""
+    meta = Meta()
+    authors = []
+    for record in iter_meta_records(metastr, decoder):
+        if record.kind == 'author':
+            authors.append(record.value)
+            meta.authors.append(Author.from_dict(record.value))
+        elif record.kind == 'affiliation':
+            meta.affiliations.append(Affiliation.from_dict(record.value))
+        elif record.kind == 'funding':
+            meta.funders.append(Funder.from_dict(record.value))
+        elif record.kind == 'citation':
+            if meta.citations is None:
+                meta.citations = []
+            meta.citations.append(record.value)
+        else:
+            setattr(meta, record.kind, record.value)
+    check_affiliation_indices(authors, len(meta.affiliations))
+    return meta
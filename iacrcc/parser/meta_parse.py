@@ -14,12 +14,23 @@ in texlive 2025 (perhaps due to this: https://github.com/latex3/latex2e/pull/138
 """
 
 import argparse
+from collections import namedtuple, OrderedDict
+import functools
+import glob
 import json
-from nameparser import HumanName
+import mmap
+import os
 from pathlib import Path
 from pylatexenc import latexwalker
 from pylatexenc.latex2text import LatexNodes2Text, get_default_latex_context_db, MacroTextSpec
 import re
+import sys
+import threading
+import warnings
+try:
+    from .countries import country_code
+except ImportError: # run as a script.
+    from countries import country_code
 
 def get_key_val(line):
     """If line has form key: value, then return key, value."""
@@ -54,12 +65,23 @@ def frac_decoder(n, l2tobj):
         ans += '(' + arg2 + ')'
     return ans
 
+# Characters and ligatures that LatexNodes2Text changes. Values without any of them
+# are returned unchanged, and most values in a .meta file are like that.
+_LATEX_SPECIAL = re.compile(r"[\\${}~%&]|--|''|``|[!?]`")
+
+def needs_latex_decoding(text):
+    """Return False if latex_to_text would return text unchanged."""
+    return _LATEX_SPECIAL.search(text) is not None
+
 class LatexToText(LatexNodes2Text):
     """There are some things that LatexNodes2Text cannot handle, like
-       removing T1 (it doesn't recognize those as a macro)."""
+       removing T1 (it doesn't recognize those as a macro). Plain text
+       is returned without building a node tree."""
     def _preclean(self, text):
         return text.replace('\\T1', '')
     def latex_to_text(self, v):
+        if not needs_latex_decoding(v):
+            return v
         return super().latex_to_text(self._preclean(v))
 
 def get_decoder():
@@ -88,6 +110,84 @@ def get_decoder():
                        keep_comments=False,
                        latex_context=lt_context_db)
 
+# Default number of decoded strings kept by the shared decoder.
+DECODER_CACHE_SIZE = 4096
+
+DecoderCacheInfo = namedtuple('DecoderCacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+class CachedDecoder:
+    """Wraps a decoder from get_decoder() with a bounded LRU cache for latex_to_text.
+       The same affiliation, country, funder names and keywords recur across many
+       papers, so bulk parsing can skip pylatexenc for strings it has already seen.
+       Strings that fail to decode are not cached. A maxsize of 0 disables caching.
+    """
+    def __init__(self, decoder, maxsize=DECODER_CACHE_SIZE):
+        self.decoder = decoder
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def latex_to_text(self, v):
+        if not needs_latex_decoding(v): # don't spend cache entries on plain text.
+            return v
+        with self._lock:
+            if v in self._cache:
+                self._cache.move_to_end(v)
+                self.hits += 1
+                return self._cache[v]
+            self.misses += 1
+        text = self.decoder.latex_to_text(v)
+        if self.maxsize > 0:
+            with self._lock:
+                self._cache[v] = text
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+        return text
+
+    def cache_info(self):
+        """Return counters in the style of functools.lru_cache."""
+        with self._lock:
+            return DecoderCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.evictions = 0
+
+_shared_decoder = None
+_shared_decoder_lock = threading.Lock()
+_thread_decoders = threading.local()
+
+def get_shared_decoder(thread_local=False, cached=True):
+    """Return a decoder from get_decoder() that is built once and then reused.
+       Building the latex context database is a significant part of the cost of
+       parsing a single .meta file, so by default one decoder is shared by the
+       whole process. With thread_local=True each thread builds its own decoder.
+    args:
+       thread_local: if True, return a decoder private to the calling thread.
+       cached: if True, return the CachedDecoder with DECODER_CACHE_SIZE entries
+               that wraps the shared decoder. Otherwise return the bare decoder.
+    """
+    global _shared_decoder
+    if thread_local:
+        decoder = getattr(_thread_decoders, 'decoder', None)
+        if decoder is None:
+            decoder = CachedDecoder(get_decoder())
+            _thread_decoders.decoder = decoder
+    else:
+        if _shared_decoder is None:
+            with _shared_decoder_lock:
+                if _shared_decoder is None:
+                    _shared_decoder = CachedDecoder(get_decoder())
+        decoder = _shared_decoder
+    if cached:
+        return decoder
+    return decoder.decoder
+
 def remove_macros(txt):
     txt = txt.replace(r'\\[\s]+', ' ')
     txt = re.sub(r'\\thanks  {[^}]*} ?', '', txt)
@@ -114,118 +214,543 @@ def validate_orcid(orcid):
     if checksum != orcid[-1]:
         raise ValueError('Invalid orcid checksum: ' + orcid)
 
-def parse_meta(metastr):
-    """Read the meta file line by line. When we encounter author: or affiliation: or title: or
-       funding: we know how to process subsequent lines that start with two spaces.
+# A record from a .meta file. kind is one of 'title', 'subtitle', 'author',
+# 'affiliation', 'funding', 'citation', 'keywords', 'license', 'schema', or
+# 'version'. value is a dict for author, affiliation, funding and citation, a list
+# of strings for keywords, and a string otherwise. lineno is the line where the
+# record starts.
+MetaRecord = namedtuple('MetaRecord', ['kind', 'value', 'lineno'])
+
+def _iter_blocks(lines):
+    """Group lines into blocks, where each block is a line without indentation followed
+       by the lines that start with two spaces. Yields lineno, line, [(lineno, line)]."""
+    start = None
+    for lineno, line in enumerate(lines, start=1):
+        line = line.rstrip('\r\n')
+        if start is not None and line.startswith('  '):
+            start[2].append((lineno, line))
+            continue
+        if start is not None:
+            yield start
+        start = (lineno, line.rstrip(), [])
+    if start is not None:
+        yield start
+
+# Line breaks other than \n that str.splitlines() also breaks on.
+# Checking each with the in operator is much faster than a regular expression.
+_OTHER_LINE_BREAKS = '\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+def _scan_blocks(text):
+    """Equivalent to _iter_blocks(text.splitlines()), but splits the whole text at once
+       and only strips the lines that start a block. text may also be bytes, or a buffer
+       such as a memoryview or mmap containing UTF-8."""
+    if not isinstance(text, str):
+        text = str(text, 'UTF-8')
+    if any(c in text for c in _OTHER_LINE_BREAKS):
+        yield from _iter_blocks(text.splitlines())
+        return
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    lineno = 0
+    fields = None
+    for line in lines:
+        lineno += 1
+        if fields is not None and line[:2] == '  ':
+            fields.append((lineno, line))
+            continue
+        if fields is not None:
+            yield start, header, fields
+        start, header, fields = lineno, line.rstrip(), []
+    if fields is not None:
+        yield start, header, fields
+
+class MetaValidationError(ValueError):
+    """Raised by parse_meta with collect_errors=True. errors is a list of
+       (lineno, message) for every problem that was found."""
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('\n'.join('line {}: {}'.format(lineno, msg) for lineno, msg in errors))
+
+def _checked(on_error, lineno, func, *args):
+    """Return func(*args). If on_error is given, then an exception is passed to
+       on_error(lineno, exception) and None is returned instead of raising."""
+    if on_error is None:
+        return func(*args)
+    try:
+        return func(*args)
+    except Exception as e:
+        on_error(lineno, e)
+        return None
+
+# Default number of names kept by split_name.
+NAME_CACHE_SIZE = 4096
+
+NameParts = namedtuple('NameParts', ['name', 'first', 'middle', 'last'])
+
+# Titles that are seen in author names, in lower case without the period. They are
+# all titles for nameparser.HumanName, which decides whether they are a title there.
+_NAME_TITLES = frozenset(['dr', 'doctor', 'prof', 'professor', 'mr', 'mrs', 'ms', 'miss', 'mx',
+                          'sir', 'dame', 'lord', 'lady', 'rev', 'hon', 'judge'])
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def split_name(name, surname=None):
+    """Split a decoded name into NameParts with a canonical form of the name. When the
+       surname is known and the name begins or ends with it, the rest of the name is
+       the given names and nameparser.HumanName is skipped, unless the first of them
+       may be a title. Otherwise this uses HumanName, and returns None if that cannot
+       parse the name. Results are cached, and split_name.cache_info() has the statistics.
+    """
+    words = name.split()
+    if surname:
+        family = surname.split()
+        n = len(family)
+        given = None
+        if 0 < n < len(words):
+            if words[-n:] == family:
+                given = words[:-n]
+            elif words[:n] == family:
+                given = words[n:]
+        if given and given[0].rstrip('.').lower() not in _NAME_TITLES:
+            return NameParts(' '.join(words), given[0], ' '.join(given[1:]), ' '.join(family))
+    from nameparser import HumanName # slow to import, and metacapture usually supplies surname.
+    parsed = HumanName(name)
+    if not parsed:
+        return None
+    return NameParts(str(parsed), parsed.first, parsed.middle, parsed.last)
+
+def _parse_author_field(author, line):
+    """Process one line of an author: block, and return the key."""
+    k,v = get_key_val(line.rstrip())
+    if k == 'surname':
+        author['familyName'] = v
+    elif k == 'name':
+        author[k] = v # decoded by _set_author_name when the block is complete.
+    elif k == 'email':
+        author['email'] = v.strip().replace(r'\_', '_')
+        # This is just a basic check - not a full validation.
+        if not re.match(r'[^@]+@[^@]+\.[^@]+', author['email']):
+            raise ValueError('Invalid email: ' + author['email'])
+    elif k == 'affil' or k == 'inst':
+        affiliations = [a.strip() for a in v.split(',') if a.strip()]
+        # Not stored if invalid, so that _check_author_affiliations does not report it again.
+        for i in affiliations:
+            if not i.isdigit():
+                raise ValueError('Invalid list of affiliations {}'.format(v))
+        author['affiliations'] = affiliations
+    elif k == 'orcid':
+        author['orcid'] = v.rstrip()
+        validate_orcid(author['orcid'])
+    return k
+
+def _set_author_name(author, decoder):
+    """Decode and canonicalize the name, using surname: if it was supplied."""
+    surname = author.get('familyName')
+    parts = split_name(decoder.latex_to_text(author['name']),
+                       decoder.latex_to_text(surname) if surname else None)
+    if parts:
+        author['name'] = parts.name # canonicalize name
+        if parts.last and not surname:
+            author['familyName'] = parts.last
+        if parts.first:
+            author['given'] = parts.first
+    elif not surname: # surname is required, so guess if the parser fails.
+        author['familyName'] = author['name'].split()[-1]
+
+def _parse_author(fields, decoder, on_error=None):
+    author = {'affiliations': []}
+    name_lineno = None
+    for lineno, line in fields:
+        if _checked(on_error, lineno, _parse_author_field, author, line) == 'name':
+            name_lineno = lineno
+    if name_lineno is not None:
+        _checked(on_error, name_lineno, _set_author_name, author, decoder)
+    return author
+
+def _parse_field(block, line, decoder):
+    k,v = get_key_val(line)
+    block[k] = decoder.latex_to_text(v)
+
+def _parse_fields(fields, decoder, on_error=None):
+    """Used for affiliation: and funding:, where every field is decoded."""
+    block = {}
+    for lineno, line in fields:
+        _checked(on_error, lineno, _parse_field, block, line, decoder)
+    return block
+
+class UnknownCountryWarning(UserWarning):
+    """Issued by parse_meta for a country: that is not in countries.py."""
+
+def _add_countrycode(block, lineno):
+    """Add countrycode to an affiliation or funding block that has a country: but
+       no countrycode:, or warn if the country is not known. This is only a warning
+       with collect_errors too, so that both modes accept the same files."""
+    if 'country' in block and 'countrycode' not in block:
+        code = country_code(block['country'])
+        if code is None:
+            warnings.warn('line {}: unknown country {}'.format(lineno, block['country']),
+                          UnknownCountryWarning)
+        else:
+            block['countrycode'] = code
+    return block
+
+def _unexpected_line(line):
+    raise Exception('unexpected line {}'.format(line.rstrip()))
+
+def _check_no_fields(fields, on_error=None):
+    """Records other than author, affiliation, funding and citation are a single line."""
+    for lineno, line in fields:
+        _checked(on_error, lineno, _unexpected_line, line)
+
+def _decode_keywords(value, decoder):
+    return [k.strip() for k in decoder.latex_to_text(value).split(',')]
+
+def _parse_citation_header(line):
+    parts = line.split()
+    if len(parts) != 3:
+        raise ValueError('citation: should have a type and a key: {}'.format(line))
+    return {'type': parts[1], 'id': parts[2], 'authorlist': []}
+
+def _parse_citation(lineno, line, fields, decoder, on_error=None, keep_tex=False):
+    """Parse a citation: block written by iacrcc.bst. The fields are kept as TeX,
+       except authors and the names in authorlist, which are decoded unless keep_tex
+       is True. An author: or editor: line may be followed by a surname: line for the
+       same person."""
+    citation = _checked(on_error, lineno, _parse_citation_header, line)
+    if citation is None:
+        return None
+    decode = (lambda v: v) if keep_tex else decoder.latex_to_text
+    person = None # the author or editor that a surname: line belongs to.
+    is_author = False
+    for lineno, line in fields:
+        k, colon, v = line.partition(':')
+        if not colon:
+            _checked(on_error, lineno, get_key_val, line) # raises for the missing colon.
+            continue
+        k = k.strip()
+        v = v.strip()
+        if k == 'surname' and person is not None:
+            person['surname'] = decode(v) if is_author else v
+            person = None
+            continue
+        person = None
+        if k == 'author':
+            person = {'name': decode(v)}
+            is_author = True
+            citation['authorlist'].append(person)
+        elif k == 'editor':
+            person = {'name': v}
+            is_author = False
+            citation.setdefault('editors', []).append(person)
+        elif k == 'authors':
+            citation['authors'] = decode(v)
+        else:
+            citation[k] = v
+    return citation
+
+def _parse_block(lineno, line, fields, decoder, on_error, keep_tex=False):
+    """Return the list of MetaRecord for one block from _iter_blocks. With keep_tex,
+       title, subtitle and keywords are not decoded, and keywords is a string."""
+    records = []
+    def add(kind, lineno, func, *args):
+        value = _checked(on_error, lineno, func, *args)
+        if value is not None:
+            records.append(MetaRecord(kind, value, lineno))
+    def add_tex(kind, lineno, value, func, *args):
+        if keep_tex:
+            records.append(MetaRecord(kind, value, lineno))
+        else:
+            add(kind, lineno, func, value, *args)
+    if line.startswith('author:'):
+        records.append(MetaRecord('author', _parse_author(fields, decoder, on_error), lineno))
+        return records
+    elif line.startswith('affiliation:'):
+        records.append(MetaRecord('affiliation', _add_countrycode(_parse_fields(fields, decoder, on_error), lineno), lineno))
+        return records
+    elif line.startswith('funding:'):
+        records.append(MetaRecord('funding', _add_countrycode(_parse_fields(fields, decoder, on_error), lineno), lineno))
+        return records
+    elif line.startswith('citation:'):
+        add('citation', lineno, _parse_citation, lineno, line, fields, decoder, on_error, keep_tex)
+        return records
+    elif line.startswith('version:'):
+        records.append(MetaRecord('version', line[8:].strip(), lineno))
+    elif line.startswith('schema:'):
+        records.append(MetaRecord('schema', line[7:].strip(), lineno))
+    elif line.startswith('title:'):
+        add_tex('title', lineno, line[6:].strip(), decoder.latex_to_text)
+        if fields:
+            k,v = _checked(on_error, fields[0][0], get_key_val, fields[0][1]) or (None, None)
+            if k == 'subtitle':
+                add_tex('subtitle', fields[0][0], v, decoder.latex_to_text)
+                fields = fields[1:]
+    # metacapture writes out subtitle by itself. May occur before title:
+    elif line.startswith('subtitle:'):
+        add_tex('subtitle', lineno, line[9:].strip(), decoder.latex_to_text)
+    elif line.startswith('keywords:'):
+        add_tex('keywords', lineno, line[9:].strip(), _decode_keywords, decoder)
+    elif line.startswith('license:'):
+        records.append(MetaRecord('license', line[8:].strip(), lineno))
+    else:
+        _checked(on_error, lineno, _unexpected_line, line)
+        return records
+    _check_no_fields(fields, on_error)
+    return records
+
+def iter_meta_records(source, decoder=None, on_error=None, keep_tex=False):
+    """Parse .meta lines incrementally, yielding a MetaRecord as each one is complete.
+       Only the current record is held in memory, so this is suitable for reading
+       large files or many concatenated .meta files.
     args:
-       metastr: UTF-8 string from a .meta file.
+       source: an iterable of lines, such as a file object opened in text mode, or
+               the whole text of a .meta file as str, bytes, memoryview or mmap.
+       decoder: as for parse_meta.
+       on_error: if given, on_error(lineno, exception) is called for each invalid
+                 line and parsing continues. Otherwise the first error is raised.
+       keep_tex: if True, the values of title, subtitle and keywords and the names
+                 of the authors of citations are the TeX from the file, for outputs
+                 that convert the math themselves or only use some of the names.
     Returns:
-        a dict with fields for a Meta object.
-    # TODO: define a JSON schema for this file, or return a pydantic object.
+       a generator of MetaRecord.
+    """
+    if decoder is None:
+        decoder = get_shared_decoder()
+    if isinstance(source, (str, bytes, bytearray, memoryview, mmap.mmap)):
+        blocks = _scan_blocks(source)
+    else:
+        blocks = _iter_blocks(source)
+    for lineno, line, fields in blocks:
+        yield from _parse_block(lineno, line, fields, decoder, on_error, keep_tex)
+
+def _check_author_affiliations(author, num_affiliations):
+    for aff in author.get('affiliations'):
+        index = int(aff)
+        if index not in range(1, 1+num_affiliations):
+            raise ValueError('Author affiliations out of range for author {}'.format(author.get('name', '')))
+
+def check_affiliation_indices(authors, num_affiliations):
+    """Perform a sanity check on affiliations to make sure the indices are in range.
+    args:
+       authors: a list of author dicts.
+       num_affiliations: number of affiliation: records.
     """
-    decoder = get_decoder()
+    for author in authors:
+        _check_author_affiliations(author, num_affiliations)
+
+def _meta_from_records(records, errors, on_error):
+    """Assemble the dict returned by parse_meta from MetaRecord objects."""
     data = {'authors': [],
             'affiliations': [],
             'funders': []}
-
-    lines = metastr.splitlines()
-    numlines = len(lines)
-    index = 0
-    while index < numlines:
-        line = lines[index].rstrip()
-        if line.startswith('author:'):
-            author = {'affiliations': []}
-            data['authors'].append(author)
-            index = index + 1
-            while index < numlines and lines[index].startswith('  '):
-                k,v = get_key_val(lines[index].rstrip())
-                if k == 'surname':
-                    author['familyName'] = v
-                elif k == 'name':
-                    author[k] = v
-                    v = decoder.latex_to_text(v)
-                    parsed = HumanName(v)
-                    if parsed:
-                        author[k] = str(parsed) # canonicalize name
-                        if parsed.last:
-                            author['familyName'] = parsed.last
-                        if parsed.first:
-                            author['given'] = parsed.first
-                    else: # surname is required, so guess if the parser fails.
-                        parts = author[k].split()
-                        author['familyName'] = parts[-1]
-                elif k == 'email':
-                    author['email'] = v.strip().replace(r'\_', '_')
-                    # This is just a basic check - not a full validation.
-                    if not re.match(r'[^@]+@[^@]+\.[^@]+', author['email']):
-                        raise valueError('Invalid email: ' + author['email'])
-                elif k == 'affil' or k == 'inst':
-                    author['affiliations'] = [a.strip() for a in v.split(',') if a.strip()]
-                    for i in author['affiliations']:
-                        if not i.isdigit():
-                            raise ValueError('Invalid list of affiliations {}'.format(v))
-                elif k == 'orcid':
-                    author['orcid'] = v.rstrip()
-                    validate_orcid(author['orcid'])
-                index += 1
-        elif line.startswith('affiliation:'):
-            affiliation = {}
-            data['affiliations'].append(affiliation)
-            index += 1
-            while index < numlines and lines[index].startswith('  '): # associated with affiliation
-                k,v = get_key_val(lines[index])
-                affiliation[k] = decoder.latex_to_text(v)
-                index += 1
-        elif line.startswith('funding:'):
-            funder = {}
-            data['funders'].append(funder)
-            index += 1
-            while index < numlines and lines[index].startswith('  '):
-                k,v = get_key_val(lines[index])
-                funder[k] = decoder.latex_to_text(v)
-                index += 1
-        elif line.startswith('version:'):
-            data['version'] = line[8:].strip()
-            index += 1
-        elif line.startswith('schema:'):
-            data['schema'] = line[7:].strip()
-            index += 1
-        elif line.startswith('title:'):
-            data['title'] = decoder.latex_to_text(line[6:].strip())
-            index += 1
-            if index < numlines and lines[index].startswith('  '):
-                k,v = get_key_val(lines[index])
-                if k == 'subtitle':
-                    data['subtitle'] = decoder.latex_to_text(v)
-                    index += 1
-        # metacapture writes out subtitle by itself. May occur before title:
-        elif line.startswith('subtitle:'):
-            data['subtitle'] = decoder.latex_to_text(line[9:].strip())
-            index += 1
-        elif line.startswith('keywords:'):
-            data['keywords'] = [k.strip() for k in decoder.latex_to_text(line[9:].strip()).split(',')]
-            index += 1
-        elif line.startswith('license:'):
-            data['license'] = line[8:].strip()
-            index += 1
+    lists = {'author': data['authors'],
+             'affiliation': data['affiliations'],
+             'funding': data['funders']}
+    author_lines = []
+    for record in records:
+        if record.kind in lists:
+            lists[record.kind].append(record.value)
+        elif record.kind == 'citation':
+            data.setdefault('citations', []).append(record.value)
         else:
-            raise Exception('unexpected line {}'.format(line))
-    # perform a sanity check on affiliations to make sure the indices are in range.
-    num_affiliations = len(data.get('affiliations'))
-    for author in data.get('authors'):
-        for aff in author.get('affiliations'):
-            index = int(aff)
-            if index not in range(1, 1+num_affiliations):
-                raise ValueError('Author affiliations out of range for author {}'.format(author.get('name', '')))
+            data[record.kind] = record.value
+        if record.kind == 'author':
+            author_lines.append(record.lineno)
+    for lineno, author in zip(author_lines, data['authors']):
+        _checked(on_error, lineno, _check_author_affiliations, author, len(data['affiliations']))
+    if errors:
+        raise MetaValidationError(sorted(errors))
     return data
 
+def _error_collector(collect_errors):
+    """Return errors, on_error for the collect_errors argument of parse_meta."""
+    errors = []
+    if collect_errors:
+        return errors, lambda lineno, e: errors.append((lineno, str(e)))
+    return errors, None
+
+def parse_meta(metastr, decoder=None, collect_errors=False):
+    """Parse the contents of a meta file. When we encounter author: or affiliation: or title: or
+       funding: or citation: we know how to process subsequent lines that start with two spaces.
+    args:
+       metastr: UTF-8 string from a .meta file. This may also be bytes or a buffer such
+                as a memoryview or mmap of the file.
+       decoder: optional decoder from get_decoder() or a CachedDecoder. Defaults to
+                get_shared_decoder(), which caches decoded strings. Pass
+                get_shared_decoder(cached=False) to bypass the cache.
+       collect_errors: if False, raise on the first problem. If True, check the whole
+                file and raise MetaValidationError listing every problem with its line.
+                An unknown country is an UnknownCountryWarning in both modes.
+    Returns:
+        a dict with fields for a Meta object. citations is only present if the file
+        has citation: records.
+    # TODO: define a JSON schema for this file, or return a pydantic object.
+    """
+    errors, on_error = _error_collector(collect_errors)
+    return _meta_from_records(iter_meta_records(metastr, decoder, on_error), errors, on_error)
+
+# The blocks that reparse_meta can reuse, and the list in parse_meta that holds them.
+_REUSABLE_BLOCKS = {'author:': ('author', 'authors'),
+                    'affiliation:': ('affiliation', 'affiliations'),
+                    'funding:': ('funding', 'funders'),
+                    'citation:': ('citation', 'citations')}
+
+def _reusable_block(line):
+    for prefix, kinds in _REUSABLE_BLOCKS.items():
+        if line.startswith(prefix):
+            return kinds
+    return None, None
+
+def reparse_meta(old_data, old_text, new_text, decoder=None, collect_errors=False):
+    """Parse new_text, which is usually a small edit of old_text. Author, affiliation,
+       funding and citation blocks whose lines are unchanged are not decoded again, and their
+       dicts are taken from old_data. Everything else is parsed as in parse_meta.
+    args:
+       old_data: the result of parse_meta(old_text) or reparse_meta(..., old_text).
+       old_text: the text that old_data was parsed from.
+       new_text: the new contents of the .meta file.
+       decoder, collect_errors: as for parse_meta.
+    Returns:
+        the same dict as parse_meta(new_text), with the same warnings. It shares the
+        dicts of unchanged blocks with old_data, so they should not be modified.
+    """
+    if decoder is None:
+        decoder = get_shared_decoder()
+    reusable = {}
+    counts = {kind: 0 for kind, _ in _REUSABLE_BLOCKS.values()}
+    for lineno, line, fields in _scan_blocks(old_text):
+        kind, key = _reusable_block(line)
+        if kind is None:
+            continue
+        index = counts[kind]
+        counts[kind] += 1
+        if index < len(old_data.get(key, ())):
+            block = (line, tuple(field for _, field in fields))
+            reusable.setdefault(block, []).append(old_data[key][index])
+    for values in reusable.values():
+        values.reverse()
+    errors, on_error = _error_collector(collect_errors)
+    def records():
+        for lineno, line, fields in _scan_blocks(new_text):
+            kind, _ = _reusable_block(line)
+            if kind is not None:
+                values = reusable.get((line, tuple(field for _, field in fields)))
+                if values:
+                    value = values.pop()
+                    if kind in ('affiliation', 'funding'):
+                        # Only warns again for an unknown country, since a known one has
+                        # its countrycode already.
+                        _add_countrycode(value, lineno)
+                    yield MetaRecord(kind, value, lineno)
+                    continue
+            yield from _parse_block(lineno, line, fields, decoder, on_error)
+    return _meta_from_records(records(), errors, on_error)
+
+def expand_meta_paths(patterns):
+    """Expand file names, directories and glob patterns into a list of paths.
+       Directories are searched recursively for *.meta files. A pattern that
+       matches nothing is kept as is, so that it is reported as missing."""
+    paths = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(path.rglob('*.meta')))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            matches = sorted(glob.glob(str(pattern), recursive=True))
+            if matches:
+                paths.extend(Path(m) for m in matches)
+            else:
+                paths.append(path)
+    return paths
+
+def _parse_meta_file(path, collect_errors=False):
+    """Parse a single file for parse_meta_many. Failures are returned, not raised,
+       and so are unknown countries, which may be found in another process."""
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', UnknownCountryWarning)
+            metadata = parse_meta(Path(path).read_text(encoding='UTF-8'), collect_errors=collect_errors)
+        result = {'path': str(path), 'metadata': metadata}
+        for warning in caught:
+            if issubclass(warning.category, UnknownCountryWarning):
+                result.setdefault('warnings', []).append(str(warning.message))
+            else:
+                warnings.warn_explicit(warning.message, warning.category, warning.filename, warning.lineno)
+        return result
+    except MetaValidationError as e:
+        return {'path': str(path), 'error': '{}: {}'.format(type(e).__name__, e), 'errors': e.errors}
+    except Exception as e:
+        return {'path': str(path), 'error': '{}: {}'.format(type(e).__name__, e)}
+
+def parse_meta_many(paths, jobs=None, ordered=True, collect_errors=False):
+    """Parse many .meta files using a pool of worker processes.
+    args:
+       paths: file names, directories or glob patterns (see expand_meta_paths).
+       jobs: number of worker processes. The default is one per CPU, and jobs=1
+             parses in the calling process.
+       ordered: if True, yield results in input order. Otherwise yield them as
+                they complete.
+       collect_errors: passed to parse_meta.
+    Returns:
+       a generator of dicts with 'path' and either 'metadata' (the result of
+       parse_meta) or 'error'. With collect_errors, 'errors' has the list of
+       (lineno, message). Unknown countries are in 'warnings', a list of messages
+       with their line, next to 'metadata'. A file that fails does not abort the batch.
+    """
+    paths = expand_meta_paths(paths)
+    parse_file = functools.partial(_parse_meta_file, collect_errors=collect_errors)
+    if jobs == 1 or len(paths) < 2:
+        for path in paths:
+            yield parse_file(path)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            chunksize = max(1, min(64, len(paths) // (4 * workers)))
+            yield from executor.map(parse_file, paths, chunksize=chunksize)
+        else:
+            futures = [executor.submit(parse_file, path) for path in paths]
+            for future in as_completed(futures):
+                yield future.result()
+
 if __name__ == '__main__':
     argparser = argparse.ArgumentParser(description='Parse a meta file')
-    argparser.add_argument('--input_file',
-                           required=True,
-                           help='meta file to parse')
+    inputs = argparser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument('--input_file',
+                        help='meta file to parse')
+    inputs.add_argument('--inputs',
+                        nargs='+',
+                        help='meta files, directories or glob patterns to parse. '
+                        'Prints one JSON object per line with path and metadata or error.')
+    argparser.add_argument('--jobs',
+                           type=int,
+                           help='number of worker processes for --inputs (default: one per CPU)')
+    argparser.add_argument('--unordered',
+                           action='store_true',
+                           help='with --inputs, print results as they complete instead of in input order')
+    argparser.add_argument('--all_errors',
+                           action='store_true',
+                           help='report every error with its line number instead of stopping at the first')
     args = argparser.parse_args()
-    metafile = Path(args.input_file)
-    mstr = metafile.read_text(encoding='UTF-8')
-    metadata = parse_meta(mstr)
-    print(json.dumps(metadata, indent=2))
+    if args.input_file:
+        metafile = Path(args.input_file)
+        mstr = metafile.read_text(encoding='UTF-8')
+        try:
+            metadata = parse_meta(mstr, collect_errors=args.all_errors)
+        except MetaValidationError as e:
+            for lineno, msg in e.errors:
+                print('{}:{}: {}'.format(args.input_file, lineno, msg), file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(metadata, indent=2))
+    else:
+        failures = 0
+        for result in parse_meta_many(args.inputs, jobs=args.jobs, ordered=not args.unordered,
+                                      collect_errors=args.all_errors):
+            if 'error' in result:
+                failures += 1
+            print(json.dumps(result), flush=True)
+        if failures:
+            print('{} files failed to parse'.format(failures), file=sys.stderr)
+            sys.exit(1)
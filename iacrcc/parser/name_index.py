@@ -0,0 +1,217 @@
+"""
+Compact on-disk indexes of organization names, used to check and suggest the ids of
+affiliations (see ror_index.py) and funders (see funder_index.py) without network
+access. An index is an sqlite database that is built once from a registry dump and
+then opened read-only and memory-mapped, so that many processes can share it.
+
+Names are matched after normalize_name, first exactly and then by the similarity of
+their character trigrams. Only the least common trigrams of a query are used to find
+candidates, so that words like "University" do not make every lookup scan most of
+the index.
+"""
+
+from collections import namedtuple
+import os
+from pathlib import Path
+import re
+import sqlite3
+import unicodedata
+
+# Increment this when the layout of the database changes.
+INDEX_FORMAT = 1
+
+# An organization in the index. names includes the display name.
+Organization = namedtuple('Organization', ['id', 'name', 'country', 'active', 'names'])
+
+# A suggestion from NameIndex.search. name is the name of the organization that
+# matched, and score is between 0 and 1 with 1 for an exact match.
+NameMatch = namedtuple('NameMatch', ['id', 'name', 'score'])
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+def normalize_name(name):
+    """Fold case, accents and punctuation so that spellings of a name compare equal."""
+    name = unicodedata.normalize('NFKD', name.casefold())
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(' ', name.replace('&', ' and ')).strip()
+
+def trigrams(norm):
+    """The set of character trigrams of a normalized name, padded with spaces."""
+    padded = ' {} '.format(norm)
+    return {padded[i:i+3] for i in range(len(padded) - 2)}
+
+def _dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b))
+
+_SCHEMA = '''
+CREATE TABLE info (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE orgs (id TEXT PRIMARY KEY, name TEXT, country TEXT, active INTEGER) WITHOUT ROWID;
+CREATE TABLE names (org TEXT, name TEXT, norm TEXT);
+CREATE TABLE trigrams (tri TEXT, name INTEGER, PRIMARY KEY (tri, name)) WITHOUT ROWID;
+CREATE TABLE trigram_counts (tri TEXT PRIMARY KEY, count INTEGER) WITHOUT ROWID;
+'''
+
+def build_name_index(path, organizations, kind, source=''):
+    """Write an index of organizations to path, replacing any existing file.
+    args:
+       path: file name for the index.
+       organizations: an iterable of Organization.
+       kind: the registry, such as 'ror' or 'funder'. NameIndex checks this.
+       source: a description of the dump, such as its file name or version.
+    Returns:
+       the number of organizations.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        count = 0
+        seen = set()
+        for org in organizations:
+            if org.id in seen:
+                continue
+            seen.add(org.id)
+            count += 1
+            conn.execute('INSERT INTO orgs VALUES (?, ?, ?, ?)',
+                         (org.id, org.name, org.country, int(org.active)))
+            norms = set()
+            for name in [org.name] + list(org.names):
+                norm = normalize_name(name)
+                if not norm or norm in norms:
+                    continue
+                norms.add(norm)
+                rowid = conn.execute('INSERT INTO names VALUES (?, ?, ?)', (org.id, name, norm)).lastrowid
+                conn.executemany('INSERT INTO trigrams VALUES (?, ?)',
+                                 ((tri, rowid) for tri in trigrams(norm)))
+        conn.execute('CREATE INDEX names_norm ON names (norm)')
+        conn.execute('INSERT INTO trigram_counts SELECT tri, COUNT(*) FROM trigrams GROUP BY tri')
+        conn.executemany('INSERT INTO info VALUES (?, ?)',
+                         [('format', str(INDEX_FORMAT)), ('kind', kind), ('source', source),
+                          ('count', str(count))])
+        conn.commit()
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return count
+
+class NameIndex:
+    """Read-only access to an index written by build_name_index. Instances can be
+       used as context managers, and should not be shared between threads.
+    """
+    kind = None # subclasses check that the index is for their registry.
+    # Number of trigrams of a query that are used to find candidates. More common
+    # trigrams are only used while they occur in fewer than MAX_POSTINGS names in total.
+    MIN_QUERY_TRIGRAMS = 1
+    QUERY_TRIGRAMS = 8
+    MAX_POSTINGS = 1000
+    # Number of candidate names that are scored for each query.
+    CANDIDATES = 20
+
+    def __init__(self, path, mmap_size=1 << 30):
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError('Missing index {}'.format(path))
+        self.path = path
+        self._conn = sqlite3.connect('{}?mode=ro'.format(path.resolve().as_uri()), uri=True)
+        self._conn.execute('PRAGMA mmap_size={}'.format(int(mmap_size)))
+        try:
+            self.info = dict(self._conn.execute('SELECT key, value FROM info'))
+        except sqlite3.DatabaseError as e:
+            self._conn.close()
+            raise ValueError('Not a name index: {}'.format(path)) from e
+        if self.info.get('format') != str(INDEX_FORMAT):
+            self._conn.close()
+            raise ValueError('Index {} has format {}, expected {}. Rebuild it.'.format(path,
+                                                                                     self.info.get('format'),
+                                                                                     INDEX_FORMAT))
+        if self.kind is not None and self.info.get('kind') != self.kind:
+            self._conn.close()
+            raise ValueError('Index {} is for {}, not {}'.format(path, self.info.get('kind'), self.kind))
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return int(self.info['count'])
+
+    def __contains__(self, org_id):
+        return self._conn.execute('SELECT 1 FROM orgs WHERE id = ?', (org_id,)).fetchone() is not None
+
+    def get(self, org_id):
+        """Return the Organization with org_id, or None."""
+        row = self._conn.execute('SELECT id, name, country, active FROM orgs WHERE id = ?', (org_id,)).fetchone()
+        if row is None:
+            return None
+        names = [name for name, in self._conn.execute('SELECT name FROM names WHERE org = ?', (org_id,))]
+        return Organization(row[0], row[1], row[2], bool(row[3]), names)
+
+    def _candidates(self, query):
+        """Return {rowid: (org, name, norm)} for names sharing the rarest trigrams of query."""
+        tris = list(query)
+        marks = ','.join('?' * len(tris))
+        counts = dict(self._conn.execute('SELECT tri, count FROM trigram_counts WHERE tri IN ({})'.format(marks),
+                                         tris))
+        rare = []
+        postings = 0
+        for tri in sorted(counts, key=counts.get)[:self.QUERY_TRIGRAMS]:
+            if len(rare) >= self.MIN_QUERY_TRIGRAMS and postings + counts[tri] > self.MAX_POSTINGS:
+                break
+            rare.append(tri)
+            postings += counts[tri]
+        if not rare:
+            return {}
+        marks = ','.join('?' * len(rare))
+        rows = self._conn.execute('SELECT names.rowid, org, name, norm FROM names JOIN '
+                                  '(SELECT name AS rowid, COUNT(*) AS hits FROM trigrams '
+                                  ' WHERE tri IN ({}) GROUP BY name ORDER BY hits DESC LIMIT ?) AS best '
+                                  'ON names.rowid = best.rowid'.format(marks),
+                                  rare + [self.CANDIDATES])
+        return {rowid: (org, name, norm) for rowid, org, name, norm in rows}
+
+    def search(self, name, limit=5, min_score=0.5, active_only=True):
+        """Return up to limit NameMatch for the organizations whose names are most similar
+           to name, best first. An exact match after normalization has score 1.
+        args:
+           name: the name to look up.
+           limit: maximum number of organizations to return.
+           min_score: the smallest trigram similarity to return.
+           active_only: if True, organizations that are withdrawn are not suggested.
+        """
+        norm = normalize_name(name)
+        if not norm:
+            return []
+        best = {}
+        for org, org_name in self._conn.execute('SELECT org, name FROM names WHERE norm = ?', (norm,)):
+            best[org] = NameMatch(org, org_name, 1.0)
+        query = trigrams(norm)
+        for org, org_name, cand_norm in self._candidates(query).values():
+            if org in best and best[org].score == 1.0:
+                continue
+            score = _dice(query, trigrams(cand_norm))
+            if score >= min_score and (org not in best or score > best[org].score):
+                best[org] = NameMatch(org, org_name, round(score, 3))
+        if active_only and best:
+            marks = ','.join('?' * len(best))
+            active = {org for org, in self._conn.execute('SELECT id FROM orgs WHERE active AND id IN ({})'.format(marks),
+                                                          list(best))}
+            best = {org: match for org, match in best.items() if org in active}
+        return sorted(best.values(), key=lambda m: (-m.score, m.name))[:limit]
+
+    def search_many(self, names, limit=5, min_score=0.5, active_only=True):
+        """Return a list with the result of search for each of names. Repeated names are
+           only looked up once."""
+        results = {}
+        for name in names:
+            if name not in results:
+                results[name] = self.search(name, limit=limit, min_score=min_score, active_only=active_only)
+        return [results[name] for name in names]
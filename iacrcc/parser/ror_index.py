@@ -0,0 +1,168 @@
+"""
+Offline index of the Research Organization Registry (https://ror.org). parse_meta
+accepts any ror: value, so this is used to check that the ids of affiliations exist,
+and to suggest ids for affiliations that do not have one. The index is built from a
+ROR data dump (https://ror.readme.io/docs/data-dump), which is a zip file containing
+the registry as JSON. Build it from the iacrcc directory with
+
+  python -m parser.ror_index build v1.55-2024-10-31-ror-data.zip ror.db
+
+and check the affiliations of .meta files with
+
+  python -m parser.ror_index check ror.db main.meta ...
+"""
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+import re
+import sys
+import zipfile
+from .name_index import build_name_index, NameIndex, Organization
+from .meta_parse import parse_meta
+
+ROR_PREFIX = 'https://ror.org/'
+
+# Crockford's base32, which ROR uses for ids.
+_BASE32 = '0123456789abcdefghjkmnpqrstvwxyz'
+_ROR_ID = re.compile('0[{}]{{6}}[0-9]{{2}}'.format(_BASE32))
+
+def normalize_ror_id(ror):
+    """Return the 9 character id from a ROR id or URL, or raise ValueError if it is
+       malformed or its checksum is wrong."""
+    ror = ror.strip().lower()
+    for prefix in (ROR_PREFIX, 'http://ror.org/', 'ror.org/'):
+        if ror.startswith(prefix):
+            ror = ror[len(prefix):]
+            break
+    if not _ROR_ID.fullmatch(ror):
+        raise ValueError('Invalid ROR id should match 0xxxxxxdd: ' + ror)
+    number = 0
+    for c in ror[1:7]:
+        number = number * 32 + _BASE32.index(c)
+    if int(ror[7:]) != 98 - (number * 100) % 97:
+        raise ValueError('Invalid ROR id checksum: ' + ror)
+    return ror
+
+def _names_v2(record):
+    display = None
+    names = []
+    for name in record.get('names', []):
+        if 'ror_display' in name.get('types', []):
+            display = name['value']
+        names.append(name['value'])
+    country = None
+    for location in record.get('locations', []):
+        country = location.get('geonames_details', {}).get('country_code')
+        if country:
+            break
+    return display or (names[0] if names else ''), names, country
+
+def _names_v1(record):
+    names = list(record.get('aliases', [])) + list(record.get('acronyms', []))
+    names.extend(label['label'] for label in record.get('labels', []))
+    return record.get('name', ''), names, record.get('country', {}).get('country_code')
+
+def read_ror_records(records):
+    """Yield an Organization for each record of a ROR dump, in schema v1 or v2."""
+    for record in records:
+        if 'names' in record:
+            name, names, country = _names_v2(record)
+        else:
+            name, names, country = _names_v1(record)
+        yield Organization(normalize_ror_id(record['id']),
+                           name,
+                           country,
+                           record.get('status', 'active') == 'active',
+                           names)
+
+def load_ror_dump(path):
+    """Return the list of records from a ROR dump. path may be the zip file that ROR
+       publishes, or the JSON file inside it, optionally compressed with gzip. A zip
+       file with both schemas is read as schema v2."""
+    path = Path(path)
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            members = sorted(name for name in zf.namelist() if name.endswith('.json'))
+            if not members:
+                raise ValueError('No JSON file in ' + str(path))
+            v2 = [name for name in members if 'v2' in name]
+            with zf.open((v2 or members)[0]) as f:
+                return json.load(f)
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='UTF-8') as f:
+            return json.load(f)
+    with path.open(encoding='UTF-8') as f:
+        return json.load(f)
+
+def build_ror_index(dump_path, index_path):
+    """Build an index for RorIndex from a ROR dump. Returns the number of organizations."""
+    return build_name_index(index_path,
+                            read_ror_records(load_ror_dump(dump_path)),
+                            RorIndex.kind,
+                            source=Path(dump_path).name)
+
+class RorIndex(NameIndex):
+    """An index built by build_ror_index. Ids may be given as in .meta files, with or
+       without https://ror.org/.
+    """
+    kind = 'ror'
+
+    def exists(self, ror):
+        """Return True if ror is a well-formed id in the registry."""
+        try:
+            return normalize_ror_id(ror) in self
+        except ValueError:
+            return False
+
+    def check_affiliations(self, affiliations, limit=3, min_score=0.5):
+        """Check the affiliations from parse_meta in bulk.
+        args:
+           affiliations: the list of affiliation dicts.
+           limit, min_score: as for NameIndex.search.
+        Returns:
+           a list with a dict for each affiliation with its name, and status, which is
+           'ok' if the ror is in the registry, 'invalid' if it is malformed, 'unknown'
+           if it is not in the registry, and 'missing' if there is no ror. Unless the
+           status is 'ok', suggestions is a list of NameMatch for the name.
+        """
+        results = [{'name': aff.get('name', '')} for aff in affiliations]
+        unresolved = []
+        for result, aff in zip(results, affiliations):
+            if 'ror' not in aff:
+                result['status'] = 'missing'
+            else:
+                try:
+                    result['status'] = 'ok' if normalize_ror_id(aff['ror']) in self else 'unknown'
+                except ValueError:
+                    result['status'] = 'invalid'
+            if result['status'] != 'ok':
+                unresolved.append(result)
+        suggestions = self.search_many([result['name'] for result in unresolved],
+                                       limit=limit, min_score=min_score)
+        for result, matches in zip(unresolved, suggestions):
+            result['suggestions'] = matches
+        return results
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Offline index of ROR organizations')
+    commands = argparser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='build an index from a ROR data dump')
+    build.add_argument('dump', help='ROR data dump (.zip, .json or .json.gz)')
+    build.add_argument('index', help='file name for the index')
+    check = commands.add_parser('check', help='check the affiliations in .meta files')
+    check.add_argument('index', help='index from build')
+    check.add_argument('meta_files', nargs='+', help='.meta files')
+    args = argparser.parse_args()
+    if args.command == 'build':
+        count = build_ror_index(args.dump, args.index)
+        print('{} organizations'.format(count))
+        sys.exit(0)
+    with RorIndex(args.index) as index:
+        for meta_file in args.meta_files:
+            data = parse_meta(Path(meta_file).read_text(encoding='UTF-8'))
+            for result in index.check_affiliations(data['affiliations']):
+                if 'suggestions' in result:
+                    result['suggestions'] = [match._asdict() for match in result['suggestions']]
+                print(json.dumps(dict(result, path=meta_file)))
@@ -0,0 +1,632 @@
+"""
+Titles of papers on eprint with TeX, and their text as decoded by pylatexenc. They
+are used by the tests of meta_parse and as a corpus by the benchmarks. There are
+near-dups.
+"""
+
+EPRINT_TITLES = {
+    r"On the possibility of basing Cryptography on the assumption that $P \protect \neq  NP$":r"On the possibility of basing Cryptography on the assumption that $P ≠NP$",
+    r"Black-Box Concurrent Zero-Knowledge Requires $\protect \tilde  \Omega (\log n)$ Rounds": r"Black-Box Concurrent Zero-Knowledge Requires $Ω̃(logn)$ Rounds",
+    r"Parallel scalar multiplication on general elliptic curves over $\protect \mathbb  {F}_p$ hedged against Non-Differential Side-Channel Attacks": r"Parallel scalar multiplication on general elliptic curves over $𝔽_p$ hedged against Non-Differential Side-Channel Attacks",
+    r"An Upper Bound on the Size of a Code with the $k$-Identifiable Parent Property": r"An Upper Bound on the Size of a Code with the $k$-Identifiable Parent Property",
+    r"New covering radius of Reed-Muller codes for $t$-resilient functions": r"New covering radius of Reed-Muller codes for $t$-resilient functions",
+    r"Counting Points for Hyperelliptic Curves of type $y^2=x^5+ax$ over Finite Prime Fields": r"Counting Points for Hyperelliptic Curves of type $y^2=x^5+ax$ over Finite Prime Fields",
+    r"Goldbach’s Conjecture on ECDSA Protocols": r"Goldbach’s Conjecture on ECDSA Protocols",
+    r"Isomorphism Classes of Hyperelliptic Curves of Genus 2 over $\protect \mathbb  {F}_{2^n}$": r"Isomorphism Classes of Hyperelliptic Curves of Genus 2 over $𝔽_{2^n}$",
+    r"Point Compression on Jacobians of Hyperelliptic Curves over $F_q$.": r"Point Compression on Jacobians of Hyperelliptic Curves over $F_q$.",
+    r"Redundant Trinomials for Finite Fields of Characteristic $2$": r"Redundant Trinomials for Finite Fields of Characteristic $2$",
+    r"A Dynamic and Differential CMOS Logic Style to Resist Power and Timing Attacks on Security IC’s.": r"A Dynamic and Differential CMOS Logic Style to Resist Power and Timing Attacks on Security IC’s.",
+    r"Charge Recycling Sense Amplifier Based Logic: Securing Low Power Security IC’s against Differential Power Analysis": r"Charge Recycling Sense Amplifier Based Logic: Securing Low Power Security IC’s against Differential Power Analysis",
+    r"The Sorcerer’s Apprentice Guide to Fault Attacks": r"The Sorcerer’s Apprentice Guide to Fault Attacks",
+    r"Classification of genus 2 curves over $\protect \mathbb  {F}_{2^n}$ and optimization of their arithmetic": r"Classification of genus 2 curves over $𝔽_{2^n}$ and optimization of their arithmetic",
+    r"Fast addition on non-hyperelliptic genus $3$ curves": r"Fast addition on non-hyperelliptic genus $3$ curves",
+    r"Suitable Curves for Genus-4 HCC over Prime Fields: Point Counting Formulae for Hyperelliptic Curves of type $y^2=x^{2k+1}+ax$": r"Suitable Curves for Genus-4 HCC over Prime Fields: Point Counting Formulae for Hyperelliptic Curves of type $y^2=x^{2k+1}+ax$",
+    r"Improvement of Thériault Algorithm of Index Calculus for Jacobian of Hyperelliptic Curves of Small Genus": r"Improvement of Thériault Algorithm of Index Calculus for Jacobian of Hyperelliptic Curves of Small Genus",
+    r"Covering Radius of the $(n-3)$-rd Order Reed-Muller Code in the Set of Resilient Functions": r"Covering Radius of the $(n-3)$-rd Order Reed-Muller Code in the Set of Resilient Functions",
+    r"DISTRIBUTION OF R-PATTERNS IN THE KERDOCK-CODE BINARY SEQUENCES AND THE HIGHEST LEVEL SEQUENCES OF PRIMITIVE SEQUENCES OVER $Z_{2^l}$": r"DISTRIBUTION OF R-PATTERNS IN THE KERDOCK-CODE BINARY SEQUENCES AND THE HIGHEST LEVEL SEQUENCES OF PRIMITIVE SEQUENCES OVER $Z_{2^l}$",
+    r"Parallel Montgomery Multiplication in $GF(2^k)$ using Trinomial Residue Arithmetic": r"Parallel Montgomery Multiplication in $GF(2^k)$ using Trinomial Residue Arithmetic",
+    r"Cryptanalysis of Noel McCullagh and Paulo S. L. M. Barreto¡¯s two-party identity-based key agreement": r"Cryptanalysis of Noel McCullagh and Paulo S. L. M. Barreto¡¯s two-party identity-based key agreement",
+    r"A note on López-Dahab coordinates": r"A note on López-Dahab coordinates",
+    r"Equivalent Keys in HFE, C$^*$, and variations": r"Equivalent Keys in HFE, C$^*$, and variations",
+    r"A new security proof for Damgård's ElGamal": r"A new security proof for Damgård's ElGamal",
+    r"A Metric on the Set of Elliptic Curves over ${\protect \mathbf  F}_p$.": r"A Metric on the Set of Elliptic Curves over $𝐅_p$.",
+    r"Comment on cryptanalysis of Tseng et al.¡¦s authenticated encryption schemes": r"Comment on cryptanalysis of Tseng et al.¡¦s authenticated encryption schemes",
+    r"BROADCAST ENCRYPTION $\pi $": r"BROADCAST ENCRYPTION $π$",
+    r"Finding MD5 Collisions – a Toy For a Notebook": r"Finding MD5 Collisions – a Toy For a Notebook",
+    r"Cryptographer's Toolkit for Construction of $8$-Bit Bent Functions": r"Cryptographer's Toolkit for Construction of $8$-Bit Bent Functions",
+    r"Almost Perfect Nonlinear Monomials over GF($2^n$) for Infinitely Many $n$": r"Almost Perfect Nonlinear Monomials over GF($2^n$) for Infinitely Many $n$",
+    r"A Uniform Framework for Cryptanalysis of the Bluetooth $E_0$ Cipher": r"A Uniform Framework for Cryptanalysis of the Bluetooth $E_0$ Cipher",
+    r"Secret sharing on the $d$-dimensional cube": r"Secret sharing on the $d$-dimensional cube",
+    r"Minimality of the Hamming Weight of the \tau -NAF for Koblitz Curves and Improved Combination with Point Halving": r"Minimality of the Hamming Weight of the τ-NAF for Koblitz Curves and Improved Combination with Point Halving",
+    r"On the binary sequences with high $GF(2)$ linear complexities and low $GF(p)$ linear complexities": r"On the binary sequences with high $GF(2)$ linear complexities and low $GF(p)$ linear complexities",
+    r"Efficient reduction of 1 out of $n$ oblivious transfers in random oracle model": r"Efficient reduction of 1 out of $n$ oblivious transfers in random oracle model",
+    r"Classification of Cubic $(n-4)$-resilient Boolean Functions": r"Classification of Cubic $(n-4)$-resilient Boolean Functions",
+    r"Secure and {\protect \sl  Practical} Identity-Based Encryption": r"Secure and {Practical} Identity-Based Encryption",
+    r"Key Mixing in Block Ciphers through Addition modulo $2^n$": r"Key Mixing in Block Ciphers through Addition modulo $2^n$",
+    r"Unified Point Addition Formulæ and Side-Channel Attacks": r"Unified Point Addition Formulæ and Side-Channel Attacks",
+    r"Improvement of Manik et al.¡¦s remote user authentication scheme": r"Improvement of Manik et al.¡¦s remote user authentication scheme",
+    r"Weakness of shim¡¦s New ID-based tripartite multiple-key agreement protocol": r"Weakness of shim¡¦s New ID-based tripartite multiple-key agreement protocol",
+    r"Gröbner Basis Based Cryptanalysis of SHA-1": r"Gröbner Basis Based Cryptanalysis of SHA-1",
+    r"Low Complexity Bit-Parallel Square Root Computation over GF($2^m$) for all Trinomials": r"Low Complexity Bit-Parallel Square Root Computation over GF($2^m$) for all Trinomials",
+    r"The Design Principle of Hash Function with Merkle-Damgård Construction": r"The Design Principle of Hash Function with Merkle-Damgård Construction",
+    r"Divisibility of the Hamming Weight by $2^k$ and Monomial Criteria for Boolean Functions": r"Divisibility of the Hamming Weight by $2^k$ and Monomial Criteria for Boolean Functions",
+    r"There exist Boolean functions on $n$ (odd) variables having nonlinearity $> 2^{n-1} - 2^{\protect \frac  {n-1}{2}}$ if and only if $n > 7$": r"There exist Boolean functions on $n$ (odd) variables having nonlinearity $> 2^{n-1} - 2^{{n-1}/2}$ if and only if $n > 7$",
+    r"Tate pairing for $y^{2}=x^{5}-\alpha x$ in characteristic five": r"Tate pairing for $y^2=x^5-αx$ in characteristic five",
+    r"On (Hierarchical) Identity Based Encryption Protocols with Short Public Parameters \\ (With an Exposition of Waters' Artificial Abort Technique)": r"On (Hierarchical) Identity Based Encryption Protocols with Short Public Parameters   (With an Exposition of Waters' Artificial Abort Technique)",
+    r"An Algorithm for the $\eta _T$ Pairing Calculation in Characteristic Three and its Hardware Implementation": r"An Algorithm for the $η_T$ Pairing Calculation in Characteristic Three and its Hardware Implementation",
+    r"RadioGatún, a belt-and-mill hash function": r"RadioGatún, a belt-and-mill hash function",
+    r"Hardware Implementation of the $\eta _T$ Pairing in Characteristic 3": r"Hardware Implementation of the $η_T$ Pairing in Characteristic 3",
+    r"Another class of quadratic APN binomials over $F_{2^n}$: the case $n$ divisible by 4": r"Another class of quadratic APN binomials over $F_{2^n}$: the case $n$ divisible by 4",
+    r"Some Efficient Algorithms for the Final Exponentiation of $\eta _T$ Pairing": r"Some Efficient Algorithms for the Final Exponentiation of $η_T$ Pairing",
+    r"How to Win the Clone Wars: \\ Efficient Periodic n-Times Anonymous Authentication": r"How to Win the Clone Wars:   Efficient Periodic n-Times Anonymous Authentication",
+    r"Cryptanalysis of Hwang-Chang’s a Time-Stamp Protocol for Digital Watermarking": r"Cryptanalysis of Hwang-Chang’s a Time-Stamp Protocol for Digital Watermarking",
+    r"A Coprocessor for the Final Exponentiation of the $\eta _T$ Pairing in Characteristic Three": r"A Coprocessor for the Final Exponentiation of the $η_T$ Pairing in Characteristic Three",
+    r"High Efficiency Feedback Shift Register: $\sigma -$LFSR": r"High Efficiency Feedback Shift Register: $σ-$LFSR",
+    r"The constructing of $3$-resilient Boolean functions of $9$ variables with nonlinearity $240$.": r"The constructing of $3$-resilient Boolean functions of $9$ variables with nonlinearity $240$.",
+    r"Voting with Unconditional Privacy by Merging Prêt-à-Voter and PunchScan": r"Voting with Unconditional Privacy by Merging Prêt-à-Voter and PunchScan",
+    r"A Refined Algorithm for the $\eta _T$ Pairing Calculation in Characteristic Three": r"A Refined Algorithm for the $η_T$ Pairing Calculation in Characteristic Three",
+    r"SECURITY PROOF FOR SHENGBAO WANG’S IDENTITY-BASED ENCRYPTION SCHEME": r"SECURITY PROOF FOR SHENGBAO WANG’S IDENTITY-BASED ENCRYPTION SCHEME",
+    r"On the Big Gap Between $|p|$ and $|q|$ in DSA": r"On the Big Gap Between $|p|$ and $|q|$ in DSA",
+    r"Secure PRNGs from Specialized Polynomial Maps over Any $F_q$": r"Secure PRNGs from Specialized Polynomial Maps over Any $F_q$",
+    r"Algorithms and Arithmetic Operators for Computing the $\eta _T$ Pairing in Characteristic Three": r"Algorithms and Arithmetic Operators for Computing the $η_T$ Pairing in Characteristic Three",
+    r"Computing the Ate Pairing on Elliptic Curves with Embedding Degree $k=9$": r"Computing the Ate Pairing on Elliptic Curves with Embedding Degree $k=9$",
+    r"Notes on the Wang et al. $2^{63}$ SHA-1 Differential Path": r"Notes on the Wang et al. $2^{63}$ SHA-1 Differential Path",
+    r"A Proof of Security in $O(2^n)$ for the Xor of Two Random Permutations\\ -- Proof with the ``$H_{\sigma }$ technique''--": r"A Proof of Security in $O(2^n)$ for the Xor of Two Random Permutations  – Proof with the “$H_σ$ technique”–",
+    r"Pairing-friendly Hyperelliptic Curves with Ordinary Jacobians of Type $y^2=x^5+ax$": r"Pairing-friendly Hyperelliptic Curves with Ordinary Jacobians of Type $y^2=x^5+ax$",
+    r"Merkle's Key Agreement Protocol is Optimal: An $O(n^2)$ Attack on any Key Agreement from Random Oracles": r"Merkle's Key Agreement Protocol is Optimal: An $O(n^2)$ Attack on any Key Agreement from Random Oracles",
+    r"A Comparison Between Hardware Accelerators for the Modified Tate Pairing over $\protect \mathbb  {F}_{2^m}$ and $\protect \mathbb  {F}_{3^m}$": r"A Comparison Between Hardware Accelerators for the Modified Tate Pairing over $𝔽_{2^m}$ and $𝔽_{3^m}$",
+    r"TinyECCK: Efficient Elliptic Curve Cryptography Implementation over $GF(2^m)$ on 8-bit MICAz Mote": r"TinyECCK: Efficient Elliptic Curve Cryptography Implementation over $GF(2^m)$ on 8-bit MICAz Mote",
+    r"A Pipelined Karatsuba-Ofman Multiplier over GF($3^{97}$) Amenable for Pairing Computation": r"A Pipelined Karatsuba-Ofman Multiplier over GF($3^{97}$) Amenable for Pairing Computation",
+    r"Constant-Size Dynamic $k$-TAA": r"Constant-Size Dynamic $k$-TAA",
+    r"Redundant $\tau $-adic Expansions I: Non-Adjacent Digit Sets and their Applications to Scalar Multiplication": r"Redundant $τ$-adic Expansions I: Non-Adjacent Digit Sets and their Applications to Scalar Multiplication",
+    r"Redundant $\tau $-adic Expansions II: Non-Optimality and Chaotic Behaviour": r"Redundant $τ$-adic Expansions II: Non-Optimality and Chaotic Behaviour",
+    r"On The Security of The ElGamal Encryption Scheme and Damgard’s Variant": r"On The Security of The ElGamal Encryption Scheme and Damgard’s Variant",
+    r"Polynomials for Ate Pairing and $\protect \mathbf  {Ate}_{i}$ Pairing": r"Polynomials for Ate Pairing and $𝐀𝐭𝐞_i$ Pairing",
+    r"Remarks on the Attack of Fouque et al. against the {\ell }IC Scheme": r"Remarks on the Attack of Fouque et al. against the ℓIC Scheme",
+    r"On the CCA1-Security of Elgamal and Damgård's Elgamal": r"On the CCA1-Security of Elgamal and Damgård's Elgamal",
+    r"ON MIDDLE UNIVERSAL $m$-INVERSE QUASIGROUPS AND THEIR APPLICATIONS TO CRYPTOGRAPHY": r"ON MIDDLE UNIVERSAL $m$-INVERSE QUASIGROUPS AND THEIR APPLICATIONS TO CRYPTOGRAPHY",
+    r"FPGA and ASIC Implementations of the $\eta _T$ Pairing in Characteristic Three": r"FPGA and ASIC Implementations of the $η_T$ Pairing in Characteristic Three",
+    r"Foundations of Group Key Management – Framework, Security Model and a Generic Construction": r"Foundations of Group Key Management – Framework, Security Model and a Generic Construction",
+    r"A New $(k,n)$-Threshold Secret Sharing Scheme and Its Extension": r"A New $(k,n)$-Threshold Secret Sharing Scheme and Its Extension",
+    r"Generalized Universal Circuits for Secure Evaluation of Private Functions with Application to Data Classification": r"Generalized Universal Circuits for Secure Evaluation of Private Functions with Application to Data Classification",
+    r"The $F_f$-Family of Protocols for RFID-Privacy and Authentication": r"The $F_f$-Family of Protocols for RFID-Privacy and Authentication",
+    r"The $n^c$-Unique Shortest Vector Problem is Hard": r"The $n^c$-Unique Shortest Vector Problem is Hard",
+    r"A NEW HASH ALGORITHM$:$ Khichidi$-$1": r"A NEW HASH ALGORITHM$:$ Khichidi$-$1",
+    r"A Fast Implementation of $\eta _T$ Pairing in Characteristic Three on Intel Core 2 Duo Processor": r"A Fast Implementation of $η_T$ Pairing in Characteristic Three on Intel Core 2 Duo Processor",
+    r"How to Prove the Security of Practical Cryptosystems with Merkle-Damgård Hashing by Adopting Indifferentiability": r"How to Prove the Security of Practical Cryptosystems with Merkle-Damgård Hashing by Adopting Indifferentiability",
+    r"Low Complexity Cubing and Cube Root Computation over $F_{3^m}$ in Polynomial Basis": r"Low Complexity Cubing and Cube Root Computation over $F_{3^m}$ in Polynomial Basis",
+    r"Practical Key Recovery Attack against Secret-preﬁx Edon-R": r"Practical Key Recovery Attack against Secret-preﬁx Edon-R",
+    r"A new bound for t−wise almost universal hash functions": r"A new bound for t−wise almost universal hash functions",
+    r"Indifferentiability with Distinguishers: Why Shabal\\Does Not Require Ideal Ciphers": r"Indifferentiability with Distinguishers: Why Shabal Does Not Require Ideal Ciphers",
+    r"Hardware Implementations of a Variant of the Zémor-Tillich Hash Function: Can a Provably Secure Hash Function be very efficient ?": r"Hardware Implementations of a Variant of the Zémor-Tillich Hash Function: Can a Provably Secure Hash Function be very efficient ?",
+    r"On the Randomness and Regularity of Reduced EDON-$\protect \mathcal  {R}$ Compression Function": r"On the Randomness and Regularity of Reduced EDON-$ℛ$ Compression Function",
+    r"Differential Path for SHA-1 with complexity $O(2^{52})$": r"Differential Path for SHA-1 with complexity $O(2^{52})$",
+    r"Algebraic Attacks specialized to \protect \(\protect \mathbb  {F}_2\protect \) (Diplomarbeit)": r"Algebraic Attacks specialized to \(𝔽_2\) (Diplomarbeit)",
+    r"FPGA Implementations of SHA-3 Candidates:CubeHash, Grøstl, L{\protect \sc  ane}, Shabal and Spectral Hash": r"FPGA Implementations of SHA-3 Candidates:CubeHash, Grøstl, L{ane}, Shabal and Spectral Hash",
+    r"Compact Hardware Implementations of the SHA-3 Candidates ARIRANG, BLAKE, Grøstl, and Skein": r"Compact Hardware Implementations of the SHA-3 Candidates ARIRANG, BLAKE, Grøstl, and Skein",
+    r"Cryptanalysis of the Tillich-Zémor hash function": r"Cryptanalysis of the Tillich-Zémor hash function",
+    r"A short Note on Discrete Log Problem in $\protect \mathbb  {F_p}$": r"A short Note on Discrete Log Problem in $𝔽_𝕡$",
+    r"Permutation Polynomials modulo $p^n$": r"Permutation Polynomials modulo $p^n$",
+    r"Fast Architectures for the $\eta _T$ Pairing over Small-Characteristic Supersingular Elliptic Curves": r"Fast Architectures for the $η_T$ Pairing over Small-Characteristic Supersingular Elliptic Curves",
+    r"A Secure and Efficient Authenticated Diffie–Hellman Protocol": r"A Secure and Efficient Authenticated Diffie–Hellman Protocol",
+    r"Ntr¹u-like Public Key Cryptosystems beyond Dedekind Domain Up to Alternative Algebra": r"Ntr¹u-like Public Key Cryptosystems beyond Dedekind Domain Up to Alternative Algebra",
+    r"Improving the Berlekamp algorithm for binomials \protect \boldmath  $x^{n} - a$": r"Improving the Berlekamp algorithm for binomials $x^n - a$",
+    r"On Cryptographic Protocols Employing Asymmetric Pairings -- The Role of $\Psi $ Revisited": r"On Cryptographic Protocols Employing Asymmetric Pairings – The Role of $Ψ$ Revisited",
+    r"Eﬃcient Privacy-Preserving Face Recognition": r"Eﬃcient Privacy-Preserving Face Recognition",
+    r"High-Speed Hardware Implementations of BLAKE, Blue Midnight Wish, CubeHash, ECHO, Fugue, Grøstl, Hamsi, JH, Keccak, Luffa, Shabal, SHAvite-3, SIMD, and Skein": r"High-Speed Hardware Implementations of BLAKE, Blue Midnight Wish, CubeHash, ECHO, Fugue, Grøstl, Hamsi, JH, Keccak, Luffa, Shabal, SHAvite-3, SIMD, and Skein",
+    r"A Family of $p$-ary Binomial Bent Functions": r"A Family of $p$-ary Binomial Bent Functions",
+    r"A complete set of addition laws\\for incomplete Edwards curves": r"A complete set of addition laws for incomplete Edwards curves",
+    r"Efficiency Limitations for $\Sigma $-Protocols for Group Homomorphisms": r"Efficiency Limitations for $Σ$-Protocols for Group Homomorphisms",
+    r"Reducing Elliptic Curve Logarithm to Logarithm in a Finite Field $\protect \mathbb  {F}_q$ for Some Orders": r"Reducing Elliptic Curve Logarithm to Logarithm in a Finite Field $𝔽_q$ for Some Orders",
+    r"On the order of the polynomial $x^p-x-a$": r"On the order of the polynomial $x^p-x-a$",
+    r"Constructing Veriﬁable Random Functions with Large Input Spaces": r"Constructing Veriﬁable Random Functions with Large Input Spaces",
+    r"On zero practical significance of “Key recovery attack on full GOST block cipher with zero time and memory”": r"On zero practical significance of “Key recovery attack on full GOST block cipher with zero time and memory”",
+    r"On The Broadcast and Validity-Checking Security of PKCS \#1 v1.5 Encryption": r"On The Broadcast and Validity-Checking Security of PKCS #1 v1.5 Encryption",
+    r"Elliptic Curve Discrete Logarithm Problem over Small Degree Extension Fields. Application to the static Diffie-Hellman problem on $E(F_{q^5})$": r"Elliptic Curve Discrete Logarithm Problem over Small Degree Extension Fields. Application to the static Diffie-Hellman problem on $E(F_{q^5})$",
+    r"New Methods to Construct Golay Complementary Sequences Over the $QAM$ Constellation": r"New Methods to Construct Golay Complementary Sequences Over the $QAM$ Constellation",
+    r"A Framework for Fully-Simulatable $t$-out-of-$n$ Oblivious Transfer": r"A Framework for Fully-Simulatable $t$-out-of-$n$ Oblivious Transfer",
+    r"A Security Weakness in Composite-Order Pairing-Based Protocols with Imbedding Degree $k>2$": r"A Security Weakness in Composite-Order Pairing-Based Protocols with Imbedding Degree $k>2$",
+    r"On second-order nonlinearities of some $\protect \mathcal  {D}_0$ type bent functions": r"On second-order nonlinearities of some $𝒟_0$ type bent functions",
+    r"On the Indifferentiability of the Grøstl Hash Function": r"On the Indifferentiability of the Grøstl Hash Function",
+    r"The analytical property for $\zeta (s)$": r"The analytical property for $ζ(s)$",
+    r"Combining leak--resistant arithmetic for elliptic curves defined over $F_p$ and RNS representation": r"Combining leak–resistant arithmetic for elliptic curves defined over $F_p$ and RNS representation",
+    r"Fast Exhaustive Search for Polynomial Systems in $F_2$": r"Fast Exhaustive Search for Polynomial Systems in $F_2$",
+    r"A Certifying Compiler for Zero-Knowledge Proofs of Knowledge Based on $\Sigma $-Protocols": r"A Certifying Compiler for Zero-Knowledge Proofs of Knowledge Based on $Σ$-Protocols",
+    r"Decoding square-free Goppa codes over $F_p$": r"Decoding square-free Goppa codes over $F_p$",
+    r"Improved Collision Attacks on the Reduced-Round Grøstl Hash Function": r"Improved Collision Attacks on the Reduced-Round Grøstl Hash Function",
+    r"First-Order Side-Channel Attacks on the Permutation Tables Countermeasure –Extended Version–": r"First-Order Side-Channel Attacks on the Permutation Tables Countermeasure –Extended Version–",
+    r"Perfectly Balanced Boolean Functions and Golić Conjecture": r"Perfectly Balanced Boolean Functions and Golić Conjecture",
+    r"Cryptanalysis and Improvement of A New Electronic Traveler’s Check Scheme Based on One-way Hash Function": r"Cryptanalysis and Improvement of A New Electronic Traveler’s Check Scheme Based on One-way Hash Function",
+    r"Two Attacks on Dutta’s Dynamic Group Key Agreement Protocol": r"Two Attacks on Dutta’s Dynamic Group Key Agreement Protocol",
+    r"Eﬃcient Fully Secure Predicate Encryption for Conjunctions, Disjunctions and k-CNF/DNF formulae": r"Eﬃcient Fully Secure Predicate Encryption for Conjunctions, Disjunctions and k-CNF/DNF formulae",
+    r"Number formula and degree level of ergodic polynomial functions over $\protect \mathbb  {Z}$/$2^{n}\protect \mathbb  {Z}$ and generalized result of linear equation on ergodic power-series T-Function": r"Number formula and degree level of ergodic polynomial functions over $ℤ$/$2^nℤ$ and generalized result of linear equation on ergodic power-series T-Function",
+    r"Linear Approximations of Addition Modulo $2^n$-1": r"Linear Approximations of Addition Modulo $2^n$-1",
+    r"RNS arithmetic in ${\protect \mathbb  F}_{p^k}$ and application to fast pairing computation": r"RNS arithmetic in $𝔽_{p^k}$ and application to fast pairing computation",
+    r"On permutation polynomials EA-equivalent to the inverse function over $GF(2^n)$": r"On permutation polynomials EA-equivalent to the inverse function over $GF(2^n)$",
+    r"Fast Algorithm to solve a family of SIS problem with $l_\infty $ norm": r"Fast Algorithm to solve a family of SIS problem with $l_∞$ norm",
+    r"Enumerating Results of Homogeneous Rotation over $GF(p)$": r"Enumerating Results of Homogeneous Rotation over $GF(p)$",
+    r"Practical Frameworks For $h$-Out-Of-$n$ Oblivious Transfer With Security Against Covert and Malicious Adversaries": r"Practical Frameworks For $h$-Out-Of-$n$ Oblivious Transfer With Security Against Covert and Malicious Adversaries",
+    r"Cover and Decomposition Index Calculus on Elliptic Curves made practical. Application to a seemingly secure curve over $F_{p^6}$": r"Cover and Decomposition Index Calculus on Elliptic Curves made practical. Application to a seemingly secure curve over $F_{p^6}$",
+    r"A Construction of A New Class of Knapsack-Type Public Key Cryptosystem, K(III)$\Sigma $PKC": r"A Construction of A New Class of Knapsack-Type Public Key Cryptosystem, K(III)$Σ$PKC",
+    r"Ergodic Theory Over ${F}_2[[T]]$": r"Ergodic Theory Over $F_2[[T]]$",
+    r"Linear Diophantine Equation Discrete Log Problem, Matrix Decomposition Problem and the AA{\beta }-cryptosystem": r"Linear Diophantine Equation Discrete Log Problem, Matrix Decomposition Problem and the AAβ-cryptosystem",
+    r"On the relation between the MXL family of algorithms and Gröbner basis algorithms": r"On the relation between the MXL family of algorithms and Gröbner basis algorithms",
+    r"Security Analysis of $LMAP^{++}$, an RFID Authentication Protocol": r"Security Analysis of $LMAP^{++}$, an RFID Authentication Protocol",
+    r"Cryptanalysis of Chen \protect \textit  {et al.}'s RFID Access Control Protocol": r"Cryptanalysis of Chen et al.'s RFID Access Control Protocol",
+    r"Security \& Indistinguishability in the Presence of Traffic Analysis": r"Security & Indistinguishability in the Presence of Traffic Analysis",
+    r"Exploiting Linear Hull in Matsui’s Algorithm 1 (extended version)": r"Exploiting Linear Hull in Matsui’s Algorithm 1 (extended version)",
+    r"Scalar Multiplication on Koblitz Curves using $\tau ^2-$NAF": r"Scalar Multiplication on Koblitz Curves using $τ^2-$NAF",
+    r"Cryptanalysis of the Smart-Vercauteren and Gentry-Halevi’s Fully Homomorphic Encryption": r"Cryptanalysis of the Smart-Vercauteren and Gentry-Halevi’s Fully Homomorphic Encryption",
+    r"Simple and Asymptotically Optimal $t$-Cheater Identifiable Secret Sharing Scheme": r"Simple and Asymptotically Optimal $t$-Cheater Identifiable Secret Sharing Scheme",
+    r"Cryptanalysis of Cho \protect \textit  {et al.}'s Protocol, A Hash-Based Mutual Authentication Protocol for RFID Systems": r"Cryptanalysis of Cho et al.'s Protocol, A Hash-Based Mutual Authentication Protocol for RFID Systems",
+    r"$HB^N$: An HB-like protocol secure against man-in-the-middle attacks": r"$HB^N$: An HB-like protocol secure against man-in-the-middle attacks",
+    r"Cryptanalysis of the $AA_{\beta }$ Cryptosystem based on Linear Diophantine Equation Discrete Log Problem": r"Cryptanalysis of the $AA_β$ Cryptosystem based on Linear Diophantine Equation Discrete Log Problem",
+    r"High-Entropy Visual Identiﬁcation for Touch Screen Devices": r"High-Entropy Visual Identiﬁcation for Touch Screen Devices",
+    r"The Value $4$ of Binary Kloosterman Sums": r"The Value $4$ of Binary Kloosterman Sums",
+    r"A representation of the $p$-sylow subgroup of $PERM(F_p^n)$ and a cryptographic application": r"A representation of the $p$-sylow subgroup of $PERM(F_p^n)$ and a cryptographic application",
+    r"Cryptanalysis of improved Yeh \protect \textit  {et al. }'s authentication Protocol: An EPC Class-1 Generation-2 standard compliant protocol": r"Cryptanalysis of improved Yeh et al. 's authentication Protocol: An EPC Class-1 Generation-2 standard compliant protocol",
+    r"On the influence of the algebraic degree of $F^{−1}$ on the algebraic degree of $G \circ F$": r"On the influence of the algebraic degree of $F^{−1}$ on the algebraic degree of $G ∘F$",
+    r"Efficient Implementation of the $\eta _T$ Pairing on GPU": r"Efficient Implementation of the $η_T$ Pairing on GPU",
+    r"Randomness Extraction in finite fields $\protect \mathbb  {F}_{p^{n}}$": r"Randomness Extraction in finite fields $𝔽_{p^n}$",
+    r"Impact of Intel's New Instruction Sets on Software Implementation of $GF(2)[x]$ Multiplication": r"Impact of Intel's New Instruction Sets on Software Implementation of $GF(2)[x]$ Multiplication",
+    r"Receipt Freeness of Prêt à Voter Provably Secure": r"Receipt Freeness of Prêt à Voter Provably Secure",
+    r"New Subexponential Algorithms for Factoring in $SL(2,F_q)$": r"New Subexponential Algorithms for Factoring in $SL(2,F_q)$",
+    r"$GF(2^{n})$ Subquadratic Polynomial Basis Multipliers for Some Irreducible Trinomials": r"$GF(2^n)$ Subquadratic Polynomial Basis Multipliers for Some Irreducible Trinomials",
+    r"A Scalable Method for Constructing Galois NLFSRs with Period $2^n-1$ using Cross-Join Pairs": r"A Scalable Method for Constructing Galois NLFSRs with Period $2^n-1$ using Cross-Join Pairs",
+    r"Constructing differentially 4-uniform permutations over $MBF_{2^{2m}}$ from quadratic APN permutations over $MBF_{2^{2m+1}}$": r"Constructing differentially 4-uniform permutations over $MBF_{2^{2m}}$ from quadratic APN permutations over $MBF_{2^{2m+1}}$",
+    r"Breaking $H^2$-MAC Using Birthday Paradox": r"Breaking $H^2$-MAC Using Birthday Paradox",
+    r"On the security of Lo et al.’s ownership transfer protocol": r"On the security of Lo et al.’s ownership transfer protocol",
+    r"Decoding Random Binary Linear Codes in $2^{n/20}$: How $1+1=0$ Improves Information Set Decoding": r"Decoding Random Binary Linear Codes in $2^{n/20}$: How $1+1=0$ Improves Information Set Decoding",
+    r"Some results on $q$-ary bent functions": r"Some results on $q$-ary bent functions",
+    r"Key Length Estimation of Pairing-based Cryptosystems using $\eta _T$ Pairing": r"Key Length Estimation of Pairing-based Cryptosystems using $η_T$ Pairing",
+    r"Modified version of “Latin Dances Revisited: New Analytic Results of Salsa20 and ChaCha”": r"Modified version of “Latin Dances Revisited: New Analytic Results of Salsa20 and ChaCha”",
+    r"Construction of the Tsujii-Shamir-Kasahara (TSK) Type Multivariate Public Key Cryptosystem, which relies on the Diﬃculty of Prime Factorization": r"Construction of the Tsujii-Shamir-Kasahara (TSK) Type Multivariate Public Key Cryptosystem, which relies on the Diﬃculty of Prime Factorization",
+    r"(Pseudo) Preimage Attack on Round-Reduced Grøstl Hash Function and Others (Extended Version)": r"(Pseudo) Preimage Attack on Round-Reduced Grøstl Hash Function and Others (Extended Version)",
+    r"Adaptive Preimage Resistance Analysis Revisited:\\ Requirements, Subtleties and Implications": r"Adaptive Preimage Resistance Analysis Revisited:  Requirements, Subtleties and Implications",
+    r"A General Construction for 1-round $\delta $-RMT and (0, $\delta $)-SMT": r"A General Construction for 1-round $δ$-RMT and (0, $δ$)-SMT",
+    r"New Transference Theorems on Lattices Possessing n^\epsilon -unique Shortest Vectors": r"New Transference Theorems on Lattices Possessing n^ϵ-unique Shortest Vectors",
+    r"Construction of New Classes of Knapsack Type Public Key Cryptosystem Using Uniform Secret Sequence, K(II)$\Sigma \Pi $PKC, Constructed Based on Maximum Length Code": r"Construction of New Classes of Knapsack Type Public Key Cryptosystem Using Uniform Secret Sequence, K(II)$ΣΠ$PKC, Constructed Based on Maximum Length Code",
+    r"Breaking pairing-based cryptosystems using $\eta _T$ pairing over $GF(3^{97})$": r"Breaking pairing-based cryptosystems using $η_T$ pairing over $GF(3^{97})$",
+    r"Multiple Differential Cryptanalysis using LLRand $\chi ^2$ Statistics": r"Multiple Differential Cryptanalysis using LLRand $χ^2$ Statistics",
+    r"CCBKE – Session Key Negotiation for Fast and Secure Scheduling of Scientific Applications in Cloud Computing": r"CCBKE – Session Key Negotiation for Fast and Secure Scheduling of Scientific Applications in Cloud Computing",
+    r"Cryptanalysis of Sood et al.’s Authentication Scheme using Smart Cards": r"Cryptanalysis of Sood et al.’s Authentication Scheme using Smart Cards",
+    r"On second-order nonlinearity and maximum algebraic immunity of some bent functions in $c^PS^+$": r"On second-order nonlinearity and maximum algebraic immunity of some bent functions in $c^PS^+$",
+    r"Low complexity bit-parallel $GF(2^m)$ multiplier for all-one polynomials": r"Low complexity bit-parallel $GF(2^m)$ multiplier for all-one polynomials",
+    r"A note on ‘An efficient certificateless aggregate signature with constant pairing computations’": r"A note on ‘An efficient certificateless aggregate signature with constant pairing computations’",
+    r"On the Simplicity of Converting Leakages from Multivariate to Univariate – Case Study of a Glitch-Resistant Masking Scheme –": r"On the Simplicity of Converting Leakages from Multivariate to Univariate – Case Study of a Glitch-Resistant Masking Scheme –",
+    r"Tahoe – The Least-Authority Filesystem": r"Tahoe – The Least-Authority Filesystem",
+    r"A Low-Area Unified Hardware Architecture for the AES and the Cryptographic Hash Function Grøstl": r"A Low-Area Unified Hardware Architecture for the AES and the Cryptographic Hash Function Grøstl",
+    r"Bit-Parallel $GF(2^{n})$ Squarer Using Shifted Polynomial Basis": r"Bit-Parallel $GF(2^n)$ Squarer Using Shifted Polynomial Basis",
+    r"Practical Covertly Secure MPC for Dishonest Majority – or: Breaking the SPDZ Limits": r"Practical Covertly Secure MPC for Dishonest Majority – or: Breaking the SPDZ Limits",
+    r"Asynchronous Physical Unclonable Functions – AsyncPUF": r"Asynchronous Physical Unclonable Functions – AsyncPUF",
+    r"Uniform Compression Functions Can Fail to Preserve “Full” Entropy": r"Uniform Compression Functions Can Fail to Preserve “Full” Entropy",
+    r"Estimating the Φ(n) of Upper/Lower Bound in its RSA Cryptosystem": r"Estimating the Φ(n) of Upper/Lower Bound in its RSA Cryptosystem",
+    r"Improved (Pseudo) Preimage Attack and Second Preimage Attack on Round-Reduced Grøstl": r"Improved (Pseudo) Preimage Attack and Second Preimage Attack on Round-Reduced Grøstl",
+    r"New Impossible Differential Attack on $\protect \text  {SAFER}_{+}$ and $\protect \text  {SAFER}_{++}$": r"New Impossible Differential Attack on $SAFER_+$ and $SAFER_{++}$",
+    r"On the Function Field Sieve and the Impact of Higher Splitting Probabilities: Application to Discrete Logarithms in $F_{2^{1971}}$ and $F_{2^{3164}}$": r"On the Function Field Sieve and the Impact of Higher Splitting Probabilities: Application to Discrete Logarithms in $F_{2^{1971}}$ and $F_{2^{3164}}$",
+    r"A new index calculus algorithm with complexity $L(1/4+o(1))$ in very small characteristic": r"A new index calculus algorithm with complexity $L(1/4+o(1))$ in very small characteristic",
+    r"Cryptanalysis of Some Double-Block-Length Hash Modes of Block Ciphers with $n$-Bit Block and $n$-Bit Key": r"Cryptanalysis of Some Double-Block-Length Hash Modes of Block Ciphers with $n$-Bit Block and $n$-Bit Key",
+    r"A New Class of Product-sum Type Public Key Cryptosystem,K(V)$\Sigma \Pi $PKC,Constructed Based on Maximum Length Code": r"A New Class of Product-sum Type Public Key Cryptosystem,K(V)$ΣΠ$PKC,Constructed Based on Maximum Length Code",
+    r"Practical and Employable Protocols for UC-Secure Circuit Evaluation over $Z_n$": r"Practical and Employable Protocols for UC-Secure Circuit Evaluation over $Z_n$",
+    r"Attacks on JH, Grøstl and SMASH Hash Functions": r"Attacks on JH, Grøstl and SMASH Hash Functions",
+    r"Adapting Lyubashevsky’s Signature Schemes to the Ring Signature Setting": r"Adapting Lyubashevsky’s Signature Schemes to the Ring Signature Setting",
+    r"Theory of masking with codewords in hardware: low-weight $d$th-order correlation-immune Boolean functions": r"Theory of masking with codewords in hardware: low-weight $d$th-order correlation-immune Boolean functions",
+    r"Solving a $6120$-bit DLP on a Desktop Computer": r"Solving a $6120$-bit DLP on a Desktop Computer",
+    r"Security in $O(2^n)$ for the Xor of Two Random Permutations\\ -- Proof with the standard $H$ technique--": r"Security in $O(2^n)$ for the Xor of Two Random Permutations  – Proof with the standard $H$ technique–",
+    r"Breaking the Even-Mansour Hash Function: Collision and Preimage Attacks on JH and Grøstl": r"Breaking the Even-Mansour Hash Function: Collision and Preimage Attacks on JH and Grøstl",
+    r"Efficient Cryptosystems From $2^k$-th Power Residue Symbols": r"Efficient Cryptosystems From $2^k$-th Power Residue Symbols",
+    r"Fast Exhaustive Search for Quadratic Systems in $\protect \mathbb  {F}_2$ on FPGAs --- Extended Version": r"Fast Exhaustive Search for Quadratic Systems in $𝔽_2$ on FPGAs — Extended Version",
+    r"Revisiting Conditional Rényi Entropies and Generalizing Shannon's Bounds in Information Theoretically Secure Encryption": r"Revisiting Conditional Rényi Entropies and Generalizing Shannon's Bounds in Information Theoretically Secure Encryption",
+    r"Multi-Valued Byzantine Broadcast: the $t < n$ Case": r"Multi-Valued Byzantine Broadcast: the $t < n$ Case",
+    r"Self-pairings on supersingular elliptic curves with embedding degree $three$": r"Self-pairings on supersingular elliptic curves with embedding degree $three$",
+    r"More Efficient Cryptosystems From $k^{th}$-Power Residues": r"More Efficient Cryptosystems From $k^{th}$-Power Residues",
+    r"The Special Number Field Sieve in $F_{p^{n}}$, Application to Pairing-Friendly Constructions": r"The Special Number Field Sieve in $F_{p^n}$, Application to Pairing-Friendly Constructions",
+    r"Solving the Elliptic Curve Discrete Logarithm Problem Using Semaev Polynomials, Weil Descent and Gröbner Basis Methods -- an Experimental Study": r"Solving the Elliptic Curve Discrete Logarithm Problem Using Semaev Polynomials, Weil Descent and Gröbner Basis Methods – an Experimental Study",
+    r"Some results concerning global avalanche characteristics of two $q$-ary functions": r"Some results concerning global avalanche characteristics of two $q$-ary functions",
+    r"Stamp \& Extend -- Instant but Undeniable Timestamping based on Lazy Trees": r"Stamp & Extend – Instant but Undeniable Timestamping based on Lazy Trees",
+    r"CBEAM: Efficient Authenticated Encryption from Feebly One-Way $\phi $ Functions": r"CBEAM: Efficient Authenticated Encryption from Feebly One-Way $ϕ$ Functions",
+    r"$GF(2^n)$ Bit-Parallel Squarer Using Generalized Polynomial Basis For a New Class of Irreducible Pentanomials": r"$GF(2^n)$ Bit-Parallel Squarer Using Generalized Polynomial Basis For a New Class of Irreducible Pentanomials",
+    r"Construction of New Families of ‎MDS‎ Diffusion Layers": r"Construction of New Families of ‎MDS‎ Diffusion Layers",
+    r"Solving Random Subset Sum Problem by $l_{p}$-norm SVP Oracle": r"Solving Random Subset Sum Problem by $l_p$-norm SVP Oracle",
+    r"Side-Channel Leakage through Static Power – Should We Care about in Practice? –": r"Side-Channel Leakage through Static Power – Should We Care about in Practice? –",
+    r"Crypto-analyses on “user efficient recoverable off-line e-cashs scheme with fast anonymity revoking”": r"Crypto-analyses on “user efficient recoverable off-line e-cashs scheme with fast anonymity revoking”",
+    r"Cryptanalysis on “Secure untraceable off-line electronic cash system”": r"Cryptanalysis on “Secure untraceable off-line electronic cash system”",
+    r"A Preliminary FPGA Implementation and Analysis of Phatak’s Quotient-First Scaling Algorithm in the Reduced-Precision Residue Number System": r"A Preliminary FPGA Implementation and Analysis of Phatak’s Quotient-First Scaling Algorithm in the Reduced-Precision Residue Number System",
+    r"Secure Compression: Theory \& Practice": r"Secure Compression: Theory & Practice",
+    r"Breaking `128-bit Secure' Supersingular Binary Curves (or how to solve discrete logarithms in ${\protect \mathbb  F}_{2^{4 \cdot 1223}}$ and ${\protect \mathbb  F}_{2^{12 \cdot 367}}$)": r"Breaking `128-bit Secure' Supersingular Binary Curves (or how to solve discrete logarithms in $𝔽_{2^{4 ·1223}}$ and $𝔽_{2^{12 ·367}}$)",
+    r"Generalized proper matrices and constructing of $m$-resilient Boolean functions with maximal nonlinearity for expanded range of parameters": r"Generalized proper matrices and constructing of $m$-resilient Boolean functions with maximal nonlinearity for expanded range of parameters",
+    r"Remarks on the Pocklington and Padró-Sáez Cube Root Algorithm in $\protect \mathbb  F_q$": r"Remarks on the Pocklington and Padró-Sáez Cube Root Algorithm in $𝔽_q$",
+    r"Trial multiplication is not optimal but... On the symmetry of finite cyclic groups (Z/pZ)∗": r"Trial multiplication is not optimal but... On the symmetry of finite cyclic groups (Z/pZ)∗",
+    r"An Efficient Abuse-Free Fair Contract-Signing Protocol Based on RSA Signature and Σ-protocol": r"An Efficient Abuse-Free Fair Contract-Signing Protocol Based on RSA Signature and Σ-protocol",
+    r"Actively Private and Correct MPC Scheme in $t < n/2$ from Passively Secure Schemes with Small Overhead": r"Actively Private and Correct MPC Scheme in $t < n/2$ from Passively Secure Schemes with Small Overhead",
+    r"Collision Attack on 5 Rounds of Grøstl": r"Collision Attack on 5 Rounds of Grøstl",
+    r"Proof of Activity: Extending Bitcoin’s Proof of Work via Proof of Stake": r"Proof of Activity: Extending Bitcoin’s Proof of Work via Proof of Stake",
+    r"Lightweight Diffusion Layer from the $k^{th}$ root of the MDS Matrix": r"Lightweight Diffusion Layer from the $k^{th}$ root of the MDS Matrix",
+    r"On the quaternion $\ell $-isogeny path problem": r"On the quaternion $ℓ$-isogeny path problem",
+    r"New Classes of Public Key Cryptosystems over $F_2^8$ Constructed Based on Reed-Solomon Codes, K(XVII)SE(1)PKC and K(XVII)$\Sigma \Pi $PKC": r"New Classes of Public Key Cryptosystems over $F_2^8$ Constructed Based on Reed-Solomon Codes, K(XVII)SE(1)PKC and K(XVII)$ΣΠ$PKC",
+    r"Simple AEAD Hardware Interface (SÆHI) in a SoC: Implementing an On-Chip Keyak/WhirlBob Coprocessor": r"Simple AEAD Hardware Interface (SÆHI) in a SoC: Implementing an On-Chip Keyak/WhirlBob Coprocessor",
+    r"An Efficient $t$-Cheater Identifiable Secret Sharing Scheme with Optimal Cheater Resiliency": r"An Efficient $t$-Cheater Identifiable Secret Sharing Scheme with Optimal Cheater Resiliency",
+    r"Zipf’s Law in Passwords": r"Zipf’s Law in Passwords",
+    r"An Equivalent Condition on the Switching Construction of Differentially $4$-uniform Permutations on $GF_{2^{2k}}$ from the Inverse Function": r"An Equivalent Condition on the Switching Construction of Differentially $4$-uniform Permutations on $GF_{2^{2k}}$ from the Inverse Function",
+    r"A Dynamic Cube Attack on $105$ round Grain v1": r"A Dynamic Cube Attack on $105$ round Grain v1",
+    r"On the Optimal Pre-Computation of Window $\tau $NAF for Koblitz Curves": r"On the Optimal Pre-Computation of Window $τ$NAF for Koblitz Curves",
+    r"New Class of Multivariate Public Key Cryptosystem, K(XI)RSE(2)PKC, Constructed based on Reed-Solomon Code Along with K(X)RSE(2)PKC over $\protect \mathbb  {F}_2$": r"New Class of Multivariate Public Key Cryptosystem, K(XI)RSE(2)PKC, Constructed based on Reed-Solomon Code Along with K(X)RSE(2)PKC over $𝔽_2$",
+    r"Crypto-analyses on “secure and efficient privacy-preserving public auditing scheme for cloud storage”": r"Crypto-analyses on “secure and efficient privacy-preserving public auditing scheme for cloud storage”",
+    r"Navigating in the Cayley graph of $SL_2(F_p)$ and applications to hashing": r"Navigating in the Cayley graph of $SL_2(F_p)$ and applications to hashing",
+    r"Faster ECC over $\protect \mathbb  {F}_{2^{521}-1}$": r"Faster ECC over $𝔽_{2^{521}-1}$",
+    r"Post-Quantum Forward-Secure Onion Routing (Future Anonymity in Today’s Budget)": r"Post-Quantum Forward-Secure Onion Routing (Future Anonymity in Today’s Budget)",
+    r"Optimal software-implemented Itoh--Tsujii inversion for GF($2^m$)": r"Optimal software-implemented Itoh–Tsujii inversion for GF($2^m$)",
+    r"Non-committing encryption from $\Phi $-hiding": r"Non-committing encryption from $Φ$-hiding",
+    r"CamlCrush: A PKCS\#11 Filtering Proxy": r"CamlCrush: A PKCS#11 Filtering Proxy",
+    r"Fully Homomorphic Encryption from Ring-LWE：Identity-Based，Arbitrary Cyclotomic，Tighter Parameters": r"Fully Homomorphic Encryption from Ring-LWE：Identity-Based，Arbitrary Cyclotomic，Tighter Parameters",
+    r"Related-Key Forgeries for Prøst-OTR": r"Related-Key Forgeries for Prøst-OTR",
+    r"Déjà Q: Encore! Un Petit IBE": r"Déjà Q: Encore! Un Petit IBE",
+    r"C$\emptyset $C$\emptyset $: A Framework for Building Composable Zero-Knowledge Proofs": r"C$∅$C$∅$: A Framework for Building Composable Zero-Knowledge Proofs",
+    r"Computing Jacobi's \theta in quasi-linear time": r"Computing Jacobi's θin quasi-linear time",
+    r"Pseudo-Free Families of Finite Computational Elementary Abelian $p$-Groups": r"Pseudo-Free Families of Finite Computational Elementary Abelian $p$-Groups",
+    r"Re-encryption Veriﬁability: How to Detect Malicious Activities of a Proxy in Proxy Re-encryption": r"Re-encryption Veriﬁability: How to Detect Malicious Activities of a Proxy in Proxy Re-encryption",
+    r"Tighter Security for Efficient Lattice Cryptography via the Rényi Divergence of Optimized Orders": r"Tighter Security for Efficient Lattice Cryptography via the Rényi Divergence of Optimized Orders",
+    r"$\Lambda \circ \lambda $: Functional Lattice Cryptography": r"$Λ∘λ$: Functional Lattice Cryptography",
+    r"A note on the optimality of frequency analysis vs. $\ell _p$-optimization": r"A note on the optimality of frequency analysis vs. $ℓ_p$-optimization",
+    r"Authenticated Range \& Closest Point Queries in Zero-Knowledge": r"Authenticated Range & Closest Point Queries in Zero-Knowledge",
+    r"$Area-Time$ Efficient Hardware Implementation of Elliptic Curve Cryptosystem": r"$Area-Time$ Efficient Hardware Implementation of Elliptic Curve Cryptosystem",
+    r"Unclonable encryption revisited ($4 \times 2 = 8$)": r"Unclonable encryption revisited ($4 ×2 = 8$)",
+    r"Statistical Properties of Multiplication mod $2^n$": r"Statistical Properties of Multiplication mod $2^n$",
+    r"Exhausting Demirci-Selçuk Meet-in-the-Middle Attacks against Reduced-Round AES": r"Exhausting Demirci-Selçuk Meet-in-the-Middle Attacks against Reduced-Round AES",
+    r"Eclipse Attacks on Bitcoin’s Peer-to-Peer Network": r"Eclipse Attacks on Bitcoin’s Peer-to-Peer Network",
+    r"Identity-Set-based Broadcast Encryption supporting “Cut-or-Select” with Short Ciphertext": r"Identity-Set-based Broadcast Encryption supporting “Cut-or-Select” with Short Ciphertext",
+    r"End-to-End Verifiable Elections in the Standard Model∗": r"End-to-End Verifiable Elections in the Standard Model∗",
+    r"New attacks on RSA with Moduli $N=p^rq$": r"New attacks on RSA with Moduli $N=p^rq$",
+    r"Improved security proofs in lattice-based cryptography: using the Rényi divergence rather than the statistical distance": r"Improved security proofs in lattice-based cryptography: using the Rényi divergence rather than the statistical distance",
+    r"Improving algebraic attacks on stream ciphers based on linear feedback shifter registers over $F_{2^k}$": r"Improving algebraic attacks on stream ciphers based on linear feedback shifter registers over $F_{2^k}$",
+    r"Computing Individual Discrete Logarithms Faster in $GF(p^n)$": r"Computing Individual Discrete Logarithms Faster in $GF(p^n)$",
+    r"Related-Key Rectangle Attack on Round-reduced \protect \textit  {Khudra} Block Cipher": r"Related-Key Rectangle Attack on Round-reduced Khudra Block Cipher",
+    r"Quantum homomorphic encryption for circuits of low $T$-gate complexity": r"Quantum homomorphic encryption for circuits of low $T$-gate complexity",
+    r"PUDA – Privacy and Unforgeability for Data Aggregation": r"PUDA – Privacy and Unforgeability for Data Aggregation",
+    r"Improved (Pseudo) Preimage Attacks on Reduced-Round GOST and Grøstl-256 and Studies on Several Truncation Patterns for AES-like Compression Functions (Full Version)": r"Improved (Pseudo) Preimage Attacks on Reduced-Round GOST and Grøstl-256 and Studies on Several Truncation Patterns for AES-like Compression Functions (Full Version)",
+    r"An analysis of the $C$ class of bent functions": r"An analysis of the $C$ class of bent functions",
+    r"Improved Linear Hull Attack on Round-Reduced \protect \textsc  {Simon} with Dynamic Key-guessing Techniques": r"Improved Linear Hull Attack on Round-Reduced Simon with Dynamic Key-guessing Techniques",
+    r"On Generating Coset Representatives of PGL_2(F_q) in PGL_2(F_{q^2})": r"On Generating Coset Representatives of PGL_2(F_q) in PGL_2(F_{q^2})",
+    r"Interdiction in Practice – Hardware Trojan Against a High-Security USB Flash Drive": r"Interdiction in Practice – Hardware Trojan Against a High-Security USB Flash Drive",
+    r"Skipping the $q$ in Group Signatures": r"Skipping the $q$ in Group Signatures",
+    r"Comparison of cube attacks over diﬀerent vector spaces": r"Comparison of cube attacks over diﬀerent vector spaces",
+    r"Faster point scalar multiplication on NIST elliptic curves over GF(p) using (twisted) Edwards curves over GF(p³)": r"Faster point scalar multiplication on NIST elliptic curves over GF(p) using (twisted) Edwards curves over GF(p³)",
+    r"Fast Oblivious AES\\A dedicated application of the MiniMac protocol": r"Fast Oblivious AES A dedicated application of the MiniMac protocol",
+    r"Refund attacks on Bitcoin’s Payment Protocol": r"Refund attacks on Bitcoin’s Payment Protocol",
+    r"Standard quantum bit commitment – an indefinite commitment time": r"Standard quantum bit commitment – an indefinite commitment time",
+    r"The Security of NTP’s Datagram Protocol": r"The Security of NTP’s Datagram Protocol",
+    r"An Algorithm for Counting the Number of $2^n$-Periodic Binary Sequences with Fixed $k$-Error Linear Complexity": r"An Algorithm for Counting the Number of $2^n$-Periodic Binary Sequences with Fixed $k$-Error Linear Complexity",
+    r"Direct construction of quasi-involutory recursive-like MDS matrices from $2$-cyclic codes": r"Direct construction of quasi-involutory recursive-like MDS matrices from $2$-cyclic codes",
+    r"Modifying Shor’s algorithm to compute short discrete logarithms": r"Modifying Shor’s algorithm to compute short discrete logarithms",
+    r"Are RNGs Achilles’ heel of RFID Security and Privacy Protocols ?": r"Are RNGs Achilles’ heel of RFID Security and Privacy Protocols ?",
+    r"Comments on “Flaw in the Security Analysis of Leakage-resilient Authenticated Key Exchange Protocol from CT-RSA 2016 and Restoring the Security Proof”": r"Comments on “Flaw in the Security Analysis of Leakage-resilient Authenticated Key Exchange Protocol from CT-RSA 2016 and Restoring the Security Proof”",
+    r"An Oblivious Parallel RAM with $O(\log ^2 N)$ Parallel Runtime Blowup": r"An Oblivious Parallel RAM with $O(log^2 N)$ Parallel Runtime Blowup",
+    r"Computing Optimal Ate Pairings on Elliptic Curves with Embedding Degree $9,15$ and $27$": r"Computing Optimal Ate Pairings on Elliptic Curves with Embedding Degree $9,15$ and $27$",
+    r"Collecting relations for the Number Field Sieve in $GF(p^6)$": r"Collecting relations for the Number Field Sieve in $GF(p^6)$",
+    r"A new algorithm for residue multiplication modulo $2^{521}-1$": r"A new algorithm for residue multiplication modulo $2^{521}-1$",
+    r"Cryptanalysis of Multi-Prime $\Phi $-Hiding Assumption": r"Cryptanalysis of Multi-Prime $Φ$-Hiding Assumption",
+    r"Cryptographic Properties of Addition Modulo $2^n$": r"Cryptographic Properties of Addition Modulo $2^n$",
+    r"Trick or Tweak: On the (In)security of OTR’s Tweaks": r"Trick or Tweak: On the (In)security of OTR’s Tweaks",
+    r"May-Ozerov Algorithm for Nearest-Neighbor Problem over $\protect \mathbb  {F}_{q}$ and Its Application to Information Set Decoding": r"May-Ozerov Algorithm for Nearest-Neighbor Problem over $𝔽_q$ and Its Application to Information Set Decoding",
+    r"\protect \(\mu \protect \)Kummer: efficient hyperelliptic signatures and key exchange on microcontrollers": r"\(μ\)Kummer: efficient hyperelliptic signatures and key exchange on microcontrollers",
+    r"Malleability of the blockchain’s entropy": r"Malleability of the blockchain’s entropy",
+    r"Automatic Search for the Best Trails in ARX: Application to Block Cipher \protect \textsc  {Speck}": r"Automatic Search for the Best Trails in ARX: Application to Block Cipher Speck",
+    r"A note on the security of threshold implementations with $d+1$ input shares": r"A note on the security of threshold implementations with $d+1$ input shares",
+    r"Loop-Abort Faults on Lattice-Based Fiat–Shamir and Hash-and-Sign Signatures": r"Loop-Abort Faults on Lattice-Based Fiat–Shamir and Hash-and-Sign Signatures",
+    r"Improved Factorization of $N=p^rq^s$": r"Improved Factorization of $N=p^rq^s$",
+    r"Bitstream Fault Injections (BiFI) – Automated Fault Attacks against SRAM-based FPGAs": r"Bitstream Fault Injections (BiFI) – Automated Fault Attacks against SRAM-based FPGAs",
+    r"Efficient probabilistic algorithm for estimating the algebraic properties of Boolean functions for large $n$": r"Efficient probabilistic algorithm for estimating the algebraic properties of Boolean functions for large $n$",
+    r"The Lightest 4x4 MDS Matrices over $GL(4,\protect \mathbb  {F}_2)$": r"The Lightest 4x4 MDS Matrices over $GL(4,𝔽_2)$",
+    r"Software Benchmarking of the 2$^{\protect \text  {nd}}$ round CAESAR Candidates": r"Software Benchmarking of the 2$^{nd}$ round CAESAR Candidates",
+    r"Cryptographic Voting — A Gentle Introduction": r"Cryptographic Voting — A Gentle Introduction",
+    r"Privately Matching $k$-mers": r"Privately Matching $k$-mers",
+    r"A generalisation of Dillon's APN permutation with the best known differential and nonlinear properties for all fields of size $2^{4k+2}$": r"A generalisation of Dillon's APN permutation with the best known differential and nonlinear properties for all fields of size $2^{4k+2}$",
+    r"Generalized Desynchronization Attack on UMAP: Application to RCIA, KMAP, SLAP and SASI$^+$ protocols": r"Generalized Desynchronization Attack on UMAP: Application to RCIA, KMAP, SLAP and SASI$^+$ protocols",
+    r"Fast Arithmetic Modulo $2^xp^y\pm 1$": r"Fast Arithmetic Modulo $2^xp^y±1$",
+    r"Practical Non-Malleable Codes from $\ell $-more Extractable Hash Functions": r"Practical Non-Malleable Codes from $ℓ$-more Extractable Hash Functions",
+    r"Fast Montgomery-like Square Root Computation over $GF(2^m)$ for All Trinomials": r"Fast Montgomery-like Square Root Computation over $GF(2^m)$ for All Trinomials",
+    r"Round and Communication Efficient Unconditionally-secure MPC with $t < n/3$ in Partially Synchronous Network": r"Round and Communication Efficient Unconditionally-secure MPC with $t < n/3$ in Partially Synchronous Network",
+    r"Homomorphic SIM$^2$D Operations: Single Instruction Much More Data": r"Homomorphic SIM$^2$D Operations: Single Instruction Much More Data",
+    r"A Novel Pre-Computation Scheme of Window $\tau $NAF for Koblitz Curves": r"A Novel Pre-Computation Scheme of Window $τ$NAF for Koblitz Curves",
+    r"$\mu $chain: How to Forget without Hard Forks": r"$μ$chain: How to Forget without Hard Forks",
+    r"Settling the mystery of $Z_r=r$ in RC4": r"Settling the mystery of $Z_r=r$ in RC4",
+    r"A Certain Family of Subgroups of $\protect \mathbb  Z_n^\star $ Is Weakly Pseudo-Free under the General Integer Factoring Intractability Assumption": r"A Certain Family of Subgroups of $ℤ_n^⋆$ Is Weakly Pseudo-Free under the General Integer Factoring Intractability Assumption",
+    r"Machine-Learning Attacks on PolyPUFs, OB-PUFs, RPUFs, LHS-PUFs, and PUF–FSMs": r"Machine-Learning Attacks on PolyPUFs, OB-PUFs, RPUFs, LHS-PUFs, and PUF–FSMs",
+    r"Twisted $\mu _4$-normal form for elliptic curves": r"Twisted $μ_4$-normal form for elliptic curves",
+    r"Quantum Demiric-Selçuk Meet-in-the-Middle Attacks: Applications to 6-Round Generic Feistel Constructions": r"Quantum Demiric-Selçuk Meet-in-the-Middle Attacks: Applications to 6-Round Generic Feistel Constructions",
+    r"A Provably Secure PKCS\#11 Configuration Without Authenticated Attributes": r"A Provably Secure PKCS#11 Configuration Without Authenticated Attributes",
+    r"Some results on the existence of $t$-all-or-nothing transforms over arbitrary alphabets": r"Some results on the existence of $t$-all-or-nothing transforms over arbitrary alphabets",
+    r"The Approximate $k$-List Problem": r"The Approximate $k$-List Problem",
+    r"Cryptanalysis of Wang et al’s Certificateless Signature Scheme without Bilinear Pairings": r"Cryptanalysis of Wang et al’s Certificateless Signature Scheme without Bilinear Pairings",
+    r"When It’s All Just Too Much: Outsourcing MPC-Preprocessing": r"When It’s All Just Too Much: Outsourcing MPC-Preprocessing",
+    r"A New Algorithm for Inversion mod $p^k$": r"A New Algorithm for Inversion mod $p^k$",
+    r"Efficient hash maps to \protect \mathbb  {G}_2 on BLS curves": r"Efficient hash maps to 𝔾_2 on BLS curves",
+    r"Sharper Bounds in Lattice-Based Cryptography using the Rényi Divergence": r"Sharper Bounds in Lattice-Based Cryptography using the Rényi Divergence",
+    r"Encryption Switching Protocols Revisited: Switching modulo $p$": r"Encryption Switching Protocols Revisited: Switching modulo $p$",
+    r"Recovering Short Generators of Principal Fractional Ideals in Cyclotomic Fields of Conductor $p^\alpha q^\beta $": r"Recovering Short Generators of Principal Fractional Ideals in Cyclotomic Fields of Conductor $p^αq^β$",
+    r"Snarky Signatures: \\ Minimal Signatures of Knowledge from Simulation-Extractable SNARKs": r"Snarky Signatures:   Minimal Signatures of Knowledge from Simulation-Extractable SNARKs",
+    r"Multiplication and Division over Extended Galois Field GF($p^q$): A new Approach to find Monic Irreducible Polynomials over any Galois Field GF($p^q$).": r"Multiplication and Division over Extended Galois Field GF($p^q$): A new Approach to find Monic Irreducible Polynomials over any Galois Field GF($p^q$).",
+    r"Can You Trust Your Encrypted Cloud? An Assessment of SpiderOakONE’s Security": r"Can You Trust Your Encrypted Cloud? An Assessment of SpiderOakONE’s Security",
+    r"Large Modulus Ring-LWE $\geq $ Module-LWE": r"Large Modulus Ring-LWE $≥$ Module-LWE",
+    r"Brute–Force Search Strategies for Single–Trace and Few–Traces Template Attacks on the DES Round Keys of a Recent Smart Card": r"Brute–Force Search Strategies for Single–Trace and Few–Traces Template Attacks on the DES Round Keys of a Recent Smart Card",
+    r"Lower bounds on communication for multiparty computation of multiple «AND» instances with secret sharing": r"Lower bounds on communication for multiparty computation of multiple «AND» instances with secret sharing",
+    r"δ-subgaussian Random Variables in Cryptography": r"δ-subgaussian Random Variables in Cryptography",
+    r"AS$^3$: Adaptive Social Secret Sharing for Distributed Storage Systems": r"AS$^3$: Adaptive Social Secret Sharing for Distributed Storage Systems",
+    r"Lattice-Based Techniques for Accountable Anonymity: Composition of Abstract Stern’s Protocols and Weak PRF with Efficient Protocols from LWR": r"Lattice-Based Techniques for Accountable Anonymity: Composition of Abstract Stern’s Protocols and Weak PRF with Efficient Protocols from LWR",
+    r"HAL — The Missing Piece of the Puzzle for Hardware Reverse Engineering, Trojan Detection and Insertion": r"HAL — The Missing Piece of the Puzzle for Hardware Reverse Engineering, Trojan Detection and Insertion",
+    r"No-Match Attacks and Robust Partnering Definitions – Defining Trivial Attacks for Security Protocols is Not Trivial": r"No-Match Attacks and Robust Partnering Definitions – Defining Trivial Attacks for Security Protocols is Not Trivial",
+    r"Möbius: Trustless Tumbling for Transaction Privacy": r"Möbius: Trustless Tumbling for Transaction Privacy",
+    r"Blockwise $p$-Tampering Attacks on Cryptographic Primitives, Extractors, and Learners": r"Blockwise $p$-Tampering Attacks on Cryptographic Primitives, Extractors, and Learners",
+    r"On the Power of Amortization in Secret Sharing: $d$-Uniform Secret Sharing and CDS with Constant Information Rate": r"On the Power of Amortization in Secret Sharing: $d$-Uniform Secret Sharing and CDS with Constant Information Rate",
+    r"Full-Hiding (Unbounded) Multi-Input Inner Product Functional Encryption from the $k$-Linear Assumption": r"Full-Hiding (Unbounded) Multi-Input Inner Product Functional Encryption from the $k$-Linear Assumption",
+    r"Faster multiplication in $\protect \mathbb  {Z}_{2^m}[x]$ on Cortex-M4 to speed up NIST PQC candidates": r"Faster multiplication in $ℤ_{2^m}[x]$ on Cortex-M4 to speed up NIST PQC candidates",
+    r"Synchronous Byzantine Agreement with Expected $O(1)$ Rounds, Expected $O(n^2)$ Communication, and Optimal Resilience": r"Synchronous Byzantine Agreement with Expected $O(1)$ Rounds, Expected $O(n^2)$ Communication, and Optimal Resilience",
+    r"Constructing Infinite Families of Low Differential Uniformity $(n,m)$-Functions with $m>n/2$": r"Constructing Infinite Families of Low Differential Uniformity $(n,m)$-Functions with $m>n/2$",
+    r"Yet Another Size Record for AES: A First-Order SCA Secure AES S-box Based on GF($2^8$) Multiplication": r"Yet Another Size Record for AES: A First-Order SCA Secure AES S-box Based on GF($2^8$) Multiplication",
+    r"P4TC—Provably-Secure yet Practical Privacy-Preserving Toll Collection": r"P4TC—Provably-Secure yet Practical Privacy-Preserving Toll Collection",
+    r"Improvements of Blockchain’s Block Broadcasting:An Incentive Approach": r"Improvements of Blockchain’s Block Broadcasting:An Incentive Approach",
+    r"On the Concrete Security of Goldreich’s Pseudorandom Generator": r"On the Concrete Security of Goldreich’s Pseudorandom Generator",
+    r"Polynomial Time Bounded Distance Decoding near Minkowski’s Bound in Discrete Logarithm Lattices": r"Polynomial Time Bounded Distance Decoding near Minkowski’s Bound in Discrete Logarithm Lattices",
+    r"Full Indifferentiable Security of the Xor of Two or More Random Permutations Using the $\chi ^2$ Method": r"Full Indifferentiable Security of the Xor of Two or More Random Permutations Using the $χ^2$ Method",
+    r"Can We Overcome the $n \log n$ Barrier for Oblivious Sorting?": r"Can We Overcome the $n logn$ Barrier for Oblivious Sorting?",
+    r"Hadamard Matrices, $d$-Linearly Independent Sets and Correlation-Immune Boolean Functions with Minimum Hamming Weights": r"Hadamard Matrices, $d$-Linearly Independent Sets and Correlation-Immune Boolean Functions with Minimum Hamming Weights",
+    r"Agreement with Satoshi – On the Formalization of Nakamoto Consensus": r"Agreement with Satoshi – On the Formalization of Nakamoto Consensus",
+    r"“Larger Keys, Less Complexity” A Strategic Proposition": r"“Larger Keys, Less Complexity” A Strategic Proposition",
+    r"Efficient Range ORAM with $\protect \mathbb  {O}(\log ^{2}{N})$ Locality": r"Efficient Range ORAM with $𝕆(log^2N)$ Locality",
+    r"Improved Parallel Mask Refreshing Algorithms: Generic Solutions with Parametrized Non-Interference \& Automated Optimizations": r"Improved Parallel Mask Refreshing Algorithms: Generic Solutions with Parametrized Non-Interference & Automated Optimizations",
+    r"Finding Small Solutions of the Equation $Bx-Ay=z$ and Its Applications to Cryptanalysis of the RSA Cryptosystem": r"Finding Small Solutions of the Equation $Bx-Ay=z$ and Its Applications to Cryptanalysis of the RSA Cryptosystem",
+    r"On the Menezes-Teske-Weng’s conjecture": r"On the Menezes-Teske-Weng’s conjecture",
+    r"A $k$-out-of-$n$ Ring Signature with Flexible Participation for Signers": r"A $k$-out-of-$n$ Ring Signature with Flexible Participation for Signers",
+    r"Towards Static Assumption Based Cryptosystem in Pairing Setting: Further Applications of DéjàQ and Dual-Form Signature": r"Towards Static Assumption Based Cryptosystem in Pairing Setting: Further Applications of DéjàQ and Dual-Form Signature",
+    r"Witness-Indistinguishable Arguments with $\Sigma $-Protocols for Bundled Witness Spaces and its Application to Global Identities": r"Witness-Indistinguishable Arguments with $Σ$-Protocols for Bundled Witness Spaces and its Application to Global Identities",
+    r"Practical Fully Secure Unrestricted Inner Product Functional Encryption modulo $p$": r"Practical Fully Secure Unrestricted Inner Product Functional Encryption modulo $p$",
+    r"Blending FHE-NTRU keys – The Excalibur Property": r"Blending FHE-NTRU keys – The Excalibur Property",
+    r"Injective Trapdoor Functions via Derandomization: How Strong is Rudich’s Black-Box Barrier?": r"Injective Trapdoor Functions via Derandomization: How Strong is Rudich’s Black-Box Barrier?",
+    r"Programming the Demirci-Sel{ç}uk Meet-in-the-Middle Attack with Constraints": r"Programming the Demirci-Selçuk Meet-in-the-Middle Attack with Constraints",
+    r"Building Quantum-One-Way Functions from Block Ciphers: Davies-Meyer and Merkle-Damgård Constructions": r"Building Quantum-One-Way Functions from Block Ciphers: Davies-Meyer and Merkle-Damgård Constructions",
+    r"Round Optimal Black-Box “Commit-and-Prove”": r"Round Optimal Black-Box “Commit-and-Prove”",
+    r"How to leverage hardness of constant-degree expanding polynomials over $\protect \mathbb  {R}$ to build iO": r"How to leverage hardness of constant-degree expanding polynomials over $ℝ$ to build iO",
+    r"A Proof of the Beierle-Kranz-Leander’s Conjecture related to Lightweight Multiplication in $F_{2^n}$": r"A Proof of the Beierle-Kranz-Leander’s Conjecture related to Lightweight Multiplication in $F_{2^n}$",
+    r"Upper Bound on $\lambda _1(\Lambda ^{\bot }(\protect \mathbf  A))$": r"Upper Bound on $λ_1(Λ^⊥(𝐀))$",
+    r"Quantum Algorithms for the Approximate $k$-List Problem and their Application to Lattice Sieving": r"Quantum Algorithms for the Approximate $k$-List Problem and their Application to Lattice Sieving",
+    r"Breaking the Bluetooth Pairing – The Fixed Coordinate Invalid Curve Attack": r"Breaking the Bluetooth Pairing – The Fixed Coordinate Invalid Curve Attack",
+    r"New point compression method for elliptic $\protect \mathbb  {F}_{\protect \!q^2}$-curves of $j$-invariant $0$": r"New point compression method for elliptic $𝔽_{q^2}$-curves of $j$-invariant $0$",
+    r"Low Complexity MDS Matrices Using $GF(2^n)$ SPB or GPB": r"Low Complexity MDS Matrices Using $GF(2^n)$ SPB or GPB",
+    r"On the Complexity of non-recursive $n$-term Karatsuba Multiplier for Trinomials": r"On the Complexity of non-recursive $n$-term Karatsuba Multiplier for Trinomials",
+    r"Formalising $\Sigma $-Protocols and Commitment Schemes using CryptHOL": r"Formalising $Σ$-Protocols and Commitment Schemes using CryptHOL",
+    r"Simplifying Constructions and Assumptions for $i\protect \mathcal  {O}$": r"Simplifying Constructions and Assumptions for $i𝒪$",
+    r"Probabilistic Properties of Modular Addition \\ (Extended abstract)": r"Probabilistic Properties of Modular Addition   (Extended abstract)",
+    r"Fast Secrecy Computation with Multiplication Under the Setting of $k\le N<2k-1$ using Secret Sharing Scheme": r"Fast Secrecy Computation with Multiplication Under the Setting of $k≤N<2k-1$ using Secret Sharing Scheme",
+    r"SÉTA: Supersingular Encryption from Torsion Attacks": r"SÉTA: Supersingular Encryption from Torsion Attacks",
+    r"Hashing to elliptic curves of $j$-invariant $1728$": r"Hashing to elliptic curves of $j$-invariant $1728$",
+    r"Reduction Modulo $2^{448}-2^{224}-1$": r"Reduction Modulo $2^{448}-2^{224}-1$",
+    r"Unifying Leakage Models on a Rényi Day": r"Unifying Leakage Models on a Rényi Day",
+    r"Toward A More Efficient Gröbner-based Algebraic Cryptanalysis": r"Toward A More Efficient Gröbner-based Algebraic Cryptanalysis",
+    r"$AC^0$ Constructions for Evolving Secret Sharing Schemes and Redistribution of Secret Shares": r"$AC^0$ Constructions for Evolving Secret Sharing Schemes and Redistribution of Secret Shares",
+    r"Analogue of Vélu's Formulas for Computing Isogenies over Hessian Model of Elliptic Curves": r"Analogue of Vélu's Formulas for Computing Isogenies over Hessian Model of Elliptic Curves",
+    r"Solving $X^{q+1}+X+a=0$ over Finite Fields": r"Solving $X^{q+1}+X+a=0$ over Finite Fields",
+    r"Overdrive2k: Efficient Secure MPC over $Z_{2^k}$ from Somewhat Homomorphic Encryption": r"Overdrive2k: Efficient Secure MPC over $Z_{2^k}$ from Somewhat Homomorphic Encryption",
+    r"Fast Algebraic Immunity of $2^m+2$ & $2^m+3$ variables Majority Function": r"Fast Algebraic Immunity of $2^m+2$     $2^m+3$ variables Majority Function", # weird case with &
+    r"Solving $x^{2^k+1}+x+a=0$ in $\protect \mathbb  {F}_{2^n}$ with $\gcd (n,k)=1$": r"Solving $x^{2^k+1}+x+a=0$ in $𝔽_{2^n}$ with $\gcd(n,k)=1$",
+    r"Fully Secure Attribute-Based Encryption for $t$-CNF from LWE": r"Fully Secure Attribute-Based Encryption for $t$-CNF from LWE",
+    r"Improving Speed of Dilithium’s Signing Procedure": r"Improving Speed of Dilithium’s Signing Procedure",
+    r"FloodXMR: Low-cost transaction flooding attack with Monero’s bulletproof protocol": r"FloodXMR: Low-cost transaction flooding attack with Monero’s bulletproof protocol",
+    r"How to wrap it up - A formally verified proposal for the use of authenticated wrapping in PKCS\#11": r"How to wrap it up - A formally verified proposal for the use of authenticated wrapping in PKCS#11",
+    r"RingCT 3.0 for Blockchain Conﬁdential Transaction: Shorter Size and Stronger Security": r"RingCT 3.0 for Blockchain Conﬁdential Transaction: Shorter Size and Stronger Security",
+    r"Solutions of $x^{q^k}+\protect \cdots  +x^{q}+x=a$ in $GF(2^n)$": r"Solutions of $x^{q^k}+⋯+x^q+x=a$ in $GF(2^n)$",
+    r"A${^2}$L: Anonymous Atomic Locks for Scalability in Payment Channel Hubs": r"A${^2}$L: Anonymous Atomic Locks for Scalability in Payment Channel Hubs",
+    r"The Exchange Attack: How to Distinguish Six Rounds of AES with $2^{88.2}$ chosen plaintexts": r"The Exchange Attack: How to Distinguish Six Rounds of AES with $2^{88.2}$ chosen plaintexts",
+    r"Scrutinizing the Tower Field Implementation of the $\protect \mathbb  {F}_{2^8}$ Inverter -- with Applications to AES, Camellia, and SM4": r"Scrutinizing the Tower Field Implementation of the $𝔽_{2^8}$ Inverter – with Applications to AES, Camellia, and SM4",
+    r"On cryptographic parameters of permutation polynomials of the form $x^rh(x^{(q-1)/d})$": r"On cryptographic parameters of permutation polynomials of the form $x^rh(x^{(q-1)/d})$",
+    r"Don't forget your roots: constant-time root finding over $\protect \mathbb  {F}_{2^m}$": r"Don't forget your roots: constant-time root finding over $𝔽_{2^m}$",
+    r"Can we Beat the Square Root Bound for ECDLP over $\protect \mathbb  {F}_{p^2}$ via Representations?": r"Can we Beat the Square Root Bound for ECDLP over $𝔽_{p^2}$ via Representations?",
+    r"Asymptotically-Good Arithmetic Secret Sharing over Z/(p^\ell Z) with Strong Multiplication and Its Applications to Efficient MPC": r"Asymptotically-Good Arithmetic Secret Sharing over Z/(p^ℓZ) with Strong Multiplication and Its Applications to Efficient MPC",
+    r"Efficient Information-Theoretic Secure Multiparty Computation over $\protect \mathbb  {Z}/p^k \protect \mathbb  {Z}$ via Galois Rings": r"Efficient Information-Theoretic Secure Multiparty Computation over $ℤ/p^k ℤ$ via Galois Rings",
+    r"Modifying The Tropical Version of Stickel’s Key Exchange Protocol": r"Modifying The Tropical Version of Stickel’s Key Exchange Protocol",
+    r"One Bit is All It Takes: A Devastating Timing Attack on BLISS’s Non-Constant Time Sign Flips": r"One Bit is All It Takes: A Devastating Timing Attack on BLISS’s Non-Constant Time Sign Flips",
+    r"Probabilistic analysis on Macaulay matrices over finite fields and complexity of constructing Gröbner bases": r"Probabilistic analysis on Macaulay matrices over finite fields and complexity of constructing Gröbner bases",
+    r"Information Conservational Security with “Black Hole” Keypad Compression and Scalable One-Time Pad — An Analytical Quantum Intelligence Approach to Pre- and Post-Quantum Cryptography": r"Information Conservational Security with “Black Hole” Keypad Compression and Scalable One-Time Pad — An Analytical Quantum Intelligence Approach to Pre- and Post-Quantum Cryptography",
+    r"Detecting Faults in Inner Product Masking Scheme - IPM-FD: IPM with Fault Detection (extended version∗)": r"Detecting Faults in Inner Product Masking Scheme - IPM-FD: IPM with Fault Detection (extended version∗)",
+    r"Low Weight Discrete Logarithms and Subset Sum in $2^{0.65n}$ with Polynomial Memory": r"Low Weight Discrete Logarithms and Subset Sum in $2^{0.65n}$ with Polynomial Memory",
+    r"CCA-Secure Leakage-Resilient Identity-Based Key-Encapsulation from Simple (not $\protect \mathtt  {q}$-type) Assumptions": r"CCA-Secure Leakage-Resilient Identity-Based Key-Encapsulation from Simple (not $𝚚$-type) Assumptions",
+    r"Faster point compression for elliptic curves of $j$-invariant $0$": r"Faster point compression for elliptic curves of $j$-invariant $0$",
+    r"Cortex-M4 Optimizations for \{R,M\}LWE Schemes": r"Cortex-M4 Optimizations for {R,M}LWE Schemes",
+    r"Efficient indifferentiable hashing to elliptic curves $y^2 = x^3 + b$ provided that $b$ is a quadratic residue": r"Efficient indifferentiable hashing to elliptic curves $y^2 = x^3 + b$ provided that $b$ is a quadratic residue",
+    r"Karatsuba-based square-root Vélu’s formulas applied to two isogeny-based protocols": r"Karatsuba-based square-root Vélu’s formulas applied to two isogeny-based protocols",
+    r"Two-round $n$-out-of-$n$ and Multi-Signatures and Trapdoor Commitment from Lattices": r"Two-round $n$-out-of-$n$ and Multi-Signatures and Trapdoor Commitment from Lattices",
+    r"TinyGarble2: Smart, Efficient, and Scalable Yao’s Garble Circuit": r"TinyGarble2: Smart, Efficient, and Scalable Yao’s Garble Circuit",
+    r"Schrödinger's Pirate: How To Trace a Quantum Decoder": r"Schrödinger's Pirate: How To Trace a Quantum Decoder",
+    r"Cryptanalysis of RSA: A Special Case of Boneh-Durfee’s Attack": r"Cryptanalysis of RSA: A Special Case of Boneh-Durfee’s Attack",
+    r"Post-Quantum Cryptography with Contemporary Co-Processors: Beyond Kronecker, Schönhage-Strassen & Nussbaumer": r"Post-Quantum Cryptography with Contemporary Co-Processors: Beyond Kronecker, Schönhage-Strassen     Nussbaumer",
+    r"Simulation Extractable Versions of Groth’s zk-SNARK Revisited": r"Simulation Extractable Versions of Groth’s zk-SNARK Revisited",
+    r"Breaking the $O(\protect \sqrt  n)$-Bit Barrier: Byzantine Agreement with Polylog Bits Per Party": r"Breaking the $O(√(n))$-Bit Barrier: Byzantine Agreement with Polylog Bits Per Party",
+    r"A New Generalisation of the Goldwasser-Micali Cryptosystem Based on the Gap $2^k$-Residuosity Assumption": r"A New Generalisation of the Goldwasser-Micali Cryptosystem Based on the Gap $2^k$-Residuosity Assumption",
+    r"Compressed $\Sigma $-Protocols for Bilinear Group Arithmetic Circuits and Application to Logarithmic Transparent Threshold Signatures": r"Compressed $Σ$-Protocols for Bilinear Group Arithmetic Circuits and Application to Logarithmic Transparent Threshold Signatures",
+    r"Cryptanalysis of Aggregate $\Gamma $-Signature and Practical Countermeasures in Application to Bitcoin": r"Cryptanalysis of Aggregate $Γ$-Signature and Practical Countermeasures in Application to Bitcoin",
+    r"Unlinkable and Invisible γ-Sanitizable Signatures": r"Unlinkable and Invisible γ-Sanitizable Signatures",
+    r"The SQALE of CSIDH: Sublinear Vélu Quantum-resistant isogeny Action with Low Exponents": r"The SQALE of CSIDH: Sublinear Vélu Quantum-resistant isogeny Action with Low Exponents",
+    r"Compressed $\Sigma $-Protocol Theory and Practical Application to Plug & Play Secure Algorithmics": r"Compressed $Σ$-Protocol Theory and Practical Application to Plug     Play Secure Algorithmics",
+    r"Comments on “ Multi Recipient Aggregate Signcryption Scheme Based on Elliptic Curve”": r"Comments on “ Multi Recipient Aggregate Signcryption Scheme Based on Elliptic Curve”",
+    r"Homological Characterization of bounded $F_2$-regularity": r"Homological Characterization of bounded $F_2$-regularity",
+    r"$P_4$-free Partition and Cover Numbers and Application": r"$P_4$-free Partition and Cover Numbers and Application",
+    r"$L_1$-Norm Ball for CSIDH: Optimal Strategy for Choosing the Secret Key Space": r"$L_1$-Norm Ball for CSIDH: Optimal Strategy for Choosing the Secret Key Space",
+    r"Bitcoin Crypto–Bounties for Quantum Capable Adversaries": r"Bitcoin Crypto–Bounties for Quantum Capable Adversaries",
+    r"Committing to Quantum Resistance, Better: A Speed–and–Risk–Configurable Defence for Bitcoin against a Fast Quantum Computing Attack": r"Committing to Quantum Resistance, Better: A Speed–and–Risk–Configurable Defence for Bitcoin against a Fast Quantum Computing Attack",
+    r"About the Tu-Deng Conjecture for $W(t)$ Less Than or Equal to 10": r"About the Tu-Deng Conjecture for $W(t)$ Less Than or Equal to 10",
+    r"On Adaptive Attacks against Jao-Urbanik’s Isogeny-Based Protocol": r"On Adaptive Attacks against Jao-Urbanik’s Isogeny-Based Protocol",
+    r"New Assumptions and Efficient Cryptosystems from the $e$-th Power Residue Symbol": r"New Assumptions and Efficient Cryptosystems from the $e$-th Power Residue Symbol",
+    r"A ”Final” Security Bug": r"A ”Final” Security Bug",
+    r"Multichain-MWPoW: A $p/2$ Adversary Power Resistant Blockchain Sharding Approach to a Decentralised Autonomous Organisation Architecture": r"Multichain-MWPoW: A $p/2$ Adversary Power Resistant Blockchain Sharding Approach to a Decentralised Autonomous Organisation Architecture",
+    r"A Trace Based $GF(2^n)$ Inversion Algorithm": r"A Trace Based $GF(2^n)$ Inversion Algorithm",
+    r"ConTra Corona: Contact Tracing against the Coronavirus by Bridging the Centralized–Decentralized Divide for Stronger Privacy": r"ConTra Corona: Contact Tracing against the Coronavirus by Bridging the Centralized–Decentralized Divide for Stronger Privacy",
+    r"HACL×N: Verified Generic SIMD Crypto (for all your favorite platforms)": r"HACL×N: Verified Generic SIMD Crypto (for all your favorite platforms)",
+    r"MoniPoly---An Expressive $q$-SDH-Based Anonymous Attribute-Based Credential System": r"MoniPoly—An Expressive $q$-SDH-Based Anonymous Attribute-Based Credential System",
+    r"Proof of Mirror Theory for $\xi _{\max }=2$": r"Proof of Mirror Theory for $ξ_{max}=2$",
+    r"Compressing Proofs of $k$-Out-Of-$n$ Partial Knowledge": r"Compressing Proofs of $k$-Out-Of-$n$ Partial Knowledge",
+    r"Functional Encryption for Attribute-Weighted Sums from $k$-Lin": r"Functional Encryption for Attribute-Weighted Sums from $k$-Lin",
+    r"Time-Space Tradeoffs and Short Collisions in Merkle-Damgård Hash Functions": r"Time-Space Tradeoffs and Short Collisions in Merkle-Damgård Hash Functions",
+    r"Trace-$\Sigma $: a privacy-preserving contact tracing app": r"Trace-$Σ$: a privacy-preserving contact tracing app",
+    r"Not enough LESS: An improved algorithm for solving Code Equivalence Problems over $\protect \mathbb  {F}_q$": r"Not enough LESS: An improved algorithm for solving Code Equivalence Problems over $𝔽_q$",
+    r"Secure merge with $O(n \log logn)$ secure operation": r"Secure merge with $O(n loglogn)$ secure operation",
+    r"Cryptanalysis of a ``Strengthened'' Key Exchange Protocol for IoT, or When SAKE$^+$ Turns Out to Be SAKE$^-$": r"Cryptanalysis of a “Strengthened” Key Exchange Protocol for IoT, or When SAKE$^+$ Turns Out to Be SAKE$^-$",
+    r"Adaptively Secure Revocable Hierarchical IBE from $k$-linear Assumption": r"Adaptively Secure Revocable Hierarchical IBE from $k$-linear Assumption",
+    r"Another code-based adaptation of Lyubashevsky’s signature cryptanalysed": r"Another code-based adaptation of Lyubashevsky’s signature cryptanalysed",
+    r"A Note on Authenticated Group Key Agreement Protocol Based on Twist Conjugacy Problem in Near – Rings": r"A Note on Authenticated Group Key Agreement Protocol Based on Twist Conjugacy Problem in Near – Rings",
+    r"Timing attacks and local timing attacks against Barrett’s modular multiplication algorithm": r"Timing attacks and local timing attacks against Barrett’s modular multiplication algorithm",
+    r"New Techniques for Traitor Tracing: Size $N^{1/3}$ and More from Pairings": r"New Techniques for Traitor Tracing: Size $N^{1/3}$ and More from Pairings",
+    r"Hashing to elliptic curves of $j=0$ and quadratic imaginary orders of class number $2$": r"Hashing to elliptic curves of $j=0$ and quadratic imaginary orders of class number $2$",
+    r"A Family of Nonlinear MDS Diffusion Layers over $\protect \mathbb  {F}_{2^{4n}}$": r"A Family of Nonlinear MDS Diffusion Layers over $𝔽_{2^{4n}}$",
+    r"Complete solution over $GF{p^n}$ of the equation $X^{p^k+1}+X+a=0$": r"Complete solution over $GF{p^n}$ of the equation $X^{p^k+1}+X+a=0$",
+    r"Evolution of Bulletin Board & its application to E-Voting – A Survey": r"Evolution of Bulletin Board     its application to E-Voting – A Survey",
+    r"The Study of Modulo $2^n$": r"The Study of Modulo $2^n$",
+    r"SCA-secure ECC in software – mission impossible?": r"SCA-secure ECC in software – mission impossible?",
+    r"Limits of Polynomial Packings for $\protect \mathbb  {Z}_{p^k}$ and $\protect \mathbb  {F}_{p^k}$": r"Limits of Polynomial Packings for $ℤ_{p^k}$ and $𝔽_{p^k}$",
+    r"Optimal encodings to elliptic curves of $j$-invariants $0$, $1728$": r"Optimal encodings to elliptic curves of $j$-invariants $0$, $1728$",
+    r"Neyman’s Smoothness Test: a Trade-off between Moment-based and Distribution-based Leakage Detections": r"Neyman’s Smoothness Test: a Trade-off between Moment-based and Distribution-based Leakage Detections",
+    r"Comparing Lattice Families for Bounded Distance Decoding near Minkowski’s Bound.": r"Comparing Lattice Families for Bounded Distance Decoding near Minkowski’s Bound.",
+    r"Discovering New $L$-Function Relations Using Algebraic Sieving": r"Discovering New $L$-Function Relations Using Algebraic Sieving",
+    r"Cairo – a Turing-complete STARK-friendly CPU architecture": r"Cairo – a Turing-complete STARK-friendly CPU architecture",
+    r"Glowworm Attack: Optical TEMPEST Sound Recovery via a Device’s Power Indicator LED": r"Glowworm Attack: Optical TEMPEST Sound Recovery via a Device’s Power Indicator LED",
+    r"Towards the Least Inequalities for Describing a Subset in $Z_2^n$": r"Towards the Least Inequalities for Describing a Subset in $Z_2^n$",
+    r"A note on group membership tests for $G_1$, $G_2$ and $G_T$ on BLS pairing-friendly curves": r"A note on group membership tests for $G_1$, $G_2$ and $G_T$ on BLS pairing-friendly curves",
+    r"Facial Recognition for Remote Electronic Voting – Missing Piece of the Puzzle or Yet Another Liability?": r"Facial Recognition for Remote Electronic Voting – Missing Piece of the Puzzle or Yet Another Liability?",
+    r"($\epsilon ,\delta $)-indistinguishable Mixing for Cryptocurrencies": r"($ϵ,δ$)-indistinguishable Mixing for Cryptocurrencies",
+    r"Estimating (Miner) Extractable Value is Hard, Let’s Go Shopping!": r"Estimating (Miner) Extractable Value is Hard, Let’s Go Shopping!",
+    r"Gröbner Basis Attack on STARK-Friendly Symmetric-Key Primitives: JARVIS, MiMC and GMiMCerf": r"Gröbner Basis Attack on STARK-Friendly Symmetric-Key Primitives: JARVIS, MiMC and GMiMCerf",
+    r"Parallel Repetition of $(k_1,\protect \dots  ,k_{\mu })$-Special-Sound Multi-Round Interactive Proofs": r"Parallel Repetition of $(k_1,…,k_μ)$-Special-Sound Multi-Round Interactive Proofs",
+    r"An Open Problem on the Bentness of Mesnager’s Functions": r"An Open Problem on the Bentness of Mesnager’s Functions",
+    r"Ofelimos: Combinatorial Optimization via Proof-of-Useful-Work \\ A Provably Secure Blockchain Protocol": r"Ofelimos: Combinatorial Optimization via Proof-of-Useful-Work   A Provably Secure Blockchain Protocol",
+    r"MHz2k: MPC from HE over $\protect \mathbb  {Z}_{2^k}$ with New Packing, Simpler Reshare, and Better ZKP": r"MHz2k: MPC from HE over $ℤ_{2^k}$ with New Packing, Simpler Reshare, and Better ZKP",
+    r"Log-$\protect \mathcal  {S}$-unit lattices using Explicit Stickelberger Generators to solve Approx Ideal-SVP": r"Log-$𝒮$-unit lattices using Explicit Stickelberger Generators to solve Approx Ideal-SVP",
+    r"Fiat–Shamir Bulletproofs are Non-Malleable (in the Algebraic Group Model)": r"Fiat–Shamir Bulletproofs are Non-Malleable (in the Algebraic Group Model)",
+    r"On Bitcoin Cash’s Target Recalculation Functions": r"On Bitcoin Cash’s Target Recalculation Functions",
+    r"$P/poly$ Invalidity of the Agr17 Functional Encryption Scheme": r"$P/poly$ Invalidity of the Agr17 Functional Encryption Scheme",
+    r"\protect \(\chi \protect \)perbp: a Cloud-based Lightweight Mutual Authentication Protocol": r"\(χ\)perbp: a Cloud-based Lightweight Mutual Authentication Protocol",
+    r"A State-Separating Proof for Yao’s Garbling Scheme": r"A State-Separating Proof for Yao’s Garbling Scheme",
+    r"Interactive Error Correcting Codes Over Binary Erasure Channels Resilient to $>\protect \frac  12$ Adversarial Corruption": r"Interactive Error Correcting Codes Over Binary Erasure Channels Resilient to $>1/2$ Adversarial Corruption",
+    r"Practical Garbled RAM: GRAM with $O(\log ^2 n)$ Overhead": r"Practical Garbled RAM: GRAM with $O(log^2 n)$ Overhead",
+    r"Just how hard are rotations of $\protect \mathbb  {Z}^n$? Algorithms and cryptography with the simplest lattice": r"Just how hard are rotations of $ℤ^n$? Algorithms and cryptography with the simplest lattice",
+    r"Generating cryptographically-strong random lattice bases and recognizing rotations of $\protect \mathbb  {Z}^n$": r"Generating cryptographically-strong random lattice bases and recognizing rotations of $ℤ^n$",
+    r"Improved Security Bound of \protect \textsf  {(E/D)WCDM}": r"Improved Security Bound of (E/D)WCDM",
+    r"The most efficient indifferentiable hashing to elliptic curves of $j$-invariant $1728$": r"The most efficient indifferentiable hashing to elliptic curves of $j$-invariant $1728$",
+    r"Secure Sampling of Constant-Weight Words – Application to BIKE": r"Secure Sampling of Constant-Weight Words – Application to BIKE",
+    r"A Simple Deterministic Algorithm for Systems of Quadratic Polynomials over $\protect \mathbb  {F}_2$": r"A Simple Deterministic Algorithm for Systems of Quadratic Polynomials over $𝔽_2$",
+    r"“They’re not that hard to mitigate”: What Cryptographic Library Developers Think About Timing Attacks": r"“They’re not that hard to mitigate”: What Cryptographic Library Developers Think About Timing Attacks",
+    r"Information Security in the Quantum Era. Threats to modern cryptography: Grover’s algorithm": r"Information Security in the Quantum Era. Threats to modern cryptography: Grover’s algorithm",
+    r"Improving Support-Minors rank attacks: applications to G$e$MSS and Rainbow": r"Improving Support-Minors rank attacks: applications to G$e$MSS and Rainbow",
+    r"Invertible Quadratic Non-Linear Layers for MPC-/FHE-/ZK-Friendly Schemes over $\protect \mathbb  F_p^n$": r"Invertible Quadratic Non-Linear Layers for MPC-/FHE-/ZK-Friendly Schemes over $𝔽_p^n$",
+    r"Pre-Computation Scheme of Window $\tau $NAF for Koblitz Curves Revisited": r"Pre-Computation Scheme of Window $τ$NAF for Koblitz Curves Revisited",
+    r"Tight Security Bounds for Micali’s SNARGs": r"Tight Security Bounds for Micali’s SNARGs",
+    r"Indifferentiable hashing to ordinary elliptic $\protect \mathbb  {F}_{\protect \!q}$-curves of $j=0$ with the cost of one exponentiation in $\protect \mathbb  {F}_{\protect \!q}$": r"Indifferentiable hashing to ordinary elliptic $𝔽_q$-curves of $j=0$ with the cost of one exponentiation in $𝔽_q$",
+    r"A Compressed $\Sigma $-Protocol Theory for Lattices": r"A Compressed $Σ$-Protocol Theory for Lattices",
+    r"An $O(\log ^2 p)$ Approach to Point-Counting on Elliptic Curves From a Prominent Family Over the Prime Field $\protect \mathbb  {F}_p$": r"An $O(log^2 p)$ Approach to Point-Counting on Elliptic Curves From a Prominent Family Over the Prime Field $𝔽_p$",
+    r"Explicit connections between supersingular isogeny graphs and Bruhat–Tits trees": r"Explicit connections between supersingular isogeny graphs and Bruhat–Tits trees",
+    r"Stacking Sigmas: A Framework to Compose $\Sigma $-Protocols for Disjunctions": r"Stacking Sigmas: A Framework to Compose $Σ$-Protocols for Disjunctions",
+    r"Let’s Take it Offline: Boosting Brute-Force Attacks on iPhone’s User Authentication through SCA": r"Let’s Take it Offline: Boosting Brute-Force Attacks on iPhone’s User Authentication through SCA",
+    r"Upslices, Downslices, and Secret-Sharing with Complexity of $1.5^n$": r"Upslices, Downslices, and Secret-Sharing with Complexity of $1.5^n$",
+    r"CryptoGram: Fast Private Calculations of Histograms over Multiple Users’ Inputs": r"CryptoGram: Fast Private Calculations of Histograms over Multiple Users’ Inputs",
+    r"Cryptanalysis of Boyen’s Attribute-Based Encryption Scheme in TCC 2013": r"Cryptanalysis of Boyen’s Attribute-Based Encryption Scheme in TCC 2013",
+    r"Delegating Supersingular Isogenies over $\protect \mathbb  {F}_{p^2}$ with Cryptographic Applications": r"Delegating Supersingular Isogenies over $𝔽_{p^2}$ with Cryptographic Applications",
+    r"LogStack: Stacked Garbling with $O(b \log b)$ Computation": r"LogStack: Stacked Garbling with $O(b logb)$ Computation",
+    r"On the Possibility of Basing Cryptography on $EXP\protect \neq  BPP$": r"On the Possibility of Basing Cryptography on $EXP≠BPP$",
+    r"Efficient Sorting of Homomorphic Encrypted Data with $k$-way Sorting Network": r"Efficient Sorting of Homomorphic Encrypted Data with $k$-way Sorting Network",
+    r"Grover on Caesar and Vigenère Ciphers": r"Grover on Caesar and Vigenère Ciphers",
+    r"PrORAM: Fast $O(\log n)$ Private Coin ZK ORAM": r"PrORAM: Fast $O(logn)$ Private Coin ZK ORAM",
+    r"Side Channel Analysis against the ANSSI’s protected AES implementation on ARM": r"Side Channel Analysis against the ANSSI’s protected AES implementation on ARM",
+    r"Help, my Signal has bad Device! Breaking the Signal Messenger’s Post-CompromiseSecurity through a Malicious Device": r"Help, my Signal has bad Device! Breaking the Signal Messenger’s Post-CompromiseSecurity through a Malicious Device",
+    r"On the Design and Misuse of Microcoded (Embedded) Processors — A Cautionary Note": r"On the Design and Misuse of Microcoded (Embedded) Processors — A Cautionary Note",
+    r"Faster indifferentiable hashing to elliptic $\protect \mathbb  {F}_{\protect \!q^2}$-curves": r"Faster indifferentiable hashing to elliptic $𝔽_{q^2}$-curves",
+    r"Learnability of Multiplexer PUF and $S_N$-PUF : A Fourier-based Approach": r"Learnability of Multiplexer PUF and $S_N$-PUF : A Fourier-based Approach",
+    r"GenoPPML – a framework for genomic privacy-preserving machine learning": r"GenoPPML – a framework for genomic privacy-preserving machine learning",
+    r"Appenzeller to Brie: Efficient Zero-Knowledge Proofs for Mixed-Mode Arithmetic and $\protect \mathbb  {Z}_{2^k}$": r"Appenzeller to Brie: Efficient Zero-Knowledge Proofs for Mixed-Mode Arithmetic and $ℤ_{2^k}$",
+    r"A Note on ``Reduction Modulo $2^{448}-2^{224}-1$''": r"A Note on “Reduction Modulo $2^{448}-2^{224}-1$”",
+    r"SNARGs for $\protect \mathcal  {P}$ from LWE": r"SNARGs for $𝒫$ from LWE",
+    r"One-out-of-$q$ OT Combiners": r"One-out-of-$q$ OT Combiners",
+    r"MPC for $Q_2$ Access Structures over Rings and Fields": r"MPC for $Q_2$ Access Structures over Rings and Fields",
+    r"SoK: Gröbner Basis Algorithms for Arithmetization Oriented Ciphers": r"SoK: Gröbner Basis Algorithms for Arithmetization Oriented Ciphers",
+    r"Efficiency through Diversity in Ensemble Models applied to Side-Channel Attacks – A Case Study on Public-Key Algorithms –": r"Efficiency through Diversity in Ensemble Models applied to Side-Channel Attacks – A Case Study on Public-Key Algorithms –",
+    r"Tighter Security for Schnorr Identification and Signatures: A High-Moment Forking Lemma for $\Sigma $-Protocols": r"Tighter Security for Schnorr Identification and Signatures: A High-Moment Forking Lemma for $Σ$-Protocols",
+    r"SPHINCS-$\alpha $: A Compact Stateless Hash-Based Signature Scheme": r"SPHINCS-$α$: A Compact Stateless Hash-Based Signature Scheme",
+    r"NTRU-$\nu $-um: Secure Fully Homomorphic Encryption from NTRU with Small Modulus": r"NTRU-$ν$-um: Secure Fully Homomorphic Encryption from NTRU with Small Modulus",
+    r"Quantum Cryptanalysis of $5$ rounds Feistel schemes and Benes schemes": r"Quantum Cryptanalysis of $5$ rounds Feistel schemes and Benes schemes",
+    r"Evaluating the Security of Merkle-Damgård Hash Functions and Combiners in Quantum Settings": r"Evaluating the Security of Merkle-Damgård Hash Functions and Combiners in Quantum Settings",
+    r"On NTRU-ν-um Modulo $X^N − 1$": r"On NTRU-ν-um Modulo $X^N − 1$",
+    r"$\mu $Cash: Transparent Anonymous Transactions": r"$μ$Cash: Transparent Anonymous Transactions",
+    r"Arithmetization of Σ¹₁ relations with polynomial bounds in Halo 2": r"Arithmetization of Σ¹₁ relations with polynomial bounds in Halo 2",
+    r"Explicit infinite families of bent functions outside $\protect \mathcal  {MM}^\#$": r"Explicit infinite families of bent functions outside $ℳℳ^#$",
+    r"Threshold Linearly Homomorphic Encryption on $\protect \mathbf  {Z}/2^k\protect \mathbf  {Z}$": r"Threshold Linearly Homomorphic Encryption on $𝐙/2^k𝐙$",
+    r"The Scholz conjecture on addition chain is true for $v(n)= 4$": r"The Scholz conjecture on addition chain is true for $v(n)= 4$",
+    r"On the Performance Gap of a Generic C Optimized Assembler and Wide Vector Extensions for Masked Software with an Ascon-{\protect \it  {p}} test case": r"On the Performance Gap of a Generic C Optimized Assembler and Wide Vector Extensions for Masked Software with an Ascon-p test case",
+    r"Second-Order Low-Randomness $d+1$ Hardware Sharing of the AES": r"Second-Order Low-Randomness $d+1$ Hardware Sharing of the AES",
+    r"Bounded Surjective Quadratic Functions over $\protect \mathbb  F_p^n$ for MPC-/ZK-/FHE-Friendly Symmetric Primitives": r"Bounded Surjective Quadratic Functions over $𝔽_p^n$ for MPC-/ZK-/FHE-Friendly Symmetric Primitives",
+    r"Hitchhiker’s Guide to a Practical Automated TFHE Parameter Setup for Custom Applications": r"Hitchhiker’s Guide to a Practical Automated TFHE Parameter Setup for Custom Applications",
+    r"On Polynomial Functions Modulo $p^e$ and Faster Bootstrapping for Homomorphic Encryption": r"On Polynomial Functions Modulo $p^e$ and Faster Bootstrapping for Homomorphic Encryption",
+    r"Weightwise almost perfectly balanced functions: secondary constructions for all $n$ and better weightwise nonlinearities": r"Weightwise almost perfectly balanced functions: secondary constructions for all $n$ and better weightwise nonlinearities",
+    r"How to Meet Ternary LWE Keys on Babai’s Nearest Plane": r"How to Meet Ternary LWE Keys on Babai’s Nearest Plane",
+    r"K-XMSS and K-SPHINCS$^+$:Hash based Signatures with\\Korean Cryptography Algorithms": r"K-XMSS and K-SPHINCS$^+$:Hash based Signatures with Korean Cryptography Algorithms",
+    r"DAG-$\Sigma $: A DAG-based Sigma Protocol for Relations in CNF": r"DAG-$Σ$: A DAG-based Sigma Protocol for Relations in CNF",
+    r"Applications of the indirect sum in the design of several special classes of bent functions outside the completed $\protect \mathcal  {MM}$ class": r"Applications of the indirect sum in the design of several special classes of bent functions outside the completed $ℳℳ$ class",
+    r"Polynomial-Time Cryptanalysis of the Subspace Flooding Assumption for Post-Quantum $i\protect \mathcal  {O}$": r"Polynomial-Time Cryptanalysis of the Subspace Flooding Assumption for Post-Quantum $i𝒪$",
+    r"An algorithm for efficient detection of $(N,N)$-splittings and its application to the isogeny problem in dimension 2": r"An algorithm for efficient detection of $(N,N)$-splittings and its application to the isogeny problem in dimension 2",
+    r"Demystifying the comments made on “A Practical Full Key Recovery Attack on TFHE and FHEW by Inducing Decryption Errors”": r"Demystifying the comments made on “A Practical Full Key Recovery Attack on TFHE and FHEW by Inducing Decryption Errors”",
+    r"Vector Commitments over Rings and Compressed $\Sigma $-Protocols": r"Vector Commitments over Rings and Compressed $Σ$-Protocols",
+    r"Guaranteed Output in $O(\protect \sqrt  {n})$ Rounds for Round-Robin Sampling Protocols": r"Guaranteed Output in $O(√(n))$ Rounds for Round-Robin Sampling Protocols",
+    r"Promise $\Sigma $-protocol: How to Construct Efficient Threshold ECDSA from Encryptions Based on Class Groups": r"Promise $Σ$-protocol: How to Construct Efficient Threshold ECDSA from Encryptions Based on Class Groups",
+    r"On Time-Space Tradeoffs for Bounded-Length Collisions in Merkle-Damgård Hashing": r"On Time-Space Tradeoffs for Bounded-Length Collisions in Merkle-Damgård Hashing",
+    r"Beyond the Csiszár-Körner Bound: Best-Possible Wiretap Coding via Obfuscation": r"Beyond the Csiszár-Körner Bound: Best-Possible Wiretap Coding via Obfuscation",
+    r"Recovering the tight security proof of $SPHINCS^{+}$": r"Recovering the tight security proof of $SPHINCS^+$",
+    r"Fast Subgroup Membership Testings for $\protect \mathbb  {G}_1$, $\protect \mathbb  {G}_2$ and $\protect \mathbb  {G}_T$ on Pairing-friendly Curves": r"Fast Subgroup Membership Testings for $𝔾_1$, $𝔾_2$ and $𝔾_T$ on Pairing-friendly Curves",
+    r"An Improved Model on the Vague Sets-Based DPoS’s Voting Phase in Blockchain": r"An Improved Model on the Vague Sets-Based DPoS’s Voting Phase in Blockchain",
+    r"The Inverse of $\chi $ and Its Applications to Rasta-like Ciphers": r"The Inverse of $χ$ and Its Applications to Rasta-like Ciphers",
+    r"New optimization techniques for PlonK’s arithmetization": r"New optimization techniques for PlonK’s arithmetization",
+    r"Băhēm: A Provably Secure Symmetric Cipher": r"Băhēm: A Provably Secure Symmetric Cipher",
+    r"India’s “Aadhaar” Biometric ID: Structure, Security, and Vulnerabilities": r"India’s “Aadhaar” Biometric ID: Structure, Security, and Vulnerabilities",
+    r"Drive (Quantum) Safe! – Towards PQ Authentication for V2V Communications": r"Drive (Quantum) Safe! – Towards PQ Authentication for V2V Communications",
+    r"Two new classes of permutation trinomials over $\protect \mathbb  {F}_{q^3}$ with odd characteristic": r"Two new classes of permutation trinomials over $𝔽_{q^3}$ with odd characteristic",
+    r"Don’t Learn What You Already Know: Scheme-Aware Modeling for Profiling Side-Channel Analysis against Masking": r"Don’t Learn What You Already Know: Scheme-Aware Modeling for Profiling Side-Channel Analysis against Masking",
+    r"Single-Trace Side-Channel Attacks on ω-Small Polynomial Sampling: With Applications to NTRU, NTRU Prime, and CRYSTALS-DILITHIUM": r"Single-Trace Side-Channel Attacks on ω-Small Polynomial Sampling: With Applications to NTRU, NTRU Prime, and CRYSTALS-DILITHIUM",
+    r"Băhēm: A Symmetric Cipher with Provable 128-bit Security": r"Băhēm: A Symmetric Cipher with Provable 128-bit Security",
+    r"The Generals’ Scuttlebutt: Byzantine-Resilient Gossip Protocols": r"The Generals’ Scuttlebutt: Byzantine-Resilient Gossip Protocols",
+    r"Byzantine Reliable Broadcast with $O(nL+kn+n^2 log n)$ Communication": r"Byzantine Reliable Broadcast with $O(nL+kn+n^2 log n)$ Communication",
+    r"Find the Bad Apples: An efficient method for perfect key recovery under imperfect SCA oracles – A case study of Kyber": r"Find the Bad Apples: An efficient method for perfect key recovery under imperfect SCA oracles – A case study of Kyber",
+    r"On the Differential Spectrum of a Differentially $3$-Uniform Power Function": r"On the Differential Spectrum of a Differentially $3$-Uniform Power Function",
+    r"The $c-$differential uniformity and boomerang uniformity of three classes of permutation polynomials over $\protect \mathbb  {F}_{2^n}$": r"The $c-$differential uniformity and boomerang uniformity of three classes of permutation polynomials over $𝔽_{2^n}$",
+    r"Proof of Mirror Theory for a Wide Range of $\xi _{\max }$": r"Proof of Mirror Theory for a Wide Range of $ξ_{max}$",
+    r"Tight Multi-User Security Bound of $\protect \textsf  {DbHtS}$": r"Tight Multi-User Security Bound of $DbHtS$",
+    r"LIKE – Lattice Isomorphism-based Non-Interactive Key Exchange via Group Actions": r"LIKE – Lattice Isomorphism-based Non-Interactive Key Exchange via Group Actions",
+    r"Breaking the quadratic barrier: Quantum cryptanalysis of Milenage, telecommunications’ cryptographic backbone": r"Breaking the quadratic barrier: Quantum cryptanalysis of Milenage, telecommunications’ cryptographic backbone",
+    r"SwiftEC: Shallue–van de Woestijne Indifferentiable Function To Elliptic Curves": r"SwiftEC: Shallue–van de Woestijne Indifferentiable Function To Elliptic Curves",
+    r"Arithmetization of Σ¹₁ relations in Halo 2": r"Arithmetization of Σ¹₁ relations in Halo 2",
+    r"Simon’s Algorithm and Symmetric Crypto: Generalizations and Automatized Applications": r"Simon’s Algorithm and Symmetric Crypto: Generalizations and Automatized Applications",
+    r"More Efficient Dishonest Majority Secure Computation over $\protect \mathbb  {Z}_{2^k}$ via Galois Rings": r"More Efficient Dishonest Majority Secure Computation over $ℤ_{2^k}$ via Galois Rings",
+    r"Moz$\protect \mathbb  {Z}_{2^k}$arella: Efficient Vector-OLE and Zero-Knowledge Proofs Over $\protect \mathbb  {Z}_{2^k}$": r"Moz$ℤ_{2^k}$arella: Efficient Vector-OLE and Zero-Knowledge Proofs Over $ℤ_{2^k}$",
+    r"\protect \(\protect \texttt  {POLKA}\protect \): Towards Leakage-Resistant Post-Quantum CCA-Secure Public Key Encryption": r"\(POLKA\): Towards Leakage-Resistant Post-Quantum CCA-Secure Public Key Encryption",
+    r"$\protect \texttt  {zk-creds}$: Flexible Anonymous Credentials from zkSNARKs and Existing Identity Infrastructure": r"$zk-creds$: Flexible Anonymous Credentials from zkSNARKs and Existing Identity Infrastructure",
+    r"Efficient supersingularity testing over $\protect \mathbb  {F}_p$ and CSIDH key validation": r"Efficient supersingularity testing over $𝔽_p$ and CSIDH key validation",
+    r"Time-Space Lower Bounds for Finding Collisions in Merkle-Damgård Hash Functions": r"Time-Space Lower Bounds for Finding Collisions in Merkle-Damgård Hash Functions",
+    r"Post-quantum hash functions using $\protect \mathrm  {SL}_n(\protect \mathbb  {F}_p)$": r"Post-quantum hash functions using $SL_n(𝔽_p)$",
+    r"Low-Delay 4, 5 and 6-Term Karatsuba Formulae in $\protect \mathbb  {F}_2[x]$ Using Overlap-free Splitting": r"Low-Delay 4, 5 and 6-Term Karatsuba Formulae in $𝔽_2[x]$ Using Overlap-free Splitting",
+    r"MR-DSS – Smaller MinRank-based (Ring-)Signatures": r"MR-DSS – Smaller MinRank-based (Ring-)Signatures",
+    r"A Signature-Based Gröbner Basis Algorithm with Tail-Reduced Reductors (M5GB)": r"A Signature-Based Gröbner Basis Algorithm with Tail-Reduced Reductors (M5GB)",
+    r"An $\protect \mathcal  {O}(n)$ Algorithm for Coefficient Grouping": r"An $𝒪(n)$ Algorithm for Coefficient Grouping",
+    r"Fast Hashing to $G_2$ in Direct Anonymous Attestation": r"Fast Hashing to $G_2$ in Direct Anonymous Attestation",
+    r"The Scholz conjecture on addition chain is true for infinitely many integers with ℓ(2n) = ℓ(n)": r"The Scholz conjecture on addition chain is true for infinitely many integers with ℓ(2n) = ℓ(n)",
+    r"Verification of the (1–δ)-Correctness Proof of CRYSTALS-KYBER with Number Theoretic Transform": r"Verification of the (1–δ)-Correctness Proof of CRYSTALS-KYBER with Number Theoretic Transform",
+    r"Grotto: Screaming fast $(2 + 1)$-PC for $\protect \mathbb  {Z}_{2^{n}}$ via (2, 2)-DPFs": r"Grotto: Screaming fast $(2 + 1)$-PC for $ℤ_{2^n}$ via (2, 2)-DPFs",
+    r"Homomorphic Sortition – Single Secret Leader Election for PoS Blockchains": r"Homomorphic Sortition – Single Secret Leader Election for PoS Blockchains",
+    r"Hashing to elliptic curves over highly $2$-adic fields $\protect \mathbb  {F}_{\protect \!q}$ with $O(\log (q))$ operations in $\protect \mathbb  {F}_{\protect \!q}$": r"Hashing to elliptic curves over highly $2$-adic fields $𝔽_q$ with $O(log(q))$ operations in $𝔽_q$",
+    r"More Efficient Zero-Knowledge Protocols over $\protect \mathbb  {Z}_{2^k}$ via Galois Rings": r"More Efficient Zero-Knowledge Protocols over $ℤ_{2^k}$ via Galois Rings",
+    r"Practical Improvement to Gaudry-Schost Algorithm on Subgroups of $\protect \mathbb  {Z}^{*}_{p}$": r"Practical Improvement to Gaudry-Schost Algorithm on Subgroups of $ℤ^*_p$",
+    r"Degree-$D$ Reverse Multiplication-Friendly Embeddings: Constructions and Applications": r"Degree-$D$ Reverse Multiplication-Friendly Embeddings: Constructions and Applications",
+    r"Maravedí: A Secure and Practical Protocol to Trade Risk for Instantaneous Finality": r"Maravedí: A Secure and Practical Protocol to Trade Risk for Instantaneous Finality",
+    r"A simpler alternative to Lucas–Lehmer–Riesel primality test": r"A simpler alternative to Lucas–Lehmer–Riesel primality test",
+    r"CNF Characterization of Sets over $\protect \mathbb  {Z}_2^n$ and Its Applications in Cryptography": r"CNF Characterization of Sets over $ℤ_2^n$ and Its Applications in Cryptography",
+    r"Differential Fault Attack on Rasta and $\protect \text  {FiLIP} _ {\protect \text  {DSM}}$": r"Differential Fault Attack on Rasta and $FiLIP _ {DSM}$",
+    r"The state diagram of $\chi $": r"The state diagram of $χ$",
+    r"Efficient computation of $(3^n,3^n)$-isogenies": r"Efficient computation of $(3^n,3^n)$-isogenies",
+    r"Origami: Fold a Plonk for Ethereum’s VDF": r"Origami: Fold a Plonk for Ethereum’s VDF",
+    r"Batching Cipolla-Lehmer-Müller's square root algorithm with hashing to elliptic curves": r"Batching Cipolla-Lehmer-Müller's square root algorithm with hashing to elliptic curves",
+    r"Machine-Checked Security for $\protect \mathrm  {XMSS}$ as in RFC 8391 and $\protect \mathrm  {SPHINCS}^{+}$": r"Machine-Checked Security for $XMSS$ as in RFC 8391 and $SPHINCS^+$",
+    r"Minimal $p$-ary codes from non-covering permutations": r"Minimal $p$-ary codes from non-covering permutations",
+    r"Provable Lattice Reduction of $\protect \mathbb  Z^n$ with Blocksize $n/2$": r"Provable Lattice Reduction of $ℤ^n$ with Blocksize $n/2$",
+    r"On a result by Paul Erdős (a.k.a. Paul Erd\H {o}s)": r"On a result by Paul Erdős (a.k.a. Paul Erdős)"}
@@ -0,0 +1,188 @@
+#!/usr/bin/python3
+"""
+Convert the abstracts of many papers from LaTeX to JATS with pandoc. pypandoc starts
+a pandoc process for every call, which takes longer than converting a typical
+abstract, so AbstractConverter joins many abstracts into one document with a
+separator paragraph between them, converts it with one pandoc process, and splits
+the JATS at the separators. Abstracts that define macros are converted on their own,
+since the macros would apply to the abstracts after them, and a batch whose output
+does not split into the right number of well-formed pieces is converted one
+abstract at a time.
+Conversions are cached by a hash of the abstract, in memory and optionally in a
+directory. Run it with
+
+  python abstracts.py --cache_dir /tmp/abstracts paper1/abstract.tex paper2/abstract.tex
+
+to print a JSON object per abstract with its path, jats, and timing.
+"""
+
+import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import time
+from xml.etree import ElementTree as ET
+
+# jats is the converted abstract. seconds is the time for the conversion, which is
+# the time of its batch divided by the number of abstracts in it, and 0 if cached
+# is True.
+ConvertedAbstract = namedtuple('ConvertedAbstract', ['jats', 'seconds', 'cached'])
+
+# A paragraph that is never in an abstract. The number is the index in the batch.
+_SEPARATOR = 'IACRCCABSTRACTSEPARATOR{}'
+_SEPARATOR_P = re.compile(r'\s*<p>IACRCCABSTRACTSEPARATOR(\d+)</p>\s*')
+_DEFINES_MACROS = re.compile(r'\\(newcommand|renewcommand|providecommand|def|let|DeclareMathOperator)\b')
+
+def pandoc_latex_to_jats(text):
+    """Convert LaTeX to JATS with pandoc."""
+    import pypandoc # slow to import, and only needed for abstracts.
+    return pypandoc.convert_text(text, 'jats', 'latex')
+
+def _pandoc_version():
+    import pypandoc
+    return pypandoc.get_pandoc_version()
+
+def _normalize(jats):
+    """The same abstract is stored in the same form, whether it was converted in a
+       batch or on its own."""
+    return jats.strip() + '\n'
+
+def _is_well_formed(jats):
+    """Return True if jats is a sequence of complete XML elements and text."""
+    try:
+        ET.fromstring('<abstract>{}</abstract>'.format(jats))
+    except ET.ParseError:
+        return False
+    return True
+
+class AbstractConverter:
+    """Converts abstracts to JATS in batches. Instances may be shared by threads.
+    args:
+       batch_size: maximum number of abstracts for one pandoc process.
+       jobs: maximum number of pandoc processes at the same time.
+       cache_dir: optional directory to keep the conversions between runs.
+       convert: the function to convert a LaTeX document, with pandoc by default.
+       version: a string for the version of convert, which is part of the keys in
+                cache_dir. The default is the version of pandoc.
+    """
+    def __init__(self, batch_size=50, jobs=2, cache_dir=None, convert=None, version=None):
+        self.batch_size = batch_size
+        self.jobs = jobs
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._convert_text = convert or pandoc_latex_to_jats
+        self._version = version
+        self._memory = {}
+
+    def _key(self, abstract):
+        return hashlib.sha256(abstract.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        if self._version is None:
+            self._version = _pandoc_version()
+        digest = hashlib.sha256('{}\0{}'.format(self._version, key).encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / digest[2:]
+
+    def _lookup(self, key):
+        if key in self._memory:
+            return self._memory[key]
+        if self.cache_dir is not None:
+            try:
+                jats = self._path(key).read_text(encoding='utf-8')
+            except FileNotFoundError:
+                return None
+            self._memory[key] = jats
+            return jats
+        return None
+
+    def _store(self, key, jats):
+        self._memory[key] = jats
+        if self.cache_dir is not None:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name('{}.{}.tmp'.format(path.name, os.getpid()))
+            tmp_path.write_text(jats, encoding='utf-8')
+            os.replace(tmp_path, path)
+
+    def _convert_batch(self, abstracts):
+        """Return the list of (jats, seconds) for abstracts, with one pandoc process
+           if possible."""
+        start = time.perf_counter()
+        if len(abstracts) > 1:
+            text = '\n\n'.join('{}\n\n{}'.format(_SEPARATOR.format(i), abstract)
+                               for i, abstract in enumerate(abstracts))
+            pieces = _SEPARATOR_P.split(self._convert_text(text))
+            # pieces is ['', '0', jats0, '1', jats1, ...] if nothing went wrong. A
+            # \section in an abstract makes pandoc put the separators after it in a <sec>,
+            # so the pieces must also be well-formed on their own.
+            if (len(pieces) == 2 * len(abstracts) + 1 and not pieces[0]
+                and pieces[1::2] == [str(i) for i in range(len(abstracts))]
+                and all(_is_well_formed(jats) for jats in pieces[2::2])):
+                seconds = (time.perf_counter() - start) / len(abstracts)
+                return [(_normalize(jats), seconds) for jats in pieces[2::2]]
+        results = []
+        for abstract in abstracts:
+            start = time.perf_counter()
+            jats = _normalize(self._convert_text(abstract))
+            results.append((jats, time.perf_counter() - start))
+        return results
+
+    def convert_many(self, abstracts):
+        """Return a ConvertedAbstract for each of the LaTeX strings abstracts."""
+        keys = [self._key(abstract) for abstract in abstracts]
+        results = {}
+        todo = {}
+        for key, abstract in zip(keys, abstracts):
+            jats = self._lookup(key)
+            if jats is not None:
+                results[key] = ConvertedAbstract(jats, 0.0, True)
+            else:
+                todo[key] = abstract
+        batches = []
+        batch = []
+        for key, abstract in todo.items():
+            if _DEFINES_MACROS.search(abstract):
+                batches.append([key])
+                continue
+            batch.append(key)
+            if len(batch) == self.batch_size:
+                batches.append(batch)
+                batch = []
+        if batch:
+            batches.append(batch)
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            converted = executor.map(lambda batch: self._convert_batch([todo[key] for key in batch]),
+                                     batches)
+            for batch, batch_results in zip(batches, converted):
+                for key, (jats, seconds) in zip(batch, batch_results):
+                    self._store(key, jats)
+                    results[key] = ConvertedAbstract(jats, seconds, False)
+        return [results[key] for key in keys]
+
+    def convert(self, abstract):
+        """Return the JATS for one abstract."""
+        return self.convert_many([abstract])[0].jats
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Convert abstracts from LaTeX to JATS')
+    argparser.add_argument('abstracts',
+                           nargs='+',
+                           help='abstract files extracted by iacrcc.cls')
+    argparser.add_argument('--batch_size',
+                           type=int,
+                           default=50,
+                           help='maximum number of abstracts for each pandoc process')
+    argparser.add_argument('--jobs',
+                           type=int,
+                           default=2,
+                           help='maximum number of pandoc processes at the same time')
+    argparser.add_argument('--cache_dir',
+                           help='Optional directory to cache the conversions')
+    args = argparser.parse_args()
+    converter = AbstractConverter(args.batch_size, args.jobs, args.cache_dir)
+    texts = [Path(path).read_text(encoding='utf-8') for path in args.abstracts]
+    for path, result in zip(args.abstracts, converter.convert_many(texts)):
+        print(json.dumps(dict(result._asdict(), path=path)))
@@ -0,0 +1,378 @@
+"""
+Benchmarks for meta.py and meta_worker.py. These are not run as part of the tests.
+Run them from the tools directory with
+
+  python benchmark.py [--repeat N] [name ...]
+
+Each benchmark reports a measurement, usually the average wall clock time per
+iteration, for one or more variants so that the effect of a change can be compared
+on the same machine.
+"""
+
+import argparse
+import io
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+TOOLS = Path(__file__).resolve().parent
+TESTDATA = TOOLS / 'testdata'
+sys.path.insert(0, str(TOOLS.parents[1]))
+
+def _time_per_call(func, repeat):
+    """Return the average number of seconds for func() over repeat calls."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def _timed(variant, func, repeat):
+    """Return a result row with the time per call in milliseconds."""
+    return (variant, _time_per_call(func, repeat) * 1e3, 'ms')
+
+class WorkerClient:
+    """Starts meta_worker.py reading from a pipe, and sends it requests."""
+    def __init__(self, *args):
+        self.proc = subprocess.Popen([sys.executable, str(TOOLS / 'meta_worker.py')] + list(args),
+                                     stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     text=True)
+        self.next_id = 0
+
+    def request(self, op, **kwargs):
+        """Send a request and return the response."""
+        self.next_id += 1
+        kwargs.update({'id': self.next_id, 'op': op})
+        self.proc.stdin.write(json.dumps(kwargs) + '\n')
+        self.proc.stdin.flush()
+        return json.loads(self.proc.stdout.readline())
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+def bench_worker_latency(repeat):
+    """Latency of producing the JSON and crossref XML for test1.meta by running meta.py
+       for each paper vs. sending requests to a running meta_worker.py."""
+    metafile = str(TESTDATA / 'test1.meta')
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        def cli(*args):
+            subprocess.run([sys.executable, str(TOOLS / 'meta.py'), '--input', metafile] + list(args),
+                           check=True)
+        jsonfile = str(Path(tmpdir) / 'test1.json')
+        xmlfile = str(Path(tmpdir) / 'test1.xml')
+        results.append(_timed('meta.py --json', lambda: cli('--json', jsonfile), repeat))
+        results.append(_timed('meta.py --crossref', lambda: cli('--crossref', xmlfile), repeat))
+    client = WorkerClient()
+    try:
+        client.request('json', input=metafile) # wait for it to start.
+        results.append(_timed('worker json', lambda: client.request('json', input=metafile), repeat))
+        results.append(_timed('worker crossref', lambda: client.request('crossref', input=metafile), repeat))
+        results.append(_timed('worker parse', lambda: client.request('parse', input=metafile), repeat))
+    finally:
+        client.close()
+    return results
+
+def _deposit_data(count):
+    """Return the data of test1.meta with its citations that have a DOI repeated to
+       have count of them, so that all of them are in the deposit."""
+    from iacrcc.tools import meta
+    data = meta.read_meta(TESTDATA / 'test1.meta')
+    citations = [citation for citation in data['citations'] if 'doi' in citation]
+    data['citations'] = [dict(citations[i % len(citations)], id='ref{}'.format(i)) for i in range(count)]
+    return data
+
+def _peak_kb(func):
+    """Return the peak memory in KiB allocated by python during func()."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+def bench_citations_writer(repeat):
+    """Time and peak memory to write the XMP file for a bibliography with 5000
+       citations, by building the whole tree as meta.py used to vs. write_citations,
+       and the peak memory of write_citations for 1000 citations."""
+    from iacrcc.tools import meta
+    from xml.etree import ElementTree as ET
+    data = meta.read_meta(TESTDATA / 'test1.meta')
+    citations = data['citations']
+    def bibliography(count):
+        return {'citations': [dict(citations[i % len(citations)], id='ref{}'.format(i)) for i in range(count)]}
+    big = bibliography(5000)
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / 'citations.xmp'
+        def tree():
+            ET.ElementTree(meta.build_citations(big)).write(path, encoding='UTF-8', xml_declaration=False)
+        def stream(data=big):
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                meta.write_citations(data, f)
+        tree() # fill the caches of the decoder.
+        results.append(_timed('5000 citations, tree', tree, repeat))
+        results.append(_timed('write_citations', stream, repeat))
+        results.append(('tree peak memory', _peak_kb(tree), 'KiB'))
+        results.append(('write_citations peak memory', _peak_kb(stream), 'KiB'))
+        small = bibliography(1000)
+        results.append(('1000 citations, write_citations peak memory', _peak_kb(lambda: stream(small)), 'KiB'))
+    return results
+
+def bench_crossref_writer(repeat):
+    """Time and peak memory to write the crossref XML of a deposit with 500 citations,
+       with the minidom round trip that meta.py used to indent it vs. write_xml to a
+       string and to a file."""
+    from iacrcc.tools import meta
+    from xml.dom import minidom
+    from xml.etree import ElementTree as ET
+    data = _deposit_data(500)
+    def old():
+        root = meta.build_crossref(data, '10.1234/12345')
+        return minidom.parseString(ET.tostring(root, encoding='unicode', xml_declaration=True)).toprettyxml(indent='   ')
+    results = [_timed('build_crossref', lambda: meta.build_crossref(data, '10.1234/12345'), repeat),
+               _timed('minidom', old, repeat),
+               _timed('write_xml to string', lambda: meta.crossref_xml(data, '10.1234/12345'), repeat)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        def to_file():
+            with open(Path(tmpdir) / 'deposit.xml', 'w', encoding='utf-8') as f:
+                meta.write_xml(meta.build_crossref(data, '10.1234/12345'), f)
+        results.append(_timed('write_xml to file', to_file, repeat))
+        results.append(('minidom peak memory', _peak_kb(old), 'KiB'))
+        results.append(('write_xml to file peak memory', _peak_kb(to_file), 'KiB'))
+    return results
+
+def bench_mathml_cache(repeat):
+    """Time to convert the titles with math from parser/testdata/eprint_titles.py with
+       title_to_crossref three times, as for three deposits, without a cache, with a
+       cache in memory, and with a directory that was filled by an earlier run."""
+    from iacrcc.tools import meta
+    from iacrcc.tools.mathml_cache import MathmlCache
+    from iacrcc.parser.testdata.eprint_titles import EPRINT_TITLES
+    titles = sorted(title for title in EPRINT_TITLES if '$' in title) * 3
+    def convert_titles():
+        for title in titles:
+            meta.title_to_crossref('title', meta.Title(title))
+    results = []
+    saved = meta.mathml
+    try:
+        meta.mathml = MathmlCache(maxsize=0)
+        results.append(_timed('{} titles, no cache'.format(len(titles)), convert_titles, repeat))
+        def memory():
+            meta.mathml = MathmlCache()
+            convert_titles()
+        results.append(_timed('memory', memory, repeat))
+        results.append(('memory hit rate', 100 * meta.mathml.stats().hit_rate, '%'))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            meta.mathml = MathmlCache(cache_dir=tmpdir)
+            convert_titles()
+            def disk():
+                meta.mathml = MathmlCache(cache_dir=tmpdir)
+                convert_titles()
+            results.append(_timed('filled directory', disk, repeat))
+            results.append(('filled directory hit rate', 100 * meta.mathml.stats().hit_rate, '%'))
+    finally:
+        meta.mathml = saved
+    return results
+
+# The git revision of meta.py to compare with, from --baseline.
+BASELINE = 'HEAD'
+
+def _baseline_meta():
+    """Return meta.py at BASELINE as a module, or None if git cannot find it."""
+    import importlib.util
+    proc = subprocess.run(['git', 'show', '{}:./meta.py'.format(BASELINE)],
+                          cwd=TOOLS, capture_output=True, text=True)
+    if proc.returncode:
+        return None
+    tmpdir = tempfile.mkdtemp()
+    path = Path(tmpdir) / 'meta_baseline.py'
+    # Older versions insert their parent directory into sys.path, which should be the
+    # iacrcc directory. Newer ones import the modules next to them relative to the package.
+    path.write_text(proc.stdout.replace('Path(__file__).resolve().parent.parent',
+                                        repr(str(TOOLS.parent))), encoding='utf-8')
+    spec = importlib.util.spec_from_file_location('iacrcc.tools.meta_baseline', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def bench_read_meta(repeat):
+    """Time to read test1.meta with meta.read_meta and parse_meta, and with read_meta
+       from meta.py at --baseline, which may be the version with its own parser."""
+    from iacrcc.tools import meta
+    from iacrcc.parser.meta_parse import parse_meta, get_shared_decoder
+    metafile = TESTDATA / 'test1.meta'
+    text = metafile.read_text(encoding='utf-8')
+    meta.read_meta(metafile) # import nameparser and fill the caches.
+    results = [_timed('read_meta', lambda: meta.read_meta(metafile), repeat)]
+    def cold():
+        meta.decoder.cache_clear()
+        meta.read_meta(metafile)
+    results.append(_timed('read_meta, cleared decoder cache', cold, repeat))
+    results.append(_timed('parse_meta', lambda: parse_meta(text), repeat))
+    def parse_meta_cold():
+        get_shared_decoder().cache_clear()
+        parse_meta(text)
+    results.append(_timed('parse_meta, cleared decoder cache', parse_meta_cold, repeat))
+    baseline = _baseline_meta()
+    if baseline is not None:
+        results.append(_timed('read_meta at ' + BASELINE, lambda: baseline.read_meta(metafile), repeat))
+    return results
+
+def _survey_meta(path, count):
+    """Write a .meta file to path with the citations of test1.meta repeated to have
+       count of them, with different names so that the decoder cache does not help.
+       Returns the number of citations."""
+    header = []
+    citations = []
+    for line in (TESTDATA / 'test1.meta').read_text(encoding='utf-8').splitlines():
+        if citations or line.startswith('citation:'):
+            citations.append(line)
+        else:
+            header.append(line)
+    lines = list(header)
+    copy = 0
+    while sum(line.startswith('citation:') for line in lines) < count:
+        copy += 1
+        for line in citations:
+            if line.startswith('citation:'):
+                line += str(copy)
+            elif line.startswith(('  author:', '  surname:', '  authors:')):
+                line += "{\\'e}" + str(copy)
+            lines.append(line)
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return sum(line.startswith('citation:') for line in lines)
+
+def bench_citation_decoding(repeat):
+    """Time to read a survey with 300 citations and write each output, with an empty
+       decoder cache. read_meta keeps the names of citation authors as TeX, so crossref
+       only decodes the first surname of the citations with a DOI."""
+    from iacrcc.tools import meta
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        metafile = Path(tmpdir) / 'survey.meta'
+        count = _survey_meta(metafile, 300)
+        meta.read_meta(metafile)
+        def run(output):
+            meta.decoder.cache_clear()
+            output(meta.read_meta(metafile))
+        results.append(_timed('{} citations, read_meta'.format(count), lambda: run(lambda data: None), repeat))
+        results.append(_timed('read_meta, crossref', lambda: run(lambda data: meta.build_crossref(data, '10.1/2')), repeat))
+        results.append(_timed('read_meta, json', lambda: run(lambda data: json.dumps(meta.meta_json(data))), repeat))
+        results.append(_timed('read_meta, citations', lambda: run(meta.build_citations), repeat))
+    return results
+
+def bench_citation_jobs(repeat):
+    """Time to write the crossref XML and the XMP file for a survey with 2000 citations
+       with different names, with an empty decoder cache, with 1, 2 and 4 processes."""
+    from iacrcc.tools import meta
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        metafile = Path(tmpdir) / 'survey.meta'
+        count = _survey_meta(metafile, 2000)
+        data = meta.read_meta(metafile)
+        outputs = {}
+        for jobs in (1, 2, 4):
+            def run():
+                meta.decoder.cache_clear()
+                outputs[jobs] = (meta.crossref_xml(data, '10.1/2', 'batch', jobs=jobs),
+                                 meta.citations_xmp(data, jobs=jobs))
+            results.append(_timed('{} citations, jobs={}'.format(count, jobs), run, repeat))
+        # The timestamps may differ.
+        for jobs in (2, 4):
+            assert outputs[jobs][1] == outputs[1][1]
+    return results
+
+def bench_all_outputs(repeat):
+    """Time to write the JSON, the crossref XML and the XMP file for a survey with 300
+       citations from the data of read_meta, as meta.py does with all three options,
+       with meta.py and with meta.py at --baseline. The outputs share one Paper from
+       normalize_meta, which keeps the decoded title, while the names of the authors
+       of citations are shared by the decoder cache. With an empty decoder cache, and
+       with the caches filled by the previous iteration. The number of strings that
+       are looked up in the decoder cache shows how much decoding the outputs repeat."""
+    from iacrcc.tools import meta
+    baseline = _baseline_meta()
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        metafile = Path(tmpdir) / 'survey.meta'
+        count = _survey_meta(metafile, 300)
+        data = meta.read_meta(metafile)
+        def current():
+            paper = meta.normalize_meta(data)
+            json.dumps(meta.meta_json(paper), indent=2)
+            meta.write_xml(meta.build_crossref(paper, '10.1/2'), io.StringIO())
+            meta.write_citations(paper, io.StringIO())
+        variants = [('meta.py', meta, current)]
+        if baseline is not None:
+            def old():
+                json.dumps(baseline.meta_json(data), indent=2)
+                baseline.write_xml(baseline.build_crossref(data, '10.1/2'), io.StringIO())
+                baseline.write_citations(data, io.StringIO())
+            variants.append(('meta.py at ' + BASELINE, baseline, old))
+        for name, module, run in variants:
+            def cold():
+                module.decoder.cache_clear()
+                run()
+            run()
+            results.append(_timed('{} citations, {}'.format(count, name), run, repeat))
+            results.append(_timed('{}, cleared decoder cache'.format(name), cold, repeat))
+            before = module.decoder.cache_info()
+            run()
+            after = module.decoder.cache_info()
+            results.append(('{}, decoder lookups'.format(name),
+                            after.hits + after.misses - before.hits - before.misses, ''))
+    return results
+
+def bench_abstracts(repeat):
+    """Time per abstract to convert 100 abstracts with pandoc, one process per abstract
+       as meta.py did vs. in batches with AbstractConverter. This needs pandoc."""
+    from iacrcc.tools.abstracts import AbstractConverter
+    from iacrcc.parser.testdata.eprint_titles import EPRINT_TITLES
+    titles = sorted(EPRINT_TITLES)[:100]
+    texts = ['We study {}. In \\emph{{this}} paper, we show that $x^{{{}}}$ is hard.'.format(title, i)
+             for i, title in enumerate(titles)]
+    results = []
+    for batch_size, jobs in [(1, 1), (25, 1), (25, 4)]:
+        def convert():
+            AbstractConverter(batch_size, jobs).convert_many(texts)
+        seconds = _time_per_call(convert, repeat) / len(texts)
+        results.append(('batch_size={} jobs={}'.format(batch_size, jobs), seconds * 1e3, 'ms'))
+    return results
+
+BENCHMARKS = {'abstracts': bench_abstracts,
+              'all_outputs': bench_all_outputs,
+              'citation_decoding': bench_citation_decoding,
+              'citation_jobs': bench_citation_jobs,
+              'citations_writer': bench_citations_writer,
+              'crossref_writer': bench_crossref_writer,
+              'mathml_cache': bench_mathml_cache,
+              'read_meta': bench_read_meta,
+              'worker_latency': bench_worker_latency}
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Benchmarks for meta.py')
+    argparser.add_argument('--repeat',
+                           type=int,
+                           default=20,
+                           help='number of iterations for each variant')
+    argparser.add_argument('--baseline',
+                           default=BASELINE,
+                           help='git revision of meta.py to compare with in read_meta')
+    argparser.add_argument('names',
+                           nargs='*',
+                           help='benchmarks to run from {} (default: all)'.format(', '.join(sorted(BENCHMARKS))))
+    args = argparser.parse_args()
+    BASELINE = args.baseline
+    for name in args.names:
+        if name not in BENCHMARKS:
+            argparser.error('unknown benchmark ' + name)
+    for name in args.names or sorted(BENCHMARKS):
+        print(name)
+        for variant, value, unit in BENCHMARKS[name](args.repeat):
+            print('  {:<40} {:10.1f} {}'.format(variant, value, unit))
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""
+Write one crossref deposit for a whole issue, with a journal_issue and a
+journal_article for each paper, from the .meta files of the papers. The DOIs of the
+papers are given in a JSON file that maps the path of each .meta file, relative to
+the JSON file, to its DOI. The articles are in the order of the JSON file:
+
+  {"paper1/main.meta": "10.46586/tches.v2024.i1.1-22",
+   "paper2/main.meta": "10.46586/tches.v2024.i1.23-50"}
+
+  python crossref_issue.py --dois issue.json --journal tches --volume 2024 --issue 1 --crossref issue.xml
+
+The papers are converted by a pool of processes, and each journal_article is written
+to the file as soon as the ones before it are done, so that the memory that is used
+does not depend on the number of papers.
+"""
+
+import argparse
+import functools
+import io
+import json
+import os
+from pathlib import Path
+import sys
+from xml.etree import ElementTree as ET
+try:
+    from . import meta
+except ImportError: # run as a script.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from iacrcc.tools import meta
+
+def read_dois(doi_path):
+    """Return a list of (path, doi) from the JSON file doi_path."""
+    doi_path = Path(doi_path)
+    dois = json.loads(doi_path.read_text(encoding='utf-8'))
+    if not isinstance(dois, dict) or not dois:
+        raise ValueError('{} should map .meta files to DOIs'.format(doi_path))
+    return [(str(doi_path.parent / path), doi) for path, doi in dois.items()]
+
+def _article_xml(article, journal_name='cic'):
+    path, doi = article
+    try:
+        return meta.journal_article_xml(meta.read_meta(Path(path)), doi, journal_name=journal_name)
+    except Exception as e:
+        raise ValueError('{}: {}'.format(path, e)) from e
+
+def _use_mathml_cache(cache_dir):
+    meta.mathml.cache_dir = Path(cache_dir)
+
+def _issue_skeleton(journal_name, volume, issue, crossref_batch_id):
+    """Return the text of the deposit before and after the journal_article elements."""
+    root, body = meta.build_doi_batch(crossref_batch_id)
+    journal = ET.SubElement(body, 'journal')
+    meta.add_journal_metadata(journal, journal_name)
+    journal_issue = ET.SubElement(journal, 'journal_issue')
+    meta._add_publication_date(journal_issue)
+    if volume:
+        ET.SubElement(ET.SubElement(journal_issue, 'journal_volume'), 'volume').text = volume
+    if issue:
+        ET.SubElement(journal_issue, 'issue').text = issue
+    journal.append(ET.Comment('articles'))
+    f = io.StringIO()
+    meta.write_xml(root, f)
+    return f.getvalue().split('<!--articles-->')
+
+def write_issue(f, articles, journal_name='cic', volume=None, issue=None,
+                crossref_batch_id=None, jobs=None, mathml_cache=None):
+    """Write the crossref deposit for an issue to the text file f.
+    args:
+       articles: a list of (path, doi) for the .meta files, as from read_dois.
+       journal_name: a key of meta.JOURNALS.
+       volume, issue: the volume and issue number for journal_issue.
+       crossref_batch_id: as for meta.py.
+       jobs: number of processes. The default is one per CPU, and jobs=1 converts
+             the papers in the calling process.
+       mathml_cache: optional directory for meta.mathml, which is shared by the
+             processes.
+    """
+    before, after = _issue_skeleton(journal_name, volume, issue, crossref_batch_id)
+    f.write(before)
+    jobs = jobs or min(len(articles), os.cpu_count() or 1)
+    initializer = _use_mathml_cache if mathml_cache else None
+    articles_xml = meta.bounded_map(functools.partial(_article_xml, journal_name=journal_name),
+                                    articles, jobs, initializer, (mathml_cache,))
+    for i, article in enumerate(articles_xml):
+        if i:
+            f.write('\n' + '   ' * 3)
+        f.write(article)
+    f.write(after)
+
+def main():
+    argparser = argparse.ArgumentParser(description='Write a crossref deposit for an issue')
+    argparser.add_argument('--dois',
+                           required=True,
+                           help='JSON file mapping .meta files to DOIs')
+    argparser.add_argument('--crossref',
+                           required=True,
+                           help='Filename to export crossref deposit XML file')
+    argparser.add_argument('--journal',
+                           default='cic',
+                           choices=sorted(meta.JOURNALS),
+                           help='journal of the issue')
+    argparser.add_argument('--volume',
+                           help='volume of the issue')
+    argparser.add_argument('--issue',
+                           help='number of the issue')
+    argparser.add_argument('--crossref_batch_id',
+                           help='Optional crossref batch_id')
+    argparser.add_argument('--mathml_cache',
+                           help='Optional directory to cache the mathml for titles')
+    argparser.add_argument('--jobs',
+                           type=int,
+                           help='number of worker processes (default: one per CPU)')
+    args = argparser.parse_args()
+    articles = read_dois(args.dois)
+    for path, doi in articles:
+        if not Path(path).is_file():
+            print('missing file ' + path)
+            sys.exit(meta.ExitCodes.MISSING_ARGS.value)
+    # Write to a temporary file so that a failure does not leave half a deposit.
+    tmp_path = args.crossref + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            write_issue(f, articles, args.journal, args.volume, args.issue,
+                        args.crossref_batch_id, args.jobs, args.mathml_cache)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    os.replace(tmp_path, args.crossref)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Caches for converting TeX math fragments to MathML with latex2mathml. Titles use
+the same few fragments over and over, like $\\mathbb{F}_p$ or $O(\\log n)$, and
+each conversion takes about a millisecond. MathmlCache keeps recent conversions
+in memory, and optionally in a directory so that they are kept between runs.
+Files in the directory are named by a hash of the fragment and the version of
+latex2mathml, so a new version of latex2mathml does not reuse old conversions,
+and the directory can be shared by several processes.
+"""
+
+from collections import namedtuple
+import functools
+import hashlib
+import os
+from pathlib import Path
+
+class CacheStats(namedtuple('CacheStats', ['hits', 'disk_hits', 'misses', 'size'])):
+    """Statistics of a MathmlCache. hits are conversions found in memory, disk_hits
+       those found in the directory, misses those converted by latex2mathml, and size
+       is the number of conversions in memory."""
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """Fraction of conversions that were found in memory or in the directory."""
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+@functools.cache
+def latex2mathml_version():
+    """Return the installed version of latex2mathml, which is part of the cache keys."""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version('latex2mathml')
+    except PackageNotFoundError:
+        import latex2mathml
+        return getattr(latex2mathml, '__version__', 'unknown')
+
+class MathmlCache:
+    """Convert math fragments to MathML, caching the results.
+    args:
+       maxsize: number of conversions to keep in memory.
+       cache_dir: optional directory for the conversions. It is created if needed.
+    """
+    def __init__(self, maxsize=4096, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._disk_hits = 0
+        self._misses = 0
+        self._convert = functools.lru_cache(maxsize=maxsize)(self._convert_uncached)
+
+    def _path(self, latex):
+        key = '{}\0{}'.format(latex2mathml_version(), latex).encode('utf-8')
+        digest = hashlib.sha256(key).hexdigest()
+        return self.cache_dir / digest[:2] / digest[2:]
+
+    def _convert_uncached(self, latex):
+        if self.cache_dir is not None:
+            path = self._path(latex)
+            try:
+                mathml = path.read_text(encoding='utf-8')
+                self._disk_hits += 1
+                return mathml
+            except FileNotFoundError:
+                pass
+        import latex2mathml.converter # slow to import, and only needed for math.
+        mathml = latex2mathml.converter.convert(latex)
+        self._misses += 1
+        if self.cache_dir is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write and rename, so that other processes never read a partial file.
+            tmp_path = path.with_name('{}.{}.tmp'.format(path.name, os.getpid()))
+            tmp_path.write_text(mathml, encoding='utf-8')
+            os.replace(tmp_path, path)
+        return mathml
+
+    def convert(self, latex):
+        """Return the MathML for the TeX math fragment latex, without delimiters."""
+        return self._convert(latex)
+
+    def stats(self):
+        """Return the CacheStats since the cache was created or cleared."""
+        info = self._convert.cache_info()
+        return CacheStats(info.hits, self._disk_hits, self._misses, info.currsize)
+
+    def clear(self):
+        """Empty the cache in memory and reset the statistics. The directory is kept."""
+        self._convert.cache_clear()
+        self._disk_hits = 0
+        self._misses = 0
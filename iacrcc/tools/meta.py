@@ -12,18 +12,26 @@ TODO: generate tests for this binary.
 """
 
 import argparse
+from collections import deque
 import datetime
+import functools
 from enum import IntEnum
+import io
 from pathlib import Path
-import pypandoc
 import json
 import re
 import sys
 from pylatexenc.latex2text import LatexNodes2Text
-from nameparser import HumanName
 from xml.etree import ElementTree as ET
-from xml.dom import minidom
-import latex2mathml.converter
+try:
+    from ..parser.meta_parse import CachedDecoder, iter_meta_records, split_name
+    from .mathml_cache import MathmlCache
+    from .abstracts import AbstractConverter
+except ImportError: # run as a script.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from iacrcc.parser.meta_parse import CachedDecoder, iter_meta_records, split_name
+    from iacrcc.tools.mathml_cache import MathmlCache
+    from iacrcc.tools.abstracts import AbstractConverter
 
 class ExitCodes(IntEnum):
     MISSING_ARGS = 1
@@ -32,21 +40,79 @@ class ExitCodes(IntEnum):
     MISSING_ABSTRACT = 3
     
 # This is used to decode lines with TeX character macros like \'e.
-decoder = LatexNodes2Text()
-
-def _pretty_print_xml(root):
-    """Pretty-print an ElementTree root."""
-    return minidom.parseString(ET.tostring(root, encoding='unicode', xml_declaration=True)).toprettyxml(indent = "   ")
-
-def get_key_val(line):
-    """If line has form key: value, then return key, value."""
-    colon = line.find(':')
-    if colon < 0:
-        raise Exception('Exception: missing colon: {}'.format(line))
-    key = line[:colon].strip()
-    val = line[colon+1:].strip()
-    return key, val
-    
+decoder = CachedDecoder(LatexNodes2Text())
+# This converts inline math in titles to mathml. main() adds a directory with --mathml_cache.
+mathml = MathmlCache()
+# This converts abstracts to JATS with pandoc, and remembers them.
+abstract_converter = AbstractConverter()
+
+def _indent_xml(elem, level=0, space='   '):
+    """Indent elem in place like ET.indent. Elements with mixed content, like titles
+       with mathematics, are left as they are since their whitespace is part of the text."""
+    if elem.text and elem.text.strip() or any(child.tail and child.tail.strip() for child in elem):
+        return
+    if len(elem):
+        elem.text = '\n' + space * (level + 1)
+        for child in elem:
+            _indent_xml(child, level + 1, space)
+            child.tail = '\n' + space * (level + 1)
+        child.tail = '\n' + space * level
+
+def write_xml(root, f):
+    """Write root to the text file f with an XML declaration, indented. This writes
+       the elements to f as they are serialized, without building the whole document
+       as a string. root is indented in place."""
+    _indent_xml(root)
+    f.write('<?xml version="1.0" ?>\n')
+    ET.ElementTree(root).write(f, encoding='unicode')
+    f.write('\n')
+
+# This splits titles into parts by the delimiters of inline math $, \(, and \).
+_MATH_DELIMS = re.compile(r'([\\][()]|[$])')
+
+class Title:
+    """A title from read_meta with text and inline math in TeX. It is split and decoded
+       once, however many outputs use it, and each form is only computed when an
+       output first asks for it.
+
+       The conversion is tricky, because title may contain inline mathematics but it
+       may also contain TeX control characters in text mode. We split the string into
+       math and text pieces using a regular expression. Then we use latex2mathml to
+       convert the inline math and pylatexenc to convert the text fragments.
+    """
+    def __init__(self, tex):
+        self.tex = tex
+
+    @functools.cached_property
+    def segments(self):
+        """Tuple of (math, value) for the pieces of the title between the delimiters.
+           value is the raw TeX if math is True, and the decoded text otherwise."""
+        segments = []
+        inmath = False
+        for part in _MATH_DELIMS.split(self.tex):
+            if part in ('$', '\\(', '\\)'):
+                inmath = not inmath
+            elif inmath:
+                segments.append((True, part))
+            else:
+                segments.append((False, decoder.latex_to_text(part)))
+        return tuple(segments)
+
+    @functools.cached_property
+    def jats(self):
+        """The content of a JATS title, with the raw TeX of math in <tex-math>.
+        TODO: switch to mathml, since latex needs to be inside CDATA and
+        ElementTree does not support CDATA.
+        """
+        return ''.join('<tex-math>' + value + '</tex-math>' if math else value
+                       for math, value in self.segments)
+
+    @functools.cached_property
+    def crossref(self):
+        """The content of a crossref title, with mathml for the math. The mathml is
+           cached by the mathml MathmlCache."""
+        return ''.join(mathml.convert(value) if math else value
+                       for math, value in self.segments)
 
 def title_to_jats(node, title):
     """Attach article-title to element-citation node in JATS format. This is
@@ -54,31 +120,11 @@ def title_to_jats(node, title):
 
       Parameters:
         node: an xml.etree.ElementTree Element to attach 'article-title' element.
-        title: the string with mixed TeX content with text and inline math.
+        title: a Title.
 
     TODO: switch XMP to use mathml (and add namespace for it).
     """
-    delims = ['$', '\\(', '\\)']
-    # This splits the string into parts by the delimiters $, \(, and \)
-    parts = re.split(r'([\\][()]|[$])',title)
-    inmath = False
-    encoded = '<article-title>'
-    for i in range(len(parts)):
-        if parts[i] in delims:
-            inmath = not inmath
-        else:
-            if inmath:
-                # for math, just the raw TeX.
-                # TODO: switch to mathml, since latex needs to be inside CDATA and
-                # ElementTree does not support CDATA.
-                #
-                encoded += '<tex-math>' + parts[i] + '</tex-math>'
-            else:
-                # for non-math, just character codes
-                encoded += decoder.latex_to_text(parts[i])
-    encoded += '</article-title>'
-    tnode = ET.fromstring(encoded)
-    node.append(tnode)
+    node.append(ET.fromstring('<article-title>' + title.jats + '</article-title>'))
 
 def title_to_utf8(title):
     """Very simple conversion of title to UTF-8. This doesn't handle superscripts and
@@ -89,35 +135,13 @@ def title_to_crossref(elem_name, title):
     """Convert titles to an Element with mathml for inline math. This is used for
     crossref format.
 
-    The conversion is tricky, because title may contain inline mathematics but it
-    may also contain TeX control characters in text mode. We split the string into
-    math and text pieces using a regular expression. Then we use latex2mathml to convert
-    the inline math and pylatenxnc to convert the text fragments.
-
     Parameters:
       elem_name: name for the root node
-      title: LaTeX string for title.
+      title: a Title.
     Returns:
       string representation of xml for crossref, containing mathml.
-    TODO: develop some tests for this
     """
-    delims = ['$', '\\(', '\\)']
-    # This splits the string into parts by the delimiters $, \(, and \)
-    parts = re.split(r'([\\][()]|[$])',title)
-    encoded = ''
-    inmath = False
-    for i in range(len(parts)):
-        if parts[i] in delims:
-            inmath = not inmath
-        else:
-            if inmath:
-                # for math
-                encoded += latex2mathml.converter.convert(parts[i])
-            else:
-                # for non-math, just character codes
-                encoded += decoder.latex_to_text(parts[i])
-    encoded = '<{}>{}</{}>'.format(elem_name, encoded, elem_name)
-    return encoded
+    return '<{}>{}</{}>'.format(elem_name, title.crossref, elem_name)
 
 def _add_jats_ref(citation, reflist):
     """Used for adding a ref node in JATS format for citations."""
@@ -126,25 +150,29 @@ def _add_jats_ref(citation, reflist):
                               attrib={'publication-type': citation['type']})
     return cite_node
 
-def add_jats_persons(cite_node, persons):
+def add_jats_persons(cite_node, persons, tex=False):
     """Either add editors or authors as <person> nodes.
 
        Parameters:
          cite_node: an xml.etree.ElementTree.Element to attach <person> nodes.
          persons: an array of person dicts with 'name' in them.
+         tex: if True, the names are TeX, as in the authorlist from read_meta.
        Returns:
          nothing, but cite_node is appended to.
     """
     for person in persons:
+        if tex:
+            person = _decode_person(person)
         person_node = ET.SubElement(cite_node, 'person')
-        humanname = HumanName(person['name'])
+        # This is cached, and skips HumanName when the bst supplied the surname.
+        humanname = split_name(person['name'], person.get('surname'))
         given = ''
-        if humanname.first:
+        if humanname and humanname.first:
             given = humanname.first
             if humanname.middle:
                 given += ' ' + humanname.middle
             ET.SubElement(person_node, 'given-names').text = given
-        if humanname.last:
+        if humanname and humanname.last:
             ET.SubElement(person_node, 'surname').text = humanname.last
         else:
             ET.SubElement(person_node, 'surname').text = person['name']
@@ -163,9 +191,9 @@ def add_jats_article(citation, reflist):
     """
     if 'title' in citation and 'journal' in citation and citation['authorlist']:
         cite_node = _add_jats_ref(citation, reflist)
-        title_to_jats(cite_node, citation['title'])
+        title_to_jats(cite_node, Title(citation['title']))
         ET.SubElement(cite_node, 'source').text = citation['journal']
-        add_jats_persons(cite_node, citation['authorlist'])
+        add_jats_persons(cite_node, citation['authorlist'], tex=True)
         if 'year' in citation:
             ET.SubElement(cite_node, 'year').text = citation['year']
         if 'month' in citation:
@@ -199,7 +227,7 @@ def add_jats_book(citation, reflist):
         if 'address' in citation:
             ET.SubElement(cite_node, 'publisher-loc').text = citation['address']
         if citation['authorlist']:
-            add_jats_persons(cite_node, citation['authorlist'])
+            add_jats_persons(cite_node, citation['authorlist'], tex=True)
         else:
             add_jats_persons(cite_node, citation['editors'])
         if 'month' in citation:
@@ -217,9 +245,9 @@ def add_jats_inproceedings(citation, reflist):
     if 'title' in citation and 'booktitle' in citation and citation['authorlist']:
         cite_node = _add_jats_ref(citation, reflist)
         #nodes = ET.fromstring(latex2mathml.converter.convert(citation['title']))
-        title_to_jats(cite_node, citation['title'])
+        title_to_jats(cite_node, Title(citation['title']))
         ET.SubElement(cite_node, 'source').text = citation['booktitle']
-        add_jats_persons(cite_node, citation['authorlist'])
+        add_jats_persons(cite_node, citation['authorlist'], tex=True)
         if 'year' in citation:
             ET.SubElement(cite_node, 'year').text = citation['year']
         if 'month' in citation:
@@ -241,7 +269,7 @@ def add_jats_generic(citation, reflist):
     elif 'booktitle' in citation:
         ET.SubElement(cite_node, 'source').text = citation['booktitle']
     if citation['authorlist']:
-        add_jats_persons(cite_node, citation['authorlist'])
+        add_jats_persons(cite_node, citation['authorlist'], tex=True)
     elif 'editors' in citation:
         add_jats_persons(cite_node, citation['editors'])
     if 'year' in citation:
@@ -280,15 +308,100 @@ def add_jats_generic(citation, reflist):
         ET.SubElement(cite_node, 'fpage').text = parts[0]
          
 
+def bounded_map(func, items, jobs, initializer=None, initargs=()):
+    """Like Executor.map, but only submit 2 * jobs items ahead of the one that is
+       yielded, so that results do not pile up when the consumer is slower.
+       initializer(*initargs) is called in each process before func."""
+    if jobs == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(func, items)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as executor:
+        pending = deque()
+        for item in items:
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
+
 def _crossref_batch_info():
     """Return batch_id, timestamp for crossref deposit format."""
     now = datetime.datetime.now(datetime.timezone.utc)
     return now.strftime('IACRCC:%Y%m%d:%H%M%S'), now.strftime('%Y%m%d%H%M%S')
 
 
+def _meta_author(author):
+    """Return an author from parse_meta in the form that meta.py has always used."""
+    data = {'name': author['name']}
+    if 'familyName' in author:
+        data['surname'] = author['familyName']
+    if 'given' in author:
+        data['given'] = author['given']
+    if author['affiliations']:
+        data['affiliations'] = ','.join(author['affiliations'])
+    if 'orcid' in author:
+        data['orcid'] = author['orcid']
+    return data
+
+def _decode_person(person):
+    decoded = {'name': decoder.latex_to_text(person['name'])}
+    if 'surname' in person:
+        decoded['surname'] = decoder.latex_to_text(person['surname'])
+    return decoded
+
+class Paper:
+    """The data from read_meta for one paper, with its title and subtitle as Title
+       objects. These are split, decoded and converted to mathml the first time that an
+       output uses them, and kept for the next outputs. data is the dict from read_meta,
+       where the names of the authors of the paper are decoded already.
+
+       The citations are not kept here, so that write_citations can convert a chunk of
+       them at a time and drop it. The outputs decode the names of their authors as
+       they go, and the decoder cache shares them between the outputs."""
+    def __init__(self, data):
+        self.data = data
+
+    @functools.cached_property
+    def title(self):
+        return Title(self.data['title'])
+
+    @functools.cached_property
+    def subtitle(self):
+        """The Title for the subtitle, or None if there is none."""
+        return Title(self.data['subtitle']) if 'subtitle' in self.data else None
+
+def normalize_meta(data):
+    """Return the Paper for data from read_meta. The outputs below take either, and
+       main() passes the same Paper to all of them. If data is already a Paper it is
+       returned."""
+    return data if isinstance(data, Paper) else Paper(data)
+
+def decode_citation(citation):
+    """Return a copy of a citation from read_meta with authors and authorlist decoded,
+       as it is written to JSON. read_meta keeps these as TeX so that each output only
+       decodes the names that it uses. decoder caches the names, so a name is only
+       decoded once however many outputs and citations use it."""
+    decoded = dict(citation, authorlist=[_decode_person(person) for person in citation['authorlist']])
+    if 'authors' in citation:
+        decoded['authors'] = decoder.latex_to_text(citation['authors'])
+    return decoded
+
+def meta_json(data):
+    """Return data from read_meta (or a Paper) as it is written to JSON, with the
+       citations decoded."""
+    data = normalize_meta(data).data
+    return dict(data, citations=[decode_citation(citation) for citation in data['citations']])
+
 def read_meta(metafile):
-    """Read the meta file line by line. When we encounter author: or affiliation: or title: or
-       citation: we know how to process subsequent lines that start with two spaces.
+    """Read the meta file with iter_meta_records from meta_parse, which parses every kind
+       of record. Titles and keywords are kept as TeX, since math in titles is converted
+       to mathml for crossref. The names of the authors of citations are also kept as
+       TeX, and are decoded by the outputs that use them (see decode_citation). As in
+       parse_meta, an invalid email: or orcid: raises ValueError, and affiliations and
+       funders get a countrycode, or an UnknownCountryWarning if the country is not known.
        Returns:
           a dict with authors, affiliations, citations and (optionally) editors
     # TODO: define a JSON schema for this file.
@@ -296,87 +409,17 @@ def read_meta(metafile):
     data = {'authors': [],
             'affiliations': [],
             'citations': []}
-
-    with metafile.open() as f:
-        line = f.readline().rstrip()
-        while line:
-            if line.startswith('author:'):
-                author = {}
-                data['authors'].append(author)
-                line = f.readline().rstrip()
-                while line.startswith('  '): # associated with author
-                    k,v = get_key_val(line)
-                    if k == 'name':
-                        author[k] = v
-                        v = decoder.latex_to_text(v)
-                        parsed = HumanName(v)
-                        if parsed:
-                            author[k] = str(parsed) # canonicalize name
-                            if parsed.last:
-                                author['surname'] = parsed.last
-                            if parsed.first:
-                                author['given'] = parsed.first
-                        else: # surname is required, so guess if the parser fails.
-                            parts = author[k].split()
-                            author['surname'] = parts[-1]
-                    elif k == 'affil':
-                        author['affiliations'] = v
-                    line = f.readline().rstrip()
-            elif line.startswith('affiliation:'):
-                affiliation = {}
-                data['affiliations'].append(affiliation)
-                line = f.readline().rstrip()
-                while line.startswith('  '): # associated with affiliation
-                    k,v = get_key_val(line)
-                    affiliation[k] = decoder.latex_to_text(v)
-                    line = f.readline().rstrip()
-            elif line.startswith('title:'):
-                data['title'] = line[6:].strip()
-                line = f.readline().rstrip()
-                if line.startswith('  '):
-                    k,v = get_key_val(line)
-                    if k == 'subtitle':
-                        data['subtitle'] = v
-                        line = f.readline().rstrip()
-            elif line.startswith('keywords:'):
-                data['keywords'] = line[9:].strip()
-                line = f.readline().rstrip()
-            elif line.startswith('citation:'):
-                parts = line.split()
-                assert(len(parts) == 3)
-                citation = {'type': parts[1].strip(),
-                            'id': parts[2].strip(),
-                            'authorlist': []}
-                data['citations'].append(citation)
-                line = f.readline().rstrip()
-                while line.startswith('  '): # associated with citation:
-                    k,v = get_key_val(line)
-                    if k == 'authors': # Original BibTeX form.
-                        citation['authors'] = decoder.latex_to_text(v)
-                        line = f.readline().rstrip()
-                    elif k == 'author': # separated out by bst
-                        author = {'name': decoder.latex_to_text(v)}
-                        citation['authorlist'].append(author)
-                        line = f.readline().rstrip()
-                        k,v = get_key_val(line)
-                        if k == 'surname':
-                            author['surname'] = decoder.latex_to_text(v)
-                            line = f.readline().rstrip()
-                    elif k == 'editor':
-                        if 'editors' not in citation:
-                            citation['editors'] = []
-                        editor = {'name': v}
-                        citation['editors'].append(editor)
-                        line = f.readline().rstrip()
-                        k,v = get_key_val(line)
-                        if k == 'surname':
-                            editor['surname'] = v
-                            line = f.readline().rstrip()
-                    else:
-                        citation[k] = v
-                        line = f.readline().rstrip()
-            else:
-                raise Exception('unexpected line {}'.format(line))
+    lists = {'affiliation': data['affiliations'],
+             'citation': data['citations']}
+    for record in iter_meta_records(metafile.read_bytes(), decoder, keep_tex=True):
+        if record.kind == 'author':
+            data['authors'].append(_meta_author(record.value))
+        elif record.kind in lists:
+            lists[record.kind].append(record.value)
+        elif record.kind == 'funding':
+            data.setdefault('funders', []).append(record.value)
+        else:
+            data[record.kind] = record.value
     return data
 
 def add_citation_node(citation_list, citation):
@@ -398,7 +441,7 @@ def add_citation_node(citation_list, citation):
             ET.SubElement(cite_node, 'elocation_id').text = citation['url']
         if 'authorlist' in citation:
             # this is dumb. They only take the surname of the first author for matching.
-            ET.SubElement(cite_node, 'author').text = citation['authorlist'][0]['surname']
+            ET.SubElement(cite_node, 'author').text = decoder.latex_to_text(citation['authorlist'][0]['surname'])
         if 'year' in citation:
             # yes, it's called cYear.
             ET.SubElement(cite_node, 'cYear').text = citation['year']
@@ -440,14 +483,26 @@ def add_citation_node(citation_list, citation):
                 ET.SubElement(cite_node, 'article_title').text = citation['title']
                 
 
-def create_crossref(args, data):
-    """Save crossref deposit format. This adheres to schema version 5.3.1
-       See https://data.crossref.org/reports/help/schema_doc/5.3.1/index.html
-       and https://gitlab.com/crossref/schema/-/blob/master/best-practice-examples/journal.article5.3.0.xml
-    """
-    # Note: latex2mathml uses no namespace prefix, so we have to add this.
-    ET.register_namespace('m', 'http://www.w3.org/1998/Math/MathML')
-    ET.register_namespace('jats', 'http://www.ncbi.nlm.nih.gov/JATS1')
+# Metadata of the journals that we deposit for, keyed by the name used for --journal
+# in crossref_issue.py. The DOI of an article is appended to resource_prefix for the
+# URL of its web page.
+JOURNALS = {
+    'cic': {'full_title': 'IACR Communications on Cryptology',
+            'abbrev_title': 'IACR CC',
+            'issn': '1234-5678',
+            'resource_prefix': 'https://cc.iacr.org/'},
+    'tches': {'full_title': 'IACR Transactions on Cryptographic Hardware and Embedded Systems',
+              'abbrev_title': 'TCHES',
+              'issn': '2569-2925',
+              'resource_prefix': 'https://tches.iacr.org/'},
+    'tosc': {'full_title': 'IACR Transactions on Symmetric Cryptology',
+             'abbrev_title': 'ToSC',
+             'issn': '2519-173X',
+             'resource_prefix': 'https://tosc.iacr.org/'},
+}
+
+def build_doi_batch(crossref_batch_id=None):
+    """Return the root of a crossref deposit with its head, and the body element."""
     root = ET.Element('doi_batch', attrib={'xmlns': 'http://www.crossref.org/schema/5.3.1',
                                            'xsi:schemaLocation': 'http://www.crossref.org/schema/5.3.1 https://www.crossref.org/schemas/crossref5.3.1.xsd',
                                            'xmlns:xsi': 'http://www.w3.org/2001/XMLSchema-instance',
@@ -455,8 +510,8 @@ def create_crossref(args, data):
                                            'version': '5.3.1'})
     head = ET.SubElement(root, 'head')
     batch_id, ts = _crossref_batch_info()
-    if args.crossref_batch_id:
-        ET.SubElement(head, 'doi_batch').text = args.crossref_batch_id
+    if crossref_batch_id:
+        ET.SubElement(head, 'doi_batch').text = crossref_batch_id
     else:
         ET.SubElement(head, 'doi_batch_id').text = batch_id
     ET.SubElement(head, 'timestamp').text = ts
@@ -464,29 +519,63 @@ def create_crossref(args, data):
     ET.SubElement(depositor, 'depositor_name').text = 'IACR'
     ET.SubElement(depositor, 'email_address').text = 'crossref@iacr.org'
     ET.SubElement(head, 'registrant').text = 'International Association for Cryptologic Research'
-    body = ET.SubElement(root, 'body')
-    journal = ET.SubElement(body, 'journal')
+    return root, ET.SubElement(root, 'body')
+
+def add_journal_metadata(journal, journal_name='cic'):
+    """Add the journal_metadata element for journal_name from JOURNALS to journal."""
+    info = JOURNALS[journal_name]
     journal_metadata = ET.SubElement(journal, 'journal_metadata',
                                      attrib={'language': 'en',
                                              'reference_distribution_opts': 'any'})
-    ET.SubElement(journal_metadata, 'full_title').text = 'IACR Communications on Cryptology'
-    ET.SubElement(journal_metadata, 'abbrev_title').text = 'IACR CC'
-    ET.SubElement(journal_metadata, 'issn', attrib={'media_type': 'electronic'}).text = '1234-5678'
+    ET.SubElement(journal_metadata, 'full_title').text = info['full_title']
+    ET.SubElement(journal_metadata, 'abbrev_title').text = info['abbrev_title']
+    ET.SubElement(journal_metadata, 'issn', attrib={'media_type': 'electronic'}).text = info['issn']
     archive_locations = ET.SubElement(journal_metadata, 'archive_locations')
     # TODO: should we use Portico, CLOCKSS, DWT, KB, or LOCKSS?
     ET.SubElement(archive_locations, 'archive', attrib={'name': 'Internet Archive'})
+    return journal_metadata
+
+def _add_publication_date(parent):
+    today = datetime.date.today()
+    date_node = ET.SubElement(parent, 'publication_date', attrib={'media_type': 'online'})
+    # Weirdly, it seems to expect these in order month, day, year
+    ET.SubElement(date_node, 'month').text = str(today.month).zfill(2)
+    ET.SubElement(date_node, 'day').text = str(today.day).zfill(2)
+    ET.SubElement(date_node, 'year').text = str(today.year)
+
+def build_crossref(data, doi, crossref_batch_id=None, jobs=1):
+    """Return the root of the crossref deposit for data from read_meta or a Paper. This adheres to
+       schema version 5.3.1
+       See https://data.crossref.org/reports/help/schema_doc/5.3.1/index.html
+       and https://gitlab.com/crossref/schema/-/blob/master/best-practice-examples/journal.article5.3.0.xml
+    """
+    root, body = build_doi_batch(crossref_batch_id)
+    journal = ET.SubElement(body, 'journal')
+    add_journal_metadata(journal)
     # TODO: insert doi_data for journal (not journal_article?)
+    journal.append(build_journal_article(data, doi, jobs))
+    return root
+
+def build_journal_article(data, doi, jobs=1, journal_name='cic'):
+    """Return the journal_article element of the crossref deposit for data from read_meta
+       or a Paper, in the journal journal_name from JOURNALS. With jobs greater than 1,
+       the citations are converted by that many processes."""
+    paper = normalize_meta(data)
+    data = paper.data
+    # Note: latex2mathml uses no namespace prefix, so we have to add this.
+    ET.register_namespace('m', 'http://www.w3.org/1998/Math/MathML')
+    ET.register_namespace('jats', 'http://www.ncbi.nlm.nih.gov/JATS1')
     pub_type = 'bibliographic_record'
     # TODO: once we start reporting abstract, switch to this:
     # pub_type = 'abstract_only' if args.abstract else 'bibliographic_record'
-    journal_article = ET.SubElement(journal, 'journal_article',
-                                    attrib={'language': 'en',
-                                            'publication_type': pub_type,
-                                            'reference_distribution_opts': 'any'})
+    journal_article = ET.Element('journal_article',
+                                 attrib={'language': 'en',
+                                         'publication_type': pub_type,
+                                         'reference_distribution_opts': 'any'})
     titles = ET.SubElement(journal_article, 'titles')
-    titles.append(ET.fromstring(title_to_crossref('title', data['title'])))
-    if 'subtitle' in data:
-        titles.append(ET.fromstring(title_to_crossref('subtitle', data['subtitle'])))
+    titles.append(ET.fromstring(title_to_crossref('title', paper.title)))
+    if paper.subtitle is not None:
+        titles.append(ET.fromstring(title_to_crossref('subtitle', paper.subtitle)))
     contributors = ET.SubElement(journal_article, 'contributors')
     for author in data['authors']:
         # Note: 'first' does not mean what you think it is. You can have multiple 'first'
@@ -522,25 +611,119 @@ def create_crossref(args, data):
     # if 'abstract' in data:
     #        abstract_node = ET.SubElement(journal_article, 'abstract')
     #        ET.SubElement(abstract_node, 'jats:p', attrib={'xml:lang': 'en'}).text = data['abstract']
-    today = datetime.date.today()
-    date_node = ET.SubElement(journal_article, 'publication_date', attrib={'media_type': 'online'})
-    # Weirdly, it seems to expect these in order month, day, year
-    ET.SubElement(date_node, 'month').text = str(today.month).zfill(2)
-    ET.SubElement(date_node, 'day').text = str(today.day).zfill(2)
-    ET.SubElement(date_node, 'year').text = str(today.year)
+    _add_publication_date(journal_article)
 
     # TODO: check mime_type, and make sure we are assigning to an existing web page.
     doi_data = ET.SubElement(journal_article, 'doi_data')
-    ET.SubElement(doi_data, 'doi').text = args.doi
+    ET.SubElement(doi_data, 'doi').text = doi
     ET.SubElement(doi_data, 'resource', attrib={'content_version': 'vor',
-                                                'mime_type': 'text/html'}).text = 'https://cc.iacr.org/' + args.doi
+                                                'mime_type': 'text/html'}).text = JOURNALS[journal_name]['resource_prefix'] + doi
     # Make sure there is at least one citation with a DOI
-    if len([c for c in data['citations'] if 'doi' in c]):
+    citations = [c for c in data['citations'] if 'doi' in c]
+    if len(citations):
         cite_list_node = ET.SubElement(journal_article, 'citation_list')
-        for citation in data['citations']:
-            add_citation_node(cite_list_node, citation)            
-    crossref_path = Path(args.crossref)
-    crossref_path.write_text(_pretty_print_xml(root), encoding='utf-8')
+        for nodes in _map_chunks(_crossref_citations, citations, jobs):
+            cite_list_node.extend(nodes)
+    return journal_article
+
+# Number of citations that build_crossref and write_citations convert at once, and
+# send to each process with jobs.
+CITATIONS_CHUNK = 64
+
+def _map_chunks(func, citations, jobs):
+    """Yield func(chunk) for each chunk of CITATIONS_CHUNK citations in order, using
+       up to jobs processes."""
+    chunks = [citations[i:i + CITATIONS_CHUNK] for i in range(0, len(citations), CITATIONS_CHUNK)]
+    return bounded_map(func, chunks, max(1, min(jobs or 1, len(chunks))))
+
+def _crossref_citations(citations):
+    """Return the list of <citation> elements for crossref for a chunk of citations."""
+    citation_list = ET.Element('citation_list')
+    for citation in citations:
+        add_citation_node(citation_list, citation)
+    return list(citation_list)
+
+def journal_article_xml(data, doi, level=3, journal_name='cic'):
+    """Return the journal_article element for data from read_meta or a Paper as a string, indented
+       for level elements above it. The m namespace is declared on the element if the
+       titles have mathematics."""
+    journal_article = build_journal_article(data, doi, journal_name=journal_name)
+    _indent_xml(journal_article, level)
+    journal_article.tail = None
+    return ET.tostring(journal_article, encoding='unicode')
+
+def crossref_xml(data, doi, crossref_batch_id=None, jobs=1):
+    """Return the crossref deposit XML for data from read_meta or a Paper as a string."""
+    f = io.StringIO()
+    write_xml(build_crossref(data, doi, crossref_batch_id, jobs), f)
+    return f.getvalue()
+
+def create_crossref(args, data):
+    """Save crossref deposit format to args.crossref."""
+    with open(args.crossref, 'w', encoding='utf-8') as f:
+        write_xml(build_crossref(data, args.doi, args.crossref_batch_id, args.jobs), f)
+
+def add_jats_citation(citation, reflist):
+    """Add a <ref> for citation to reflist, with the function for its type."""
+    if citation['type'] == 'article':
+        add_jats_article(citation, reflist)
+    elif citation['type'] == 'book':
+        add_jats_book(citation, reflist)
+    elif citation['type'] == 'inproceedings':
+        add_jats_inproceedings(citation, reflist)
+    else:
+        add_jats_generic(citation, reflist)
+
+def _citations_root():
+    """Return the root of an XMP file for citations, and its empty ref-list."""
+    root = ET.Element('x:xmpmetadata', attrib={'xmlns:x':'adobe:ns:meta/'})
+    root.insert(1, ET.Comment('This contains citations in the JATS 1.2 schema'))
+    rdf = ET.SubElement(root, 'rdf:RDF', attrib={'xmlns': 'http://www.ncbi.nlm.nih.gov/JATS1'})
+    reflist = ET.SubElement(rdf, 'ref-list')
+    reftitle = ET.SubElement(reflist, 'title')
+    reftitle.text = 'Bibliography'
+    return root, reflist
+
+def build_citations(data):
+    """Return the root of an XMP file with the citations of data from read_meta or a
+       Paper in the JATS schema."""
+    root, reflist = _citations_root()
+    for citation in normalize_meta(data).data['citations']:
+        add_jats_citation(citation, reflist)
+    return root
+
+def _citations_xml(citations):
+    """Return the <ref> elements for a chunk of citations as a string."""
+    refs = ET.Element('refs')
+    for citation in citations:
+        add_jats_citation(citation, refs)
+    if not len(refs):
+        return ''
+    # Serializing a chunk costs much less than serializing each <ref> on its own.
+    return ET.tostring(refs, encoding='unicode')[len('<refs>'):-len('</refs>')]
+
+def write_citations(data, f, jobs=1):
+    """Write the XMP file from build_citations to the text file f. The <ref> elements
+       are written CITATIONS_CHUNK at a time and then discarded, so the memory that is
+       used does not grow with the number of citations. With jobs greater than 1, the
+       chunks are converted by that many processes, and written in order."""
+    root, reflist = _citations_root()
+    reflist.append(ET.Comment('refs'))
+    before, after = ET.tostring(root, encoding='unicode').split('<!--refs-->')
+    f.write(before)
+    for xml in _map_chunks(_citations_xml, normalize_meta(data).data['citations'], jobs):
+        f.write(xml)
+    f.write(after)
+
+def citations_xmp(data, jobs=1):
+    """Return the XMP file from build_citations as a string."""
+    f = io.StringIO()
+    write_citations(data, f, jobs)
+    return f.getvalue()
+
+def read_abstract(abstractpath):
+    """Return the abstract extracted from iacrcc.cls, converted to JATS."""
+    return abstract_converter.convert(abstractpath.read_text(encoding='utf-8'))
 
 def main():
     argparser = argparse.ArgumentParser(description='Process metadata from iacrcc')
@@ -560,6 +743,12 @@ def main():
                            help='Filename to export crossref deposit XML file')
     argparser.add_argument('--crossref_batch_id',
                            help='Optional crossref batch_id')
+    argparser.add_argument('--mathml_cache',
+                           help='Optional directory to cache the mathml for titles')
+    argparser.add_argument('--jobs',
+                           type=int,
+                           default=1,
+                           help='number of processes to convert citations for --crossref and --citations')
 
     args = argparser.parse_args()
     if not args.citations and not args.json and not args.crossref:
@@ -574,40 +763,28 @@ def main():
     if not metafile.is_file():
         print('missing file ' + metafile.name)
         sys.exit(EditCodes.MISSING_TITLE.value)
+    if args.mathml_cache:
+        mathml.cache_dir = Path(args.mathml_cache)
     data = read_meta(metafile)
     if args.abstract:
         abstractpath = Path(args.abstract)
         if not abstractpath.is_file():
             print('Missing abstract file {}'.format(args.abstract))
             sys.exit(ExitCodes.MISSING_ABSTRACT.value)
-        data['abstract'] = abstractpath.read_text(encoding='utf-8')
-        data['abstract'] = pypandoc.convert_text(data['abstract'], 'jats', 'latex')
+        data['abstract'] = read_abstract(abstractpath)
 
+    # The outputs share the titles that are decoded by the first one that uses them.
+    paper = normalize_meta(data)
     if args.json:
         jsonfile = Path(args.json)
-        jsonfile.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        jsonfile.write_text(json.dumps(meta_json(paper), indent=2), encoding='utf-8')
     if args.crossref:
-        create_crossref(args, data)
+        create_crossref(args, paper)
         
     if args.citations:
         # This prints an XMP file to the location args.citations.
-        root = ET.Element('x:xmpmetadata', attrib={'xmlns:x':'adobe:ns:meta/'})
-        tree = ET.ElementTree(root)
-        root.insert(1, ET.Comment('This contains citations in the JATS 1.2 schema'))
-        rdf = ET.SubElement(root, 'rdf:RDF', attrib={'xmlns': 'http://www.ncbi.nlm.nih.gov/JATS1'})
-        reflist = ET.SubElement(rdf, 'ref-list')
-        reftitle = ET.SubElement(reflist, 'title')
-        reftitle.text = 'Bibliography'
-        for citation in data['citations']:
-            if citation['type'] == 'article':
-                add_jats_article(citation, reflist)
-            elif citation['type'] == 'book':
-                add_jats_book(citation, reflist)
-            elif citation['type'] == 'inproceedings':
-                add_jats_inproceedings(citation, reflist)
-            else:
-                add_jats_generic(citation, reflist)
-        tree.write(args.citations, encoding='UTF-8', xml_declaration=False)
+        with open(args.citations, 'w', encoding='utf-8', newline='') as f:
+            write_citations(paper, f, args.jobs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,200 @@
+#!/usr/bin/python3
+"""
+A long-running process that answers requests for parse_meta and the outputs of
+meta.py, so that a server does not pay for starting python and building the decoders
+for every paper. Requests and responses are JSON objects, one per line, read from
+stdin and written to stdout, or exchanged over a Unix socket with --socket.
+
+A request has an op and the path of a .meta file in input:
+  {"id": 1, "op": "parse", "input": "main.meta"}
+The ops are
+  parse: the result of meta_parse.parse_meta. text may be given instead of input.
+  json: the JSON that meta.py writes with --json. abstract is optional.
+  crossref: the XML that meta.py writes with --crossref. doi and crossref_batch_id
+            are optional.
+  citations: the XMP that meta.py writes with --citations.
+  shutdown: stop reading requests, and exit after answering the pending ones.
+The response has the same id, and either result or error:
+  {"id": 1, "result": {...}}
+With --jobs greater than 1, requests are answered by a pool of processes, and the
+responses may be written in a different order from the requests.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import signal
+import socketserver
+import sys
+import threading
+try:
+    from ..parser.meta_parse import parse_meta, get_shared_decoder
+    from . import meta
+except ImportError: # run as a script.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from iacrcc.parser.meta_parse import parse_meta, get_shared_decoder
+    from iacrcc.tools import meta
+
+# The default DOI used by meta.py.
+DEFAULT_DOI = '10.1234/12345'
+
+def _read_meta(request):
+    data = meta.read_meta(Path(request['input']))
+    if request.get('abstract'):
+        data['abstract'] = meta.read_abstract(Path(request['abstract']))
+    return data
+
+def _parse(request):
+    if 'text' in request:
+        return parse_meta(request['text'])
+    return parse_meta(Path(request['input']).read_text(encoding='UTF-8'))
+
+def _json(request):
+    return meta.meta_json(_read_meta(request))
+
+def _crossref(request):
+    return meta.crossref_xml(_read_meta(request),
+                             request.get('doi') or DEFAULT_DOI,
+                             request.get('crossref_batch_id'))
+
+def _citations(request):
+    return meta.citations_xmp(meta.read_meta(Path(request['input'])))
+
+OPS = {'parse': _parse,
+       'json': _json,
+       'crossref': _crossref,
+       'citations': _citations}
+
+def handle_request(request):
+    """Return the response for one request. Errors are reported in the response."""
+    response = {'id': request.get('id')}
+    op = request.get('op')
+    if op not in OPS:
+        response['error'] = 'unknown op {}'.format(op)
+        return response
+    try:
+        response['result'] = OPS[op](request)
+    except Exception as e:
+        response['error'] = '{}: {}'.format(type(e).__name__, e)
+    return response
+
+def warm_up():
+    """Build the decoders before the first request arrives."""
+    get_shared_decoder()
+    meta.decoder.latex_to_text(r'\'e')
+
+def _submit(executor, request, write):
+    """Submit request to executor, and write the response when it completes. Returns
+       an Event that is set after the response was written."""
+    written = threading.Event()
+    def done(future):
+        try:
+            response = future.result()
+        except Exception as e: # for example if a worker process died.
+            response = {'id': request.get('id'), 'error': '{}: {}'.format(type(e).__name__, e)}
+        write(response)
+        written.set()
+    executor.submit(handle_request, request).add_done_callback(done)
+    return written
+
+def serve_lines(infile, outfile, executor=None):
+    """Answer the requests in infile, writing one response per line to outfile.
+       Returns at the end of infile or after a shutdown request, once every pending
+       request has been answered.
+    args:
+       infile, outfile: text files.
+       executor: if given, requests are submitted to this concurrent.futures executor
+                 and answered in the order they complete. Otherwise they are
+                 answered in order by the calling thread.
+    Returns:
+       True if a shutdown request was read.
+    """
+    lock = threading.Lock()
+    def write(response):
+        with lock:
+            outfile.write(json.dumps(response) + '\n')
+            outfile.flush()
+    pending = []
+    shutdown = False
+    for line in infile:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('request is not an object')
+        except ValueError as e:
+            write({'id': None, 'error': 'invalid request: {}'.format(e)})
+            continue
+        if request.get('op') == 'shutdown':
+            shutdown = True
+            break
+        if executor is None:
+            write(handle_request(request))
+        else:
+            pending = [written for written in pending if not written.is_set()]
+            pending.append(_submit(executor, request, write))
+    for written in pending:
+        written.wait()
+    if shutdown:
+        write({'id': request.get('id'), 'result': 'shutdown'})
+    return shutdown
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        with self.request.makefile('r', encoding='UTF-8') as infile:
+            with self.request.makefile('w', encoding='UTF-8') as outfile:
+                if serve_lines(infile, outfile, self.server.executor):
+                    threading.Thread(target=self.server.shutdown).start()
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = False # finish answering open connections on shutdown.
+
+def serve_socket(path, executor=None):
+    """Answer requests on a Unix socket at path until a shutdown request or SIGTERM.
+       Each connection is a stream of requests as for serve_lines."""
+    if os.path.exists(path):
+        os.unlink(path)
+    with _Server(path, _Handler) as server:
+        server.executor = executor
+        signal.signal(signal.SIGTERM,
+                      lambda signum, frame: threading.Thread(target=server.shutdown).start())
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(path)
+
+def _raise_exit(signum, frame):
+    raise SystemExit(0)
+
+def main():
+    argparser = argparse.ArgumentParser(description='Answer JSON requests for meta_parse and meta.py')
+    argparser.add_argument('--socket',
+                           help='path of a Unix socket to listen on instead of stdin')
+    argparser.add_argument('--jobs',
+                           type=int,
+                           default=1,
+                           help='number of worker processes (default: 1, in this process)')
+    args = argparser.parse_args()
+    if args.jobs < 1:
+        argparser.error('--jobs must be at least 1')
+    warm_up()
+    executor = None
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=args.jobs, initializer=warm_up)
+    try:
+        if args.socket:
+            serve_socket(args.socket, executor)
+        else:
+            signal.signal(signal.SIGTERM, _raise_exit)
+            serve_lines(sys.stdin, sys.stdout, executor)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+if __name__ == '__main__':
+    main()
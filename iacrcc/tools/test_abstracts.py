@@ -0,0 +1,82 @@
+import pytest
+from .abstracts import AbstractConverter, pandoc_latex_to_jats
+
+def _have_pandoc():
+    try:
+        import pypandoc
+        pypandoc.get_pandoc_version()
+    except (ImportError, OSError):
+        return False
+    return True
+
+def test_abstract_converter(tmp_path):
+    calls = []
+    def fake_pandoc(text):
+        """Convert each paragraph to <p>, like pandoc does for plain text."""
+        calls.append(text)
+        return ''.join('<p>{}</p>\n'.format(par.strip()) for par in text.split('\n\n'))
+    converter = AbstractConverter(batch_size=2, cache_dir=tmp_path, convert=fake_pandoc, version='1')
+    abstracts = ['First.', 'Second.\n\nMore.', r'\newcommand{\F}{F} Third.', 'First.', 'Fourth.']
+    results = converter.convert_many(abstracts)
+    assert [r.jats for r in results] == [fake_pandoc(a) for a in abstracts]
+    assert not any(r.cached for r in results)
+    # One batch with two abstracts, the one with macros, and the last one.
+    assert len(calls) == 3 + len(abstracts)
+    del calls[:]
+    results = converter.convert_many(['First.', 'Fifth.', 'Sixth.'])
+    assert [r.cached for r in results] == [True, False, False]
+    assert calls == ['IACRCCABSTRACTSEPARATOR0\n\nFifth.\n\nIACRCCABSTRACTSEPARATOR1\n\nSixth.']
+    # A batch that does not split is converted one abstract at a time.
+    del calls[:]
+    results = converter.convert_many(['Bad.\n\nIACRCCABSTRACTSEPARATOR5', 'Good.'])
+    assert len(calls) == 3 and results[1].jats == '<p>Good.</p>\n'
+    # The directory is used by a new converter.
+    del calls[:]
+    converter = AbstractConverter(cache_dir=tmp_path, convert=fake_pandoc, version='1')
+    assert all(r.cached for r in converter.convert_many(abstracts))
+    assert not calls
+    # An abstract that is converted on its own is kept in the same form as in a batch.
+    converter = AbstractConverter(convert=lambda text: ' <p>{}</p>'.format(text), version='1')
+    assert converter.convert('Alone.') == '<p>Alone.</p>\n'
+
+def test_abstract_sections():
+    calls = []
+    def fake_pandoc(text):
+        """Like pandoc, put the paragraphs after a \\section in a <sec>."""
+        calls.append(text)
+        jats = ''
+        sec = False
+        for par in text.split('\n\n'):
+            if par.startswith('\\section'):
+                jats += '</sec>\n' if sec else ''
+                jats += '<sec>\n<title>{}</title>\n'.format(par[len('\\section{'):-1])
+                sec = True
+            else:
+                jats += '<p>{}</p>\n'.format(par.strip())
+        return jats + ('</sec>\n' if sec else '')
+    abstracts = ['\\section{Intro}\n\nFirst.', 'Second.']
+    results = AbstractConverter(batch_size=2, convert=fake_pandoc, version='1').convert_many(abstracts)
+    # The separator of Second. is inside the <sec>, so the batch is converted one abstract at a time.
+    assert len(calls) == 3
+    assert [r.jats for r in results] == [fake_pandoc(a) for a in abstracts]
+
+@pytest.mark.skipif(not _have_pandoc(), reason='needs pandoc')
+def test_abstracts_with_pandoc():
+    calls = []
+    def pandoc(text):
+        calls.append(text)
+        return pandoc_latex_to_jats(text)
+    abstracts = ['We show that $x^2$ is \\emph{hard}.', 'First.\n\nSecond.',
+                 '\\section{Intro}\n\nWith a section.']
+    one_by_one = AbstractConverter(batch_size=1, convert=pandoc, version='1').convert_many(abstracts)
+    assert len(calls) == len(abstracts)
+    # The section is last, so its <sec> does not take in another abstract.
+    del calls[:]
+    batched = AbstractConverter(batch_size=3, convert=pandoc, version='1').convert_many(abstracts)
+    assert len(calls) == 1
+    assert [r.jats for r in batched] == [r.jats for r in one_by_one]
+    # With the section first, the batch is converted one abstract at a time.
+    del calls[:]
+    batched = AbstractConverter(batch_size=3, convert=pandoc, version='1').convert_many(abstracts[::-1])
+    assert len(calls) == 1 + len(abstracts)
+    assert [r.jats for r in batched] == [r.jats for r in one_by_one][::-1]
@@ -0,0 +1,36 @@
+import io
+import json
+from pathlib import Path
+import re
+from xml.etree import ElementTree as ET
+import pytest
+from . import crossref_issue
+
+TESTDATA = Path(__file__).parent / 'testdata'
+METAFILE = str(TESTDATA / 'test1.meta')
+
+def test_crossref_issue(tmp_path):
+    dois = tmp_path / 'issue.json'
+    dois.write_text(json.dumps({METAFILE: '10.1/a', str(TESTDATA) + '/../testdata/test1.meta': '10.1/b', 'test1.meta': '10.1/c'}))
+    articles = crossref_issue.read_dois(dois)
+    assert articles[2] == (str(tmp_path / 'test1.meta'), '10.1/c')
+    articles[2] = (METAFILE, '10.1/c')
+    outputs = []
+    for jobs in (1, 2):
+        f = io.StringIO()
+        crossref_issue.write_issue(f, articles, 'tosc', '2024', '3', 'b1', jobs=jobs)
+        outputs.append(f.getvalue())
+    # The timestamps may differ by a second.
+    assert re.sub('<timestamp>.*</timestamp>', '', outputs[0]) == re.sub('<timestamp>.*</timestamp>', '', outputs[1])
+    ns = {'c': 'http://www.crossref.org/schema/5.3.1'}
+    journal = ET.fromstring(outputs[0]).find('c:body/c:journal', ns)
+    assert journal.find('c:journal_metadata/c:abbrev_title', ns).text == 'ToSC'
+    assert journal.find('c:journal_issue/c:journal_volume/c:volume', ns).text == '2024'
+    assert [a.find('c:doi_data/c:doi', ns).text for a in journal.findall('c:journal_article', ns)] == ['10.1/a', '10.1/b', '10.1/c']
+    # The articles are registered at the web site of the journal of the issue.
+    assert [a.find('c:doi_data/c:resource', ns).text for a in journal.findall('c:journal_article', ns)] == [
+        'https://tosc.iacr.org/10.1/a', 'https://tosc.iacr.org/10.1/b', 'https://tosc.iacr.org/10.1/c']
+    bad = tmp_path / 'bad.meta'
+    bad.write_text('title: A title\nreference: misc AES\n')
+    with pytest.raises(ValueError, match='bad.meta: unexpected line reference: misc AES'):
+        crossref_issue.write_issue(io.StringIO(), [(str(bad), '10.1/d')], jobs=1)
@@ -0,0 +1,16 @@
+import latex2mathml.converter
+from .mathml_cache import MathmlCache
+
+def test_mathml_cache(tmp_path):
+    cache = MathmlCache(maxsize=2, cache_dir=tmp_path)
+    fragments = ['x^2', r'\mathbb{F}_p', 'x^2', 'O(n)', 'x^2']
+    converted = [cache.convert(latex) for latex in fragments]
+    assert converted[0] == converted[2] == converted[4] == latex2mathml.converter.convert('x^2')
+    assert cache.stats() == (2, 0, 3, 2)
+    assert cache.stats().hit_rate == 0.4
+    # After clearing the memory, conversions are read from the directory.
+    cache.clear()
+    assert [cache.convert(latex) for latex in fragments] == converted
+    assert cache.stats() == (2, 3, 0, 2)
+    assert cache.stats().hit_rate == 1.0
+    assert len(list(tmp_path.glob('*/*'))) == 3
@@ -0,0 +1,96 @@
+from pathlib import Path
+import pytest
+import re
+import tracemalloc
+from xml.etree import ElementTree as ET
+from . import meta
+from ..parser.meta_parse import UnknownCountryWarning
+
+TESTDATA = Path(__file__).parent / 'testdata'
+METAFILE = str(TESTDATA / 'test1.meta')
+
+def test_crossref_xml():
+    xml = meta.crossref_xml(meta.read_meta(Path(METAFILE)), '10.1/2')
+    assert xml.startswith('<?xml version="1.0" ?>\n<doi_batch ')
+    assert '\n            <doi_data>\n               <doi>10.1/2</doi>\n' in xml
+    # Whitespace in titles with mathematics is part of the title.
+    assert '<title>Thoughts about "binary" functions on <m:math display="inline"><m:mrow>' in xml
+    assert '</m:math> running time</title>' in xml
+
+def test_read_meta_checks(tmp_path):
+    # read_meta checks the records as parse_meta does, which meta.py did not do before.
+    path = tmp_path / 'main.meta'
+    path.write_text('title: T\naffiliation:\n  name: A\n  country: Freedonia\n'
+                    'affiliation:\n  name: B\n  country: Germany\n', encoding='utf-8')
+    with pytest.warns(UnknownCountryWarning, match='line 2: unknown country Freedonia'):
+        data = meta.read_meta(path)
+    assert [aff.get('countrycode') for aff in data['affiliations']] == [None, 'DE']
+    for line in ['  email: nobody', '  orcid: 0000-0000-0000-0000']:
+        path.write_text('title: T\nauthor:\n  name: Alice Smith\n' + line + '\n', encoding='utf-8')
+        with pytest.raises(ValueError):
+            meta.read_meta(path)
+
+def test_lazy_citation_names():
+    data = meta.read_meta(Path(METAFILE))
+    citation = data['citations'][2]
+    assert citation['authorlist'] == [{'name': 'Rainer B{\\"o}hme', 'surname': 'B{\\"o}hme'}]
+    decoded = meta.decode_citation(citation)
+    assert decoded['authorlist'] == [{'name': 'Rainer Böhme', 'surname': 'Böhme'}]
+    assert decoded['authors'] == 'Rainer Böhme'
+    assert list(decoded) == list(citation)
+    assert meta.meta_json(data)['citations'][2] == decoded
+    assert '<author>Böhme</author>' in meta.crossref_xml(data, '10.1/2')
+    assert '<surname>Böhme</surname>' in meta.citations_xmp(data)
+
+def test_citations_xmp():
+    data = meta.read_meta(Path(METAFILE))
+    xmp = meta.citations_xmp(data)
+    assert xmp == ET.tostring(meta.build_citations(data), encoding='unicode')
+    assert xmp.count('<ref id=') == len(data['citations'])
+    assert meta.citations_xmp({'citations': []}).endswith('<title>Bibliography</title></ref-list></rdf:RDF></x:xmpmetadata>')
+
+def test_citation_jobs(monkeypatch):
+    data = meta.read_meta(Path(METAFILE))
+    monkeypatch.setattr(meta, 'CITATIONS_CHUNK', 2)
+    assert meta.citations_xmp(data, jobs=3) == meta.citations_xmp(data)
+    def crossref(jobs):
+        return re.sub('<timestamp>.*</timestamp>', '', meta.crossref_xml(data, '10.1/2', 'b', jobs=jobs))
+    assert crossref(3) == crossref(1)
+
+def test_normalize_meta():
+    data = meta.read_meta(Path(METAFILE))
+    paper = meta.normalize_meta(data)
+    assert meta.normalize_meta(paper) is paper
+    def outputs(data):
+        return [meta.meta_json(data),
+                re.sub('<timestamp>.*</timestamp>', '', meta.crossref_xml(data, '10.1/2', 'b')),
+                meta.citations_xmp(data)]
+    expected = outputs(data)
+    assert outputs(paper) == expected
+    # The title is decoded once, and the names are found in the decoder cache.
+    title = paper.title
+    misses = meta.decoder.cache_info().misses
+    assert outputs(paper) == expected
+    assert meta.decoder.cache_info().misses == misses
+    assert paper.title is title
+    title = meta.Title(r'Sch{\"o}n $\mathbb{F}_p$ \(x\)')
+    assert title.segments == ((False, 'Schön '), (True, r'\mathbb{F}_p'), (False, ' '), (True, 'x'), (False, ''))
+    assert title.jats == r'Schön <tex-math>\mathbb{F}_p</tex-math> <tex-math>x</tex-math>'
+    assert title.crossref.startswith('Schön <math')
+
+def test_write_citations_memory():
+    citations = meta.read_meta(Path(METAFILE))['citations']
+    class Discard:
+        def write(self, text):
+            pass
+    def peak(count):
+        data = {'citations': [dict(citations[i % len(citations)], id='ref{}'.format(i)) for i in range(count)]}
+        meta.write_citations(data, Discard()) # fill the caches.
+        tracemalloc.start()
+        try:
+            meta.write_citations(data, Discard())
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    # The citations are written a chunk at a time, so the memory does not grow with their number.
+    assert peak(20 * meta.CITATIONS_CHUNK) < 1.5 * peak(2 * meta.CITATIONS_CHUNK)
@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+from pathlib import Path
+from . import meta
+from .meta_worker import handle_request, serve_lines
+from ..parser.meta_parse import parse_meta
+
+TESTDATA = Path(__file__).parent / 'testdata'
+METAFILE = str(TESTDATA / 'test1.meta')
+METADOC = Path(__file__).parent.parent / 'parser' / 'testdata' / 'metadoc.meta'
+
+def test_handle_request():
+    metastr = METADOC.read_text(encoding='UTF-8')
+    assert handle_request({'id': 1, 'op': 'parse', 'text': metastr}) == {'id': 1, 'result': parse_meta(metastr)}
+    assert handle_request({'id': 2, 'op': 'parse', 'input': str(METADOC)})['result'] == parse_meta(metastr)
+    data = meta.read_meta(Path(METAFILE))
+    assert handle_request({'id': 3, 'op': 'json', 'input': METAFILE})['result'] == meta.meta_json(data)
+    assert handle_request({'op': 'citations', 'input': METAFILE})['result'] == meta.citations_xmp(data)
+    xml = handle_request({'op': 'crossref', 'input': METAFILE, 'doi': '10.1/2'})['result']
+    assert '<doi>10.1/2</doi>' in xml
+    assert handle_request({'id': 4, 'op': 'bogus'}) == {'id': 4, 'error': 'unknown op bogus'}
+    assert handle_request({'id': 5, 'op': 'parse', 'input': 'missing.meta'})['error'].startswith('FileNotFoundError')
+
+def _serve(lines, executor=None):
+    outfile = io.StringIO()
+    shutdown = serve_lines(io.StringIO(''.join(line + '\n' for line in lines)), outfile, executor)
+    return shutdown, [json.loads(line) for line in outfile.getvalue().splitlines()]
+
+def test_serve_lines():
+    requests = [json.dumps({'id': i, 'op': 'parse', 'input': str(METADOC)}) for i in range(5)]
+    shutdown, responses = _serve(requests + ['', 'not json', '[1]'])
+    assert not shutdown
+    assert [r['id'] for r in responses] == [0, 1, 2, 3, 4, None, None]
+    assert 'result' in responses[0]
+    assert responses[5]['error'].startswith('invalid request')
+    # Requests after shutdown are not answered, but earlier ones are.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        shutdown, responses = _serve(requests + ['{"id": "s", "op": "shutdown"}'] + requests, executor)
+    assert shutdown
+    assert sorted(r['id'] for r in responses[:-1]) == list(range(5))
+    assert responses[-1] == {'id': 's', 'result': 'shutdown'}